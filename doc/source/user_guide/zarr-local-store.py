@@ -0,0 +1,18 @@
+import pyTMD
+import xarray as xr
+
+# set tide model and local zarr store
+tide_model = "TPXO9-atlas-v5-nc"
+# setup tide model
+m = pyTMD.io.model().from_database(tide_model)
+store = f"{m.name}.zarr"
+# read tide model as an xarray DataTree
+# only needs to be run once to convert the model files
+dtree = m.open_datatree(chunks="auto")
+# rechunk to blocks of (y, x) and save to local zarr store
+dtree = dtree.chunk(dict(y=256, x=256))
+dtree.to_zarr(store, mode="w", zarr_format=3, consolidated=True)
+
+# read zarr store for tide model
+# (lazily loads only the chunks needed for interpolation)
+ds = xr.open_zarr(store, group="z", zarr_format=3)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 astro.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Astronomical and nutation routines
 
 PYTHON DEPENDENCIES:
@@ -18,6 +18,11 @@ REFERENCES:
     Oliver Montenbruck, Practical Ephemeris Calculations, 1989.
 
 UPDATE HISTORY:
+    Updated 10/2026: parse IERS tables using numpy loadtxt
+        hoist unit conversions and eccentricity powers out of Meeus sums
+        add delta times to dates once when calculating lunisolar positions
+        allow lunisolar positions to share timescale objects for dates
+        cache opened JPL ephemerides kernels between calls
     Updated 06/2026: added functions to lunisolar equatorial coordinates
     Updated 03/2026: added functions to compute the geocentric positions
         of the Sun and Moon (latitude, longitude and distance)
@@ -71,6 +76,7 @@ from __future__ import annotations
 
 import logging
 import pathlib
+import functools
 import warnings
 import numpy as np
 import timescale.eop
@@ -120,6 +126,7 @@ __all__ = [
     "gast",
     "itrs",
     "_cartesian",
+    "_timescale",
     "_eqeq_complement",
     "_icrs_rotation_matrix",
     "_frame_bias_matrix",
@@ -659,6 +666,24 @@ def equation_of_time(MJD: np.ndarray):
     return np.radians(E)
 
 
+# PURPOSE: create a timescale object for dates
+def _timescale(MJD: np.ndarray | timescale.time.Timescale):
+    """
+    Create a ``timescale`` object from Modified Julian Days (MJD)
+
+    Existing ``timescale`` objects are returned as is so that derived
+    times (such as the TT-UT1 delta times) are only calculated once
+
+    Parameters
+    ----------
+    MJD: np.ndarray or timescale.time.Timescale
+        Modified Julian Day (MJD) of input date
+    """
+    if isinstance(MJD, timescale.time.Timescale):
+        return MJD
+    return timescale.time.Timescale(MJD=MJD)
+
+
 # PURPOSE: compute coordinates of the Sun in an ECEF frame
 def solar_ecef(
     MJD: np.ndarray,
@@ -672,7 +697,7 @@ def solar_ecef(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     ephemerides: str, default 'Montenbruck'
         Method for calculating solar ephemerides
@@ -714,7 +739,7 @@ def solar_approximate(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     ephemerides: str, default 'Montenbruck'
         Method for calculating solar ephemerides
@@ -730,7 +755,7 @@ def solar_approximate(
     if kwargs["ephemerides"].lower() not in _methods:
         raise ValueError("Invalid ephemerides method")
     # create timescale from Modified Julian Day (MJD)
-    ts = timescale.time.Timescale(MJD=MJD)
+    ts = _timescale(MJD)
     # calculate solar positions using the specified method
     if kwargs["ephemerides"].lower() in ("approximate", "montenbruck"):
         # mean longitude of solar perigee (radians)
@@ -750,11 +775,13 @@ def solar_approximate(
         epsilon = np.radians(23.43929111)
     else:
         # calculate solar positions
-        beta_sun = solar_latitude(ts.MJD + ts.tt_ut1, **kwargs)
-        lambda_sun = solar_longitude(ts.MJD + ts.tt_ut1, **kwargs)
-        r_sun = solar_distance(ts.MJD + ts.tt_ut1, **kwargs)
+        # (Modified Julian Days in dynamical time)
+        MJD_tt = ts.MJD + ts.tt_ut1
+        beta_sun = solar_latitude(MJD_tt, **kwargs)
+        lambda_sun = solar_longitude(MJD_tt, **kwargs)
+        r_sun = solar_distance(MJD_tt, **kwargs)
         # obliquity of the ecliptic
-        epsilon = mean_obliquity(ts.MJD + ts.tt_ut1)
+        epsilon = mean_obliquity(MJD_tt)
         # simple correction for principal nutation (radians)
         omega = np.radians(1934.136 * ts.T + 235.0)
         epsilon += np.radians(0.00256 * np.cos(omega))
@@ -776,6 +803,25 @@ def solar_approximate(
     return (X, Y, Z)
 
 
+# PURPOSE: open a JPL ephemerides kernel file
+@functools.lru_cache(maxsize=4)
+def _open_kernel(kernel: str | pathlib.Path):
+    """
+    Opens a JPL ephemerides kernel file and caches the ``SPK`` object
+
+    Parameters
+    ----------
+    kernel: str or pathlib.Path
+        Path to JPL ephemerides kernel file
+
+    Returns
+    -------
+    SPK: jplephem.spk.SPK
+        JPL ephemerides kernel
+    """
+    return jplephem.spk.SPK.open(kernel)
+
+
 # PURPOSE: compute coordinates of the Sun in an ECEF frame
 def solar_ephemerides(
     MJD: np.ndarray,
@@ -788,7 +834,7 @@ def solar_ephemerides(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     kernel: str or pathlib.Path
         Path to JPL ephemerides kernel file
@@ -804,14 +850,14 @@ def solar_ephemerides(
     kwargs.setdefault("kernel", _default_kernel)
     kwargs.setdefault("include_aberration", False)
     # create timescale from Modified Julian Day (MJD)
-    ts = timescale.time.Timescale(MJD=MJD)
+    ts = _timescale(MJD)
     # difference to convert to Barycentric Dynamical Time (TDB)
     tdb2 = getattr(ts, "tdb_tt") if hasattr(ts, "tdb_tt") else 0.0
     # download kernel file if not currently existing
     if not pathlib.Path(kwargs["kernel"]).exists():
         fetch_jpl_ssd(kernel=None, local=kwargs["kernel"])
     # read JPL ephemerides kernel
-    SPK = jplephem.spk.SPK.open(kwargs["kernel"])
+    SPK = _open_kernel(kwargs["kernel"])
     # segments for computing position of the Sun
     # segment 0 SOLAR SYSTEM BARYCENTER -> segment 10 SUN
     SSB_to_Sun = SPK[0, 10]
@@ -876,10 +922,12 @@ def solar_equatorial(MJD, **kwargs):
     # create timescale from Modified Julian Day (MJD)
     ts = timescale.time.Timescale(MJD=MJD)
     # calculate solar angles
-    beta_sun = solar_latitude(ts.MJD + ts.tt_ut1, **kwargs)
-    lambda_sun = solar_longitude(ts.MJD + ts.tt_ut1, **kwargs)
+    # (Modified Julian Days in dynamical time)
+    MJD_tt = ts.MJD + ts.tt_ut1
+    beta_sun = solar_latitude(MJD_tt, **kwargs)
+    lambda_sun = solar_longitude(MJD_tt, **kwargs)
     # obliquity of the ecliptic
-    epsilon = mean_obliquity(ts.MJD + ts.tt_ut1)
+    epsilon = mean_obliquity(MJD_tt)
     # simple correction for principal nutation (radians)
     omega = np.radians(1934.136 * ts.T + 235.0)
     epsilon += np.radians(0.00256 * np.cos(omega))
@@ -1412,7 +1460,7 @@ def lunar_ecef(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     ephemerides: str, default 'Montenbruck'
         Method for calculating lunar ephemerides
@@ -1453,7 +1501,7 @@ def lunar_approximate(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     ephemerides: str, default 'Montenbruck'
         Method for calculating lunar positions
@@ -1469,7 +1517,7 @@ def lunar_approximate(
     if kwargs["ephemerides"].lower() not in _methods:
         raise ValueError("Invalid ephemerides method")
     # create timescale from Modified Julian Day (MJD)
-    ts = timescale.time.Timescale(MJD=MJD)
+    ts = _timescale(MJD)
     # calculate lunar positions using the specified method
     if kwargs["ephemerides"].lower() in ("approximate", "montenbruck"):
         # mean longitude of Moon (p. 338)
@@ -1535,11 +1583,13 @@ def lunar_approximate(
         epsilon = np.radians(23.43929111)
     else:
         # calculate lunar positions
-        beta_moon = lunar_latitude(ts.MJD + ts.tt_ut1, **kwargs)
-        lambda_moon = lunar_longitude(ts.MJD + ts.tt_ut1, **kwargs)
-        r_moon = lunar_distance(ts.MJD + ts.tt_ut1, **kwargs)
+        # (Modified Julian Days in dynamical time)
+        MJD_tt = ts.MJD + ts.tt_ut1
+        beta_moon = lunar_latitude(MJD_tt, **kwargs)
+        lambda_moon = lunar_longitude(MJD_tt, **kwargs)
+        r_moon = lunar_distance(MJD_tt, **kwargs)
         # obliquity of the ecliptic
-        epsilon = mean_obliquity(ts.MJD + ts.tt_ut1)
+        epsilon = mean_obliquity(MJD_tt)
         # simple correction for principal nutation (radians)
         omega = np.radians(1934.136 * ts.T + 235.0)
         epsilon += np.radians(0.00256 * np.cos(omega))
@@ -1573,7 +1623,7 @@ def lunar_ephemerides(
 
     Parameters
     ----------
-    MJD: np.ndarray
+    MJD: np.ndarray or timescale.time.Timescale
         Modified Julian Day (MJD) of input date
     kernel: str or pathlib.Path
         Path to JPL ephemerides kernel file
@@ -1592,11 +1642,11 @@ def lunar_ephemerides(
     if not pathlib.Path(kwargs["kernel"]).exists():
         fetch_jpl_ssd(kernel=None, local=kwargs["kernel"])
     # create timescale from Modified Julian Day (MJD)
-    ts = timescale.time.Timescale(MJD=MJD)
+    ts = _timescale(MJD)
     # difference to convert to Barycentric Dynamical Time (TDB)
     tdb2 = getattr(ts, "tdb_tt") if hasattr(ts, "tdb_tt") else 0.0
     # read JPL ephemerides kernel
-    SPK = jplephem.spk.SPK.open(kwargs["kernel"])
+    SPK = _open_kernel(kwargs["kernel"])
     # segments for computing position of the Moon
     # segment 0 SOLAR SYSTEM BARYCENTER -> segment 3 EARTH BARYCENTER
     SSB_to_EMB = SPK[0, 3]
@@ -1662,10 +1712,12 @@ def lunar_equatorial(MJD, **kwargs):
     # create timescale from Modified Julian Day (MJD)
     ts = timescale.time.Timescale(MJD=MJD)
     # calculate lunar angles
-    beta_moon = lunar_latitude(ts.MJD + ts.tt_ut1, **kwargs)
-    lambda_moon = lunar_longitude(ts.MJD + ts.tt_ut1, **kwargs)
+    # (Modified Julian Days in dynamical time)
+    MJD_tt = ts.MJD + ts.tt_ut1
+    beta_moon = lunar_latitude(MJD_tt, **kwargs)
+    lambda_moon = lunar_longitude(MJD_tt, **kwargs)
     # obliquity of the ecliptic
-    epsilon = mean_obliquity(ts.MJD + ts.tt_ut1)
+    epsilon = mean_obliquity(MJD_tt)
     # simple correction for principal nutation (radians)
     omega = np.radians(1934.136 * ts.T + 235.0)
     epsilon += np.radians(0.00256 * np.cos(omega))
@@ -1783,10 +1835,13 @@ def lunar_latitude(
         beta -= 115e-6 * np.sin(np.radians(Lp + Mp))
         # calculate the lunar latitude
         table_47B = _meeus_table_47B()
-        for i, line in enumerate(table_47B):
-            d, m, mp, f, coeff = line
-            delta_b = np.radians(d * D + m * M + mp * Mp + f * F)
-            beta += 1e-6 * coeff * np.power(ee, np.abs(m)) * np.sin(delta_b)
+        # convert fundamental arguments to radians and calculate powers
+        # of the eccentricity once outside of the summation loop
+        rD, rM, rMp, rF = np.radians([D, M, Mp, F])
+        epow = {m: np.power(ee, m) for m in np.unique(np.abs(table_47B[:, 1]))}
+        for d, m, mp, f, coeff in table_47B:
+            delta_b = d * rD + m * rM + mp * rMp + f * rF
+            beta += 1e-6 * coeff * epow[np.abs(m)] * np.sin(delta_b)
     elif kwargs["ephemerides"].lower() == "kubo":
         # coefficients for calculating the latitude of the Moon
         coefficients = np.array(
@@ -1942,10 +1997,13 @@ def lunar_longitude(
         S += 318e-6 * np.sin(np.radians(A2))
         # calculate the lunar longitude
         table_47A = _meeus_table_47A()
-        for i, line in enumerate(table_47A):
-            d, m, mp, f, coeff, _ = line
-            delta_S = np.radians(d * D + m * M + mp * Mp + f * F)
-            S += 1e-6 * coeff * np.power(ee, np.abs(m)) * np.sin(delta_S)
+        # convert fundamental arguments to radians and calculate powers
+        # of the eccentricity once outside of the summation loop
+        rD, rM, rMp, rF = np.radians([D, M, Mp, F])
+        epow = {m: np.power(ee, m) for m in np.unique(np.abs(table_47A[:, 1]))}
+        for d, m, mp, f, coeff, _ in table_47A:
+            delta_S = d * rD + m * rM + mp * rMp + f * rF
+            S += 1e-6 * coeff * epow[np.abs(m)] * np.sin(delta_S)
     elif kwargs["ephemerides"].lower() == "kubo":
         # coefficients for calculating the longitude of the Moon
         coefficients = np.array(
@@ -2101,10 +2159,13 @@ def lunar_distance(
         # calculate the distance from the Moon to the Earth
         R = 385000560.0
         table_47A = _meeus_table_47A()
-        for i, line in enumerate(table_47A):
-            d, m, mp, f, _, coeff = line
-            delta_R = np.radians(d * D + m * M + mp * Mp + f * F)
-            R += coeff * np.power(ee, np.abs(m)) * np.cos(delta_R)
+        # convert fundamental arguments to radians and calculate powers
+        # of the eccentricity once outside of the summation loop
+        rD, rM, rMp, rF = np.radians([D, M, Mp, F])
+        epow = {m: np.power(ee, m) for m in np.unique(np.abs(table_47A[:, 1]))}
+        for d, m, mp, f, _, coeff in table_47A:
+            delta_R = d * rD + m * rM + mp * rMp + f * rF
+            R += coeff * epow[np.abs(m)] * np.cos(delta_R)
     elif kwargs["ephemerides"].lower() == "kubo":
         # horizontal parallax of the Moon (degrees)
         parallax = 0.950725
@@ -2892,14 +2953,10 @@ def _parse_table_5_2e():
     dtype = np.dtype({"names": names, "formats": formats})
     # j = 0 terms
     n0 = 33
-    j0 = np.zeros((n0), dtype=dtype)
-    for i, line in enumerate(file_contents[53 : 53 + n0]):
-        j0[i] = np.array(tuple(line.split()), dtype=dtype)
+    j0 = np.loadtxt(file_contents[53 : 53 + n0], dtype=dtype, ndmin=1)
     # j = 1 terms
     n1 = 1
-    j1 = np.zeros((n1), dtype=dtype)
-    for i, line in enumerate(file_contents[90 : 90 + n1]):
-        j1[i] = np.array(tuple(line.split()), dtype=dtype)
+    j1 = np.loadtxt(file_contents[90 : 90 + n1], dtype=dtype, ndmin=1)
     # return the table
     return (j0, j1)
 
@@ -2955,14 +3012,10 @@ def _parse_table_5_3a():
     dtype = np.dtype({"names": names, "formats": formats})
     # j = 0 terms
     n0 = 1320
-    j0 = np.zeros((n0), dtype=dtype)
-    for i, line in enumerate(file_contents[22 : 22 + n0]):
-        j0[i] = np.array(tuple(line.split()), dtype=dtype)
+    j0 = np.loadtxt(file_contents[22 : 22 + n0], dtype=dtype, ndmin=1)
     # j = 1 terms
     n1 = 38
-    j1 = np.zeros((n1), dtype=dtype)
-    for i, line in enumerate(file_contents[1348 : 1348 + n1]):
-        j1[i] = np.array(tuple(line.split()), dtype=dtype)
+    j1 = np.loadtxt(file_contents[1348 : 1348 + n1], dtype=dtype, ndmin=1)
     # return the table
     return (j0, j1)
 
@@ -3018,13 +3071,9 @@ def _parse_table_5_3b():
     dtype = np.dtype({"names": names, "formats": formats})
     # j = 0 terms
     n0 = 1037
-    j0 = np.zeros((n0), dtype=dtype)
-    for i, line in enumerate(file_contents[22 : 22 + n0]):
-        j0[i] = np.array(tuple(line.split()), dtype=dtype)
+    j0 = np.loadtxt(file_contents[22 : 22 + n0], dtype=dtype, ndmin=1)
     # j = 1 terms
     n1 = 19
-    j1 = np.zeros((n1), dtype=dtype)
-    for i, line in enumerate(file_contents[1065 : 1065 + n1]):
-        j1[i] = np.array(tuple(line.split()), dtype=dtype)
+    j1 = np.loadtxt(file_contents[1065 : 1065 + n1], dtype=dtype, ndmin=1)
     # return the table
     return (j0, j1)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 compute.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Calculates tidal elevations for correcting elevation or imagery data
 Calculates tidal currents at locations and times
 
@@ -64,6 +64,21 @@ PROGRAM DEPENDENCIES:
     predict.py: predict tide values using harmonic constants
 
 UPDATE HISTORY:
+    Updated 10/2026: skip interpolating delta times when not used by model
+        predict and infer both current components together
+        keep the attributes of each predicted current component
+        apply flexure to constituents without modifying data in place
+        add option to open model files in parallel using dask
+        add option to predict tides in single precision
+        use flattened views of datetime arrays rather than copies
+        add option to cache interpolated model constituents to disk
+        write cache files to unique temporary files before replacing
+        serialize numpy attributes when writing cache files
+        include masks of valid coordinates in cache file names
+        keep auxiliary model variables when dropping unused constituents
+        only read and interpolate the model constituents used for predictions
+        share timescale objects when calculating lunisolar ephemerides
+        reduce coordinates to default crop bounds with single ufunc calls
     Updated 06/2026: standardize use of lambda (lmda) to denote longitudes
         drift type renamed to trajectory. drift still accepted as an alias
     Updated 05/2026: use numpy hypot function to calculate magnitudes
@@ -158,7 +173,11 @@ UPDATE HISTORY:
 
 from __future__ import print_function, annotations
 
+import os
+import json
+import hashlib
 import pathlib
+import tempfile
 import numpy as np
 import xarray as xr
 from io import IOBase
@@ -289,6 +308,8 @@ def tide_elevations(
         Tide model definition file for use
     chunks: int, dict, str, or None, default None
         Variable chunk sizes for dask [see ``xarray.open_dataset``]
+    parallel: bool, default False
+        Open model files in parallel using ``dask``
     crop: bool, default False
         Crop tide model data to (buffered) bounds
     bounds: list, np.ndarray or NoneType, default None
@@ -334,12 +355,19 @@ def tide_elevations(
         Infer the height values for minor tidal constituents
     minor_constituents: list or None, default None
         Specify constituents to infer
+    dtype: np.dtype or None, default None
+        Floating point precision of the predicted tides
+
+            - ``None``: promote to double precision
+            - ``np.float32``: single precision for 32-bit models
     append_node: bool, default False
         Append equilibrium amplitudes for node tides
     apply_flexure: bool, default False
         Apply ice flexure scaling factor to height values
 
         Only valid for models containing flexure fields
+    cache: bool, default False
+        Cache interpolated model constituents for reuse in later runs
 
     Returns
     -------
@@ -348,12 +376,15 @@ def tide_elevations(
     """
     # default keyword arguments
     kwargs.setdefault("chunks", None)
+    kwargs.setdefault("parallel", False)
     kwargs.setdefault("corrections", None)
     kwargs.setdefault("constituents", None)
     kwargs.setdefault("infer_minor", True)
     kwargs.setdefault("minor_constituents", None)
+    kwargs.setdefault("dtype", None)
     kwargs.setdefault("append_node", False)
     kwargs.setdefault("apply_flexure", False)
+    kwargs.setdefault("cache", False)
 
     # check that tide directory is accessible
     if directory is not None:
@@ -373,32 +404,66 @@ def tide_elevations(
         m = pyTMD.io.model(directory).from_file(definition_file)
     else:
         m = pyTMD.io.model(directory).from_database(model)
-    # open dataset
-    ds = m.open_dataset(
-        group="z", chunks=kwargs["chunks"], append_node=kwargs["append_node"]
+    # options affecting the interpolated model constituents
+    options = dict(
+        type=type,
+        time=np.shape(delta_time),
+        crs=crs,
+        crop=crop,
+        bounds=bounds,
+        buffer=buffer,
+        method=method,
+        extrapolate=extrapolate,
+        cutoff=cutoff,
+        constituents=kwargs["constituents"],
+        append_node=kwargs["append_node"],
+        apply_flexure=kwargs["apply_flexure"],
     )
-    # apply flexure field to each constituent
-    if kwargs["apply_flexure"]:
-        for c in ds.tmd.constituents:
-            ds[c] *= ds["flexure"]
-    # subset to constituents
-    if kwargs["constituents"]:
-        ds = ds.tmd.subset(kwargs["constituents"])
+    # check for interpolated model constituents in the cache
+    cache_file = None
+    if kwargs["cache"]:
+        cache_file = _cache_file(m, "z", x, y, **options)
+    if cache_file is not None and cache_file.exists():
+        local = _read_cache(cache_file)
+    else:
+        # open dataset
+        ds = m.open_dataset(
+            group="z",
+            chunks=kwargs["chunks"],
+            parallel=kwargs["parallel"],
+            append_node=kwargs["append_node"],
+            constituents=kwargs["constituents"],
+        )
+        # apply flexure field to each constituent
+        if kwargs["apply_flexure"]:
+            # (not in place as constituents may share data with the model)
+            for c in ds.tmd.constituents:
+                ds[c] = ds[c] * ds["flexure"]
+        # drop constituents not used for predictions
+        # (auxiliary variables such as bathymetry are carried through)
+        ds = _drop_unused(ds, kwargs["constituents"])
+
+        # convert coordinates to xarray DataArrays
+        # in coordinate reference system of model
+        X, Y = ds.tmd.coords_as(x, y, type=type, time=delta_time, crs=crs)
+
+        # crop tide model dataset to bounds
+        if crop and bounds is None:
+            # default bounds if cropping data
+            xmin, xmax, ymin, ymax = _bounds(X, Y)
+            # crop dataset to buffered default bounds
+            ds = ds.tmd.crop([xmin, xmax, ymin, ymax], buffer=buffer)
+        elif crop:
+            # crop dataset to buffered bounds
+            ds = ds.tmd.crop(bounds, buffer=buffer)
 
-    # convert coordinates to xarray DataArrays
-    # in coordinate reference system of model
-    X, Y = ds.tmd.coords_as(x, y, type=type, time=delta_time, crs=crs)
-
-    # crop tide model dataset to bounds
-    if crop and bounds is None:
-        # default bounds if cropping data
-        xmin, xmax = np.min(X), np.max(X)
-        ymin, ymax = np.min(Y), np.max(Y)
-        # crop dataset to buffered default bounds
-        ds = ds.tmd.crop([xmin, xmax, ymin, ymax], buffer=buffer)
-    elif crop:
-        # crop dataset to buffered bounds
-        ds = ds.tmd.crop(bounds, buffer=buffer)
+        # interpolate model to grid points
+        local = ds.tmd.interp(
+            X, Y, method=method, extrapolate=extrapolate, cutoff=cutoff
+        )
+        # save interpolated model constituents to the cache
+        if cache_file is not None:
+            _write_cache(local, cache_file)
 
     # convert delta times or datetimes objects to timescale
     if standard.lower() == "datetime":
@@ -415,18 +480,17 @@ def tide_elevations(
     # delta time (TT - UT1) for tide model
     if nodal_corrections in ("OTIS", "ATLAS", "TMD3", "netcdf"):
         # use delta time at 2000.0 to match TMDv2.5 outputs
-        deltat = np.zeros_like(ts.tt_ut1)
+        deltat = np.zeros_like(ts.tide)
     else:
         # use interpolated delta times
         deltat = ts.tt_ut1
 
-    # interpolate model to grid points
-    local = ds.tmd.interp(
-        X, Y, method=method, extrapolate=extrapolate, cutoff=cutoff
-    )
     # calculate tide values for input data type
     tpred = local.tmd.predict(
-        ts.tide, deltat=deltat, corrections=nodal_corrections
+        ts.tide,
+        deltat=deltat,
+        corrections=nodal_corrections,
+        dtype=kwargs["dtype"],
     )
     # calculate values for minor constituents by inference
     if kwargs["infer_minor"]:
@@ -436,6 +500,7 @@ def tide_elevations(
             deltat=deltat,
             corrections=nodal_corrections,
             minor=minor_constituents,
+            dtype=kwargs["dtype"],
         )
         # add major and minor components
         tpred += tinfer
@@ -489,6 +554,8 @@ def tide_currents(
         Tide model definition file for use
     chunks: int, dict, str, or None, default None
         Variable chunk sizes for dask [see ``xarray.open_dataset``]
+    parallel: bool, default False
+        Open model files in parallel using ``dask``
     crop: bool, default False
         Crop tide model data to (buffered) bounds
     bounds: list, np.ndarray or NoneType, default None
@@ -534,6 +601,13 @@ def tide_currents(
         Infer the height values for minor tidal constituents
     minor_constituents: list or None, default None
         Specify constituents to infer
+    dtype: np.dtype or None, default None
+        Floating point precision of the predicted tides
+
+            - ``None``: promote to double precision
+            - ``np.float32``: single precision for 32-bit models
+    cache: bool, default False
+        Cache interpolated model constituents for reuse in later runs
 
     Returns
     -------
@@ -545,10 +619,13 @@ def tide_currents(
     """
     # default keyword arguments
     kwargs.setdefault("chunks", None)
+    kwargs.setdefault("parallel", False)
     kwargs.setdefault("corrections", None)
     kwargs.setdefault("constituents", None)
     kwargs.setdefault("infer_minor", True)
     kwargs.setdefault("minor_constituents", None)
+    kwargs.setdefault("dtype", None)
+    kwargs.setdefault("cache", False)
 
     # check that tide directory is accessible
     if directory is not None:
@@ -568,26 +645,64 @@ def tide_currents(
         m = pyTMD.io.model(directory).from_file(definition_file)
     else:
         m = pyTMD.io.model(directory).from_database(model)
-    # open datatree with model currents
-    dtree = m.open_datatree(group=["u", "v"], chunks=kwargs["chunks"])
-    # subset to constituents
-    if kwargs["constituents"]:
-        dtree = dtree.tmd.subset(kwargs["constituents"])
+    # options affecting the interpolated model constituents
+    options = dict(
+        type=type,
+        time=np.shape(delta_time),
+        crs=crs,
+        crop=crop,
+        bounds=bounds,
+        buffer=buffer,
+        method=method,
+        extrapolate=extrapolate,
+        cutoff=cutoff,
+        constituents=kwargs["constituents"],
+    )
+    # check for interpolated model constituents in the cache
+    cache_files = {}
+    if kwargs["cache"]:
+        for key in ("u", "v"):
+            cache_files[key] = _cache_file(m, key, x, y, **options)
+    if cache_files and all(f.exists() for f in cache_files.values()):
+        local = {key: _read_cache(f) for key, f in cache_files.items()}
+    else:
+        # open datatree with model currents
+        dtree = m.open_datatree(
+            group=["u", "v"],
+            chunks=kwargs["chunks"],
+            parallel=kwargs["parallel"],
+            constituents=kwargs["constituents"],
+        )
+        # drop constituents not used for predictions
+        # (auxiliary variables such as bathymetry are carried through)
+        for key, ds in dtree.items():
+            dtree[key] = _drop_unused(ds.to_dataset(), kwargs["constituents"])
+
+        # convert coordinates to xarray DataArrays
+        # in coordinate reference system of model
+        X, Y = dtree.tmd.coords_as(
+            x, y, type=type, time=delta_time, crs=crs
+        )
 
-    # convert coordinates to xarray DataArrays
-    # in coordinate reference system of model
-    X, Y = dtree.tmd.coords_as(x, y, type=type, time=delta_time, crs=crs)
-
-    # crop tide model datatree to bounds
-    if crop and bounds is None:
-        # default bounds if cropping data
-        xmin, xmax = np.min(X), np.max(X)
-        ymin, ymax = np.min(Y), np.max(Y)
-        # crop datatree to buffered default bounds
-        dtree = dtree.tmd.crop([xmin, xmax, ymin, ymax], buffer=buffer)
-    elif crop:
-        # crop datatree to buffered bounds
-        dtree = dtree.tmd.crop(bounds, buffer=buffer)
+        # crop tide model datatree to bounds
+        if crop and bounds is None:
+            # default bounds if cropping data
+            xmin, xmax, ymin, ymax = _bounds(X, Y)
+            # crop datatree to buffered default bounds
+            dtree = dtree.tmd.crop([xmin, xmax, ymin, ymax], buffer=buffer)
+        elif crop:
+            # crop datatree to buffered bounds
+            dtree = dtree.tmd.crop(bounds, buffer=buffer)
+
+        # interpolate each current component to grid points
+        local = {}
+        for key, ds in dtree.items():
+            local[key] = ds.to_dataset().tmd.interp(
+                X, Y, method=method, extrapolate=extrapolate, cutoff=cutoff
+            )
+        # save interpolated model constituents to the cache
+        for key, f in cache_files.items():
+            _write_cache(local[key], f)
 
     # convert delta times or datetimes objects to timescale
     if standard.lower() == "datetime":
@@ -604,46 +719,229 @@ def tide_currents(
     # delta time (TT - UT1) for tide model
     if nodal_corrections in ("OTIS", "ATLAS", "TMD3", "netcdf"):
         # use delta time at 2000.0 to match TMDv2.5 outputs
-        deltat = np.zeros_like(ts.tt_ut1)
+        deltat = np.zeros_like(ts.tide)
     else:
         # use interpolated delta times
         deltat = ts.tt_ut1
 
+    # stack components sharing the same variables so that the
+    # astronomical arguments are only calculated once for u and v
+    variables = {tuple(ds.data_vars) for ds in local.values()}
+    if len(variables) == 1:
+        stacked = xr.concat(
+            list(local.values()), dim="component", combine_attrs="override"
+        )
+        # attributes of each component are restored after predicting
+        stacked.attrs = {}
+        groups = [stacked.assign_coords(component=list(local.keys()))]
+    else:
+        groups = [ds.expand_dims(component=[k]) for k, ds in local.items()]
+
     # python dictionary with tide model data
     tpred = xr.DataTree()
-    # iterate over u and v currents
-    for key, ds in dtree.items():
-        # convert component to dataset
-        ds = ds.to_dataset()
-        # interpolate model to grid points
-        local = ds.tmd.interp(
-            X, Y, method=method, extrapolate=extrapolate, cutoff=cutoff
-        )
+    # iterate over groups of u and v currents
+    for ds in groups:
         # calculate tide values for input data type
-        tpred[key] = local.tmd.predict(
-            ts.tide, deltat=deltat, corrections=nodal_corrections
+        tide = ds.tmd.predict(
+            ts.tide,
+            deltat=deltat,
+            corrections=nodal_corrections,
+            dtype=kwargs["dtype"],
         )
         # calculate values for minor constituents by inference
         if kwargs["infer_minor"]:
             # infer minor constituents
-            tinfer = local.tmd.infer(
+            tinfer = ds.tmd.infer(
                 ts.tide,
                 deltat=deltat,
                 corrections=nodal_corrections,
                 minor=minor_constituents,
+                dtype=kwargs["dtype"],
             )
             # add major and minor components
-            tpred[key] += tinfer
+            tide += tinfer
+        # split the predictions into each current component
+        for key in ds.component.values:
+            da = tide.sel(component=key, drop=True)
+            # attributes of the component as if predicted separately
+            da.attrs = {**local[key].attrs, **tide.attrs}
+            tpred[key] = da
             # add attributes for inferred constituents
-            tpred[key].attrs["inferred"] = []
-            if hasattr(tinfer, "constituents"):
-                tpred[key].attrs["inferred"].extend(tinfer.constituents)
-        # add attributes
-        tpred[key].attrs["nodal_corrections"] = nodal_corrections
+            if kwargs["infer_minor"]:
+                tpred[key].attrs["inferred"] = []
+                if hasattr(tinfer, "constituents"):
+                    tpred[key].attrs["inferred"].extend(tinfer.constituents)
+            # add attributes
+            tpred[key].attrs["nodal_corrections"] = nodal_corrections
     # return the tidal currents
     return tpred
 
 
+# PURPOSE: get the cache file for interpolated model constituents
+def _cache_file(
+    m: pyTMD.io.model,
+    group: str,
+    x: np.ndarray,
+    y: np.ndarray,
+    **kwargs,
+) -> pathlib.Path:
+    """
+    Get the path to the cache file for model constituents
+    interpolated to a set of coordinates
+
+    Parameters
+    ----------
+    m: pyTMD.io.model
+        Tide model object
+    group: str
+        Model group
+    x: np.ndarray
+        x-coordinates
+    y: np.ndarray
+        y-coordinates
+    kwargs: dict
+        Options affecting the interpolated model constituents
+
+    Returns
+    -------
+    cache_file: pathlib.Path
+        Cache file for the interpolated model constituents
+    """
+    # hash of the model parameters, input coordinates and options
+    h = hashlib.blake2b(digest_size=16)
+    h.update(repr(m.to_dict()).encode("utf8"))
+    h.update(repr(sorted(kwargs.items())).encode("utf8"))
+    # include modification times of the model files
+    for key in ("model_file", "grid_file"):
+        files = m[group].get(key) or []
+        if not isinstance(files, (list, tuple)):
+            files = [files]
+        for f in files:
+            f = pathlib.Path(f)
+            h.update(str(f.stat().st_mtime_ns if f.exists() else 0).encode())
+    # include input coordinates and which are valid (unmasked and finite)
+    for c in (x, y):
+        h.update(np.ascontiguousarray(c, dtype=np.float64).tobytes())
+        valid = ~np.ma.getmaskarray(c) & np.isfinite(np.ma.getdata(c))
+        h.update(np.packbits(valid).tobytes())
+    # return the path to the cache file
+    return pyTMD.utilities.get_cache_path(
+        f"{m.name}_{group}_{h.hexdigest()}.nc"
+    )
+
+
+# PURPOSE: read interpolated model constituents from the cache
+def _read_cache(cache_file: pathlib.Path) -> xr.Dataset:
+    """
+    Read interpolated model constituents from a cache file
+
+    Parameters
+    ----------
+    cache_file: pathlib.Path
+        Cache file for the interpolated model constituents
+
+    Returns
+    -------
+    ds: xarray.Dataset
+        Interpolated model constituents
+    """
+    ds = xr.load_dataset(cache_file, engine="h5netcdf")
+    # restore attributes from serialized strings
+    ds.attrs = json.loads(ds.attrs["attributes"])
+    for v in ds.variables.values():
+        v.attrs = json.loads(v.attrs["attributes"])
+    return ds
+
+
+# PURPOSE: write interpolated model constituents to the cache
+def _write_cache(ds: xr.Dataset, cache_file: pathlib.Path):
+    """
+    Write interpolated model constituents to a cache file
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        Interpolated model constituents
+    cache_file: pathlib.Path
+        Cache file for the interpolated model constituents
+    """
+    # serialize attributes as netCDF4 does not support nested types
+    ds = ds.copy()
+    ds.attrs = dict(attributes=json.dumps(ds.attrs, default=_serialize))
+    for v in ds.variables.values():
+        v.attrs = dict(attributes=json.dumps(v.attrs, default=_serialize))
+    # write to a uniquely named temporary file and move into place
+    with tempfile.NamedTemporaryFile(
+        dir=cache_file.parent, suffix=".tmp", delete=False
+    ) as f:
+        temp_file = pathlib.Path(f.name)
+    try:
+        ds.to_netcdf(temp_file, engine="h5netcdf", invalid_netcdf=True)
+        os.replace(temp_file, cache_file)
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+
+# PURPOSE: convert numpy attributes to JSON serializable types
+def _serialize(obj):
+    """
+    Convert ``numpy`` scalars and arrays to JSON serializable types
+
+    Parameters
+    ----------
+    obj: np.generic or np.ndarray
+        ``numpy`` attribute value
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
+
+# PURPOSE: drop model constituents not used for predictions
+def _drop_unused(ds: xr.Dataset, constituents: list | None) -> xr.Dataset:
+    """
+    Drop model constituents that are not used for predictions
+    while keeping auxiliary variables
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        Tide model data
+    constituents: list or None
+        Constituents used for predictions (``None`` for all)
+    """
+    if not constituents:
+        return ds
+    unused = [c for c in ds.tmd.constituents if c not in constituents]
+    return ds.drop_vars(unused)
+
+
+# PURPOSE: get the bounding box of coordinates
+def _bounds(x: xr.DataArray, y: xr.DataArray) -> list:
+    """
+    Get the bounding box of coordinates ignoring invalid values
+
+    Parameters
+    ----------
+    x: xarray.DataArray
+        x-coordinates
+    y: xarray.DataArray
+        y-coordinates
+
+    Returns
+    -------
+    bounds: list
+        Bounding box ``[min_x, max_x, min_y, max_y]``
+    """
+    bounds = []
+    # reduce each coordinate with a single ufunc call for each extent
+    # (fmin and fmax skip nan values without a masked temporary copy)
+    for v in (x, y):
+        v = np.ravel(v)
+        bounds.extend([np.fmin.reduce(v), np.fmax.reduce(v)])
+    return bounds
+
+
 # PURPOSE: check if points are within a tide model domain
 def tide_masks(
     x: np.ndarray,
@@ -1051,7 +1349,7 @@ def OPT_displacements(
     delta_time = np.atleast_1d(delta_time)
     # convert delta times or datetimes objects to timescale
     if standard.lower() == "datetime":
-        ts = timescale.from_datetime(delta_time.flatten())
+        ts = timescale.from_datetime(delta_time.ravel())
     else:
         ts = timescale.from_deltatime(
             delta_time, epoch=epoch, standard=standard
@@ -1280,8 +1578,8 @@ def _ephemerides_SET(
     lmda = np.arctan2(XYZ.Y, XYZ.X)
 
     # compute ephemerides for lunisolar coordinates
-    SX, SY, SZ = pyTMD.astro.solar_ecef(ts.MJD, ephemerides=ephemerides)
-    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts.MJD, ephemerides=ephemerides)
+    SX, SY, SZ = pyTMD.astro.solar_ecef(ts, ephemerides=ephemerides)
+    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts, ephemerides=ephemerides)
     # create datasets for lunisolar coordinates
     SXYZ = xr.Dataset(
         data_vars={
@@ -1586,8 +1884,8 @@ def TG_forces(
     lmda = np.arctan2(XYZ.Y, XYZ.X)
 
     # compute ephemerides for lunisolar coordinates
-    SX, SY, SZ = pyTMD.astro.solar_ecef(ts.MJD, ephemerides=ephemerides)
-    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts.MJD, ephemerides=ephemerides)
+    SX, SY, SZ = pyTMD.astro.solar_ecef(ts, ephemerides=ephemerides)
+    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts, ephemerides=ephemerides)
     # create datasets for lunisolar coordinates
     SXYZ = xr.Dataset(
         data_vars={
@@ -1750,8 +2048,8 @@ def GT_accelerations(
     lmda = np.arctan2(XYZ.Y, XYZ.X)
 
     # compute ephemerides for lunisolar coordinates
-    SX, SY, SZ = pyTMD.astro.solar_ecef(ts.MJD, ephemerides=ephemerides)
-    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts.MJD, ephemerides=ephemerides)
+    SX, SY, SZ = pyTMD.astro.solar_ecef(ts, ephemerides=ephemerides)
+    LX, LY, LZ = pyTMD.astro.lunar_ecef(ts, ephemerides=ephemerides)
     # create datasets for lunisolar coordinates
     SXYZ = xr.Dataset(
         data_vars={
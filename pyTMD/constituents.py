@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 constituents.py
-Written by Tyler Sutterley (05/2026)
+Written by Tyler Sutterley (10/2026)
 Calculates constituents parameters and nodal arguments
 Originally modified from Richard Ray's ARGUMENTS subroutine
 
@@ -24,6 +24,16 @@ REFERENCES:
         Ocean Tides", Journal of Atmospheric and Oceanic Technology, (2002).
 
 UPDATE HISTORY:
+    Updated 10/2026: allocate constituent parameters without list introspection
+        parse tide potential tables using numpy loadtxt
+        stream tide potential tables instead of reading all lines
+        check for unsupported Doodson coefficients once
+        extract rotation rate table values with a single regular expression
+        compile regular expressions for constituent names once
+        cache the parsed table of Doodson coefficients
+        define remapped constituent names once at the module level
+        reuse regular expression matches and cache parsed constituent names
+        check for exact constituent names before regular expressions
     Updated 05/2026: use numpy hypot function to calculate magnitudes
         deprecate minor table and arguments table functions
         moved body tide Love/Shida numbers to earth module
@@ -101,6 +111,7 @@ from __future__ import annotations
 import re
 import json
 import pathlib
+import functools
 import warnings
 import numpy as np
 import pyTMD.astro
@@ -117,6 +128,7 @@ __all__ = [
     "aliasing_period",
     "_constituent_parameters",
     "_frequency",
+    "_load_coefficients",
     "_parse_tide_potential_table",
     "_parse_rotation_rate_table",
     "_parse_name",
@@ -394,6 +406,25 @@ def minor_arguments(
 _coefficients_table = get_data_path(["data", "doodson.json"])
 
 
+@functools.lru_cache(maxsize=4)
+def _load_coefficients(table: pathlib.Path):
+    """
+    Read and cache a ``JSON`` file of Doodson coefficients
+
+    Parameters
+    ----------
+    table: pathlib.Path
+        ``JSON`` file of Doodson coefficients
+
+    Returns
+    -------
+    coefficients: dict
+        Doodson coefficients for each constituent
+    """
+    with table.open(mode="r", encoding="utf8") as fid:
+        return json.load(fid)
+
+
 def coefficients_table(
     constituents: list | tuple | np.ndarray | str,
     **kwargs,
@@ -434,8 +465,7 @@ def coefficients_table(
     # n: mean longitude of ascending lunar node
     # pp: mean longitude of solar perigee
     # k: 90-degree phase
-    with table.open(mode="r", encoding="utf8") as fid:
-        coefficients = json.load(fid)
+    coefficients = dict(_load_coefficients(table))
 
     # compute climatologically affected terms without p'
     # following Pugh and Woodworth (2014)
@@ -2212,11 +2242,13 @@ def _constituent_parameters(c: str | list, **kwargs):
         species = _species.get(c.lower(), 0)
     else:
         # if c is iterable: allocate for output arrays
-        amplitude = np.zeros_like(c, dtype=np.float64)
-        phase = np.zeros_like(c, dtype=np.float64)
-        omega = np.zeros_like(c, dtype=np.float64)
-        alpha = np.zeros_like(c, dtype=np.float64)
-        species = np.zeros_like(c, dtype=np.int32)
+        # (all values are filled from the tables below)
+        nc = len(c)
+        amplitude = np.empty((nc), dtype=np.float64)
+        phase = np.empty((nc), dtype=np.float64)
+        omega = np.empty((nc), dtype=np.float64)
+        alpha = np.empty((nc), dtype=np.float64)
+        species = np.empty((nc), dtype=np.int32)
         # for each constituent
         for i, cons in enumerate(c):
             # check if constituent is in cindex
@@ -2336,10 +2368,6 @@ def _parse_tide_potential_table(
     """
     # verify table path
     table = pathlib.Path(table).expanduser().absolute()
-    with table.open(mode="r", encoding="utf8") as f:
-        file_contents = f.readlines()
-    # number of lines in the file
-    file_lines = len(file_contents) - int(skiprows)
     # names: names of the columns in the table
     # formats: data types for each column in the table
     names = []
@@ -2374,13 +2402,19 @@ def _parse_tide_potential_table(
     formats.append("U7")
     # create a structured numpy dtype for the table
     dtype = np.dtype({"names": names, "formats": formats})
-    CTE = np.zeros((file_lines), dtype=dtype)
     # total number of output columns
     total_columns = len(names)
-    # iterate over each line in the file
-    for i, line in enumerate(file_contents[skiprows:]):
-        # drop last column(s) with values from Doodson (1921)
-        CTE[i] = np.array(tuple(line.split()[:total_columns]), dtype=dtype)
+    # parse all lines in the file while streaming from the table
+    # drop last column(s) with values from Doodson (1921)
+    with table.open(mode="r", encoding="utf8") as f:
+        CTE = np.loadtxt(
+            f,
+            dtype=dtype,
+            comments=None,
+            skiprows=int(skiprows),
+            usecols=range(total_columns),
+            ndmin=1,
+        )
     # return the table values
     return CTE
 
@@ -2434,13 +2468,167 @@ def _parse_rotation_rate_table():
     # create a structured numpy dtype for the table
     dtype = np.dtype({"names": names, "formats": formats})
     ZROT = np.zeros((file_lines), dtype=dtype)
-    # iterate over each line in the file
-    for i, line in enumerate(file_contents[1:]):
-        ZROT[i] = np.array(tuple(rx.findall(line)), dtype=dtype)
+    # extract numerical values from all lines of the table at once
+    # (columns are fixed width and negative values may not be separated)
+    values = rx.findall("".join(file_contents[1:]))
+    values = np.array(values).reshape(file_lines, len(names))
+    # convert each column to the data type of the field
+    for j, name in enumerate(names):
+        ZROT[name] = values[:, j]
     # return the table values
     return ZROT
 
 
+# regular expressions for parsing constituent names
+# (compiled once when the module is imported)
+# list of tidal constituents to search for in the input string
+# include negative look-behind and look-ahead for complex cases
+_cindex = [
+    "z0",
+    "node",
+    "sa",
+    "ssa",
+    "sta",
+    "msqm",
+    "mtm",
+    r"mf(?![a|b|n])",
+    r"mm(?![un])",
+    r"msf(?![a|b])",
+    r"mt(?![m|ide])",
+    "2q1",
+    "alpha1",
+    "beta1",
+    "chi1",
+    "j1",
+    "psi1",
+    "phi1",
+    "pi1",
+    "sigma1",
+    "rho1",
+    "tau1",
+    "theta1",
+    "oo1",
+    "so1",
+    "ups1",
+    "q1",
+    "s1",
+    r"(?<!rh)o1(?!n)",
+    r"m1(?![a|b])",
+    r"(?<![al|oo|])p1",
+    r"k1(?!n)",
+    "2sm2",
+    "alpha2",
+    "beta2",
+    "delta2",
+    "eps2",
+    "gamma2",
+    "k2",
+    "lambda2",
+    "m2a",
+    "m2b",
+    "mks2",
+    "mns2",
+    "mu2",
+    "r2",
+    r"(?<![ms])2n2",
+    r"(?<![b|z])eta2",
+    r"(?<!de)l2(?![a|b])",
+    r"(?<![ga|la])m2(?![a|b|n])",
+    r"(?<![mmu|ms])n2",
+    r"(?<![ms])nu2",
+    r"(?<![mn|mk|mnu|ep])s2(?![0|r|m])",
+    r"(?<![be])t2",
+    "m3",
+    "mk3",
+    "mk4",
+    "mn4",
+    "ms4",
+    "s3",
+    "m4",
+    "n4",
+    "s4",
+    "s5",
+    "m6",
+    "s6",
+    "s7",
+    "s8",
+    "m8",
+]
+# compile regular expression for simple cases
+# adding GOT prime nomenclature for 3rd degree constituents
+_simple_rx = re.compile(
+    r"(?<![\d|j|k|l|m|n|o|p|q|r|s|t|u])(?<![|\(|\)])("
+    + r"|".join(_cindex)
+    + r")(?![|\(|\)])(?![\d])(?![+|-])(\')?",
+    re.IGNORECASE,
+)
+# regular expression pattern for finding constituent names
+# include negative look-behind and look-ahead for complex cases
+_patterns = (
+    r"node|alpha|beta|chi|delta|eps|eta|gamma|lambda|muo|mu|"
+    r"nu|pi|psi|phi|rho\d|sigma|tau|theta|ups|zeta|e3|f\d|jk|jo|jp|"
+    r"jq|j|kb|kjq|kj|kmsn|km|kn|ko|kpq|kp|kq|kso|ks|k\d|lb|"
+    r"(?<!de)l\d|ma(?![sk])|mb|mfa|mfb|mfn|mf|mkj|mkl|mknu|mkn|mkp|"
+    r"mks|mk|mlns|mls|ml|mmun|mm|mnks|mnk|mnls|mnm|mno|mnp|mns|mnus|"
+    r"mnu|mn|mop|moq|mo|mpq|mp|mq|mr|msfa|msfb|msf|mskn|msko|msk|msl|"
+    r"msm|msnk|msnu|msn|mso|msp|msqm|mst|ms(?!q)|mtm|mt(?![m|ide])|"
+    r"(?<![2s|l|la|ga])m[1-9]|na|nb|nkms|nkm|nkp|nks|nk|"
+    r"nmks|nmk|nmls|nm|no|np|nq|nsk|nso|ns|(?<!m)n\d|(?<!l)oa|ob|ok|"
+    r"ojm|oj|omg|om(?![0|ega])|ook|oop|oo\d|opk|opq|op|oq|os|"
+    r"(?<![rh|o|s|tpx])o\d|pjrho|pk|pmn|pm|po|pqo|(?<![al|e])p\d|qj|"
+    r"qk|qms|qm|qp|qs|q\d|rp|r\d|(?<!s)sa|sf|skm|skn|(?<![ma])sk|"
+    r"sl(?!ev)|smk|smn|sm|snk|snmk|snm|snu|sn|so|sp|(?<!m)sq|ssa|sta|"
+    r"st(?!a)|(?<![ep|fe|m|mn|mk])s\d|ta|tk|(?<![curren|be])t\d|z\d"
+)
+# compile regular expression for compound tides
+_compound_rx = re.compile(_patterns, re.IGNORECASE)
+# full regular expression pattern for extracting complex and compound
+# constituents with GOT prime nomenclature for 3rd degree terms
+_cases_rx = re.compile(
+    r"(\d+)?(\(\w+\))?(\+|\-|\')?(node|alpha|beta|chi|"
+    r"delta|eps|eta|gamma|lambda|muo|mu|nu|pi|psi|phi|rho|sigma|tau|"
+    r"theta|ups|zeta|e|f|jk|jo|jp|jq|j|kb|kjq|kj|kmsn|km|kn|ko|kpq|"
+    r"kp|kq|kso|ks|k|lb|l|ma|mb|mfa|mfb|mfn|mf|mkj|mkl|mknu|mkn|mkp|"
+    r"mks|mk|mlns|mls|ml|mmun|mm|mnks|mnk|mnls|mnm|mno|mnp|mns|mnus|"
+    r"mnu|mn|mop|moq|mo|mpq|mp|mq|mr|msfa|msfb|msf|mskn|msko|msk|msl|"
+    r"msm|msnk|msnu|msn|mso|msp|msqm|mst|ms|mtm|mt|m|na|nb|nkms|nkm|"
+    r"nkp|nks|nk|nmks|nmk|nmls|nm|no|np|nq|nsk|nso|ns|n|oa|ob|ok|ojm|"
+    r"oj|omg|om|ook|oop|oo|opk|opq|op|oq|os|o|pjrho|pk|pmn|pm|po|pqo|p|"
+    r"qj|qk|qms|qm|qp|qs|q|rp|r|sa|sf|skm|skn|sk|sl|smk|smn|sm|snk|"
+    r"snmk|snm|snu|sn|so|sp|sq|ssa|sta|st|s|ta|tk|t|z)?(\d+)?(\(\w+\))?"
+    r"(\d+)?(\+\+|\+|\-\-|\-|a|b|k|m|nk|ns|n|r|s)?(\d+)?(\')?",
+    re.IGNORECASE,
+)
+
+
+# names of constituents in the table of Doodson coefficients
+_constituent_names = frozenset(_load_coefficients(_coefficients_table))
+# known cases for remapping from different naming conventions
+_remapping = {
+    "2n": "2n2",
+    "alp1": "alpha1",
+    "alp2": "alpha2",
+    "bet1": "beta1",
+    "bet2": "beta2",
+    "del2": "delta2",
+    "e2": "eps2",
+    "ep2": "eps2",
+    "gam2": "gamma2",
+    "la2": "lambda2",
+    "lam2": "lambda2",
+    "lm2": "lambda2",
+    "msq": "msqm",
+    "omega0": "node",
+    "om0": "node",
+    "rho": "rho1",
+    "sgm": "sigma1",
+    "sig1": "sigma1",
+    "the": "theta1",
+    "the1": "theta1",
+}
+
+
+@functools.lru_cache(maxsize=256)
 def _parse_name(constituent: str) -> str:
     """
     Parses for tidal constituents using regular expressions and
@@ -2451,156 +2639,26 @@ def _parse_name(constituent: str) -> str:
     constituent: str
         Text containing the name of a tidal constituent
     """
-    # list of tidal constituents to search for in the input string
-    # include negative look-behind and look-ahead for complex cases
-    cindex = [
-        "z0",
-        "node",
-        "sa",
-        "ssa",
-        "sta",
-        "msqm",
-        "mtm",
-        r"mf(?![a|b|n])",
-        r"mm(?![un])",
-        r"msf(?![a|b])",
-        r"mt(?![m|ide])",
-        "2q1",
-        "alpha1",
-        "beta1",
-        "chi1",
-        "j1",
-        "psi1",
-        "phi1",
-        "pi1",
-        "sigma1",
-        "rho1",
-        "tau1",
-        "theta1",
-        "oo1",
-        "so1",
-        "ups1",
-        "q1",
-        "s1",
-        r"(?<!rh)o1(?!n)",
-        r"m1(?![a|b])",
-        r"(?<![al|oo|])p1",
-        r"k1(?!n)",
-        "2sm2",
-        "alpha2",
-        "beta2",
-        "delta2",
-        "eps2",
-        "gamma2",
-        "k2",
-        "lambda2",
-        "m2a",
-        "m2b",
-        "mks2",
-        "mns2",
-        "mu2",
-        "r2",
-        r"(?<![ms])2n2",
-        r"(?<![b|z])eta2",
-        r"(?<!de)l2(?![a|b])",
-        r"(?<![ga|la])m2(?![a|b|n])",
-        r"(?<![mmu|ms])n2",
-        r"(?<![ms])nu2",
-        r"(?<![mn|mk|mnu|ep])s2(?![0|r|m])",
-        r"(?<![be])t2",
-        "m3",
-        "mk3",
-        "mk4",
-        "mn4",
-        "ms4",
-        "s3",
-        "m4",
-        "n4",
-        "s4",
-        "s5",
-        "m6",
-        "s6",
-        "s7",
-        "s8",
-        "m8",
-    ]
-    # compile regular expression
-    # adding GOT prime nomenclature for 3rd degree constituents
-    rx = re.compile(
-        r"(?<![\d|j|k|l|m|n|o|p|q|r|s|t|u])(?<![|\(|\)])("
-        + r"|".join(cindex)
-        + r")(?![|\(|\)])(?![\d])(?![+|-])(\')?",
-        re.IGNORECASE,
-    )
+    # check if constituent is an exact tabulated or remapped name
+    name = constituent.lower()
+    if name in _constituent_names:
+        return name
+    elif name in _remapping:
+        return _remapping[name]
     # check if tide model is a simple regex case
-    if rx.search(constituent):
-        return "".join(rx.findall(constituent)[0]).lower()
-    # regular expression pattern for finding constituent names
-    # include negative look-behind and look-ahead for complex cases
-    patterns = (
-        r"node|alpha|beta|chi|delta|eps|eta|gamma|lambda|muo|mu|"
-        r"nu|pi|psi|phi|rho\d|sigma|tau|theta|ups|zeta|e3|f\d|jk|jo|jp|"
-        r"jq|j|kb|kjq|kj|kmsn|km|kn|ko|kpq|kp|kq|kso|ks|k\d|lb|"
-        r"(?<!de)l\d|ma(?![sk])|mb|mfa|mfb|mfn|mf|mkj|mkl|mknu|mkn|mkp|"
-        r"mks|mk|mlns|mls|ml|mmun|mm|mnks|mnk|mnls|mnm|mno|mnp|mns|mnus|"
-        r"mnu|mn|mop|moq|mo|mpq|mp|mq|mr|msfa|msfb|msf|mskn|msko|msk|msl|"
-        r"msm|msnk|msnu|msn|mso|msp|msqm|mst|ms(?!q)|mtm|mt(?![m|ide])|"
-        r"(?<![2s|l|la|ga])m[1-9]|na|nb|nkms|nkm|nkp|nks|nk|"
-        r"nmks|nmk|nmls|nm|no|np|nq|nsk|nso|ns|(?<!m)n\d|(?<!l)oa|ob|ok|"
-        r"ojm|oj|omg|om(?![0|ega])|ook|oop|oo\d|opk|opq|op|oq|os|"
-        r"(?<![rh|o|s|tpx])o\d|pjrho|pk|pmn|pm|po|pqo|(?<![al|e])p\d|qj|"
-        r"qk|qms|qm|qp|qs|q\d|rp|r\d|(?<!s)sa|sf|skm|skn|(?<![ma])sk|"
-        r"sl(?!ev)|smk|smn|sm|snk|snmk|snm|snu|sn|so|sp|(?<!m)sq|ssa|sta|"
-        r"st(?!a)|(?<![ep|fe|m|mn|mk])s\d|ta|tk|(?<![curren|be])t\d|z\d"
-    )
-    # full regular expression pattern for extracting complex and compound
-    # constituents with GOT prime nomenclature for 3rd degree terms
-    cases = re.compile(
-        r"(\d+)?(\(\w+\))?(\+|\-|\')?(node|alpha|beta|chi|"
-        r"delta|eps|eta|gamma|lambda|muo|mu|nu|pi|psi|phi|rho|sigma|tau|"
-        r"theta|ups|zeta|e|f|jk|jo|jp|jq|j|kb|kjq|kj|kmsn|km|kn|ko|kpq|"
-        r"kp|kq|kso|ks|k|lb|l|ma|mb|mfa|mfb|mfn|mf|mkj|mkl|mknu|mkn|mkp|"
-        r"mks|mk|mlns|mls|ml|mmun|mm|mnks|mnk|mnls|mnm|mno|mnp|mns|mnus|"
-        r"mnu|mn|mop|moq|mo|mpq|mp|mq|mr|msfa|msfb|msf|mskn|msko|msk|msl|"
-        r"msm|msnk|msnu|msn|mso|msp|msqm|mst|ms|mtm|mt|m|na|nb|nkms|nkm|"
-        r"nkp|nks|nk|nmks|nmk|nmls|nm|no|np|nq|nsk|nso|ns|n|oa|ob|ok|ojm|"
-        r"oj|omg|om|ook|oop|oo|opk|opq|op|oq|os|o|pjrho|pk|pmn|pm|po|pqo|p|"
-        r"qj|qk|qms|qm|qp|qs|q|rp|r|sa|sf|skm|skn|sk|sl|smk|smn|sm|snk|"
-        r"snmk|snm|snu|sn|so|sp|sq|ssa|sta|st|s|ta|tk|t|z)?(\d+)?(\(\w+\))?"
-        r"(\d+)?(\+\+|\+|\-\-|\-|a|b|k|m|nk|ns|n|r|s)?(\d+)?(\')?",
-        re.IGNORECASE,
-    )
+    match = _simple_rx.search(constituent)
+    if match:
+        return "".join(match.groups(default="")).lower()
     # check if tide model is a regex case for compound tides
-    if re.search(patterns, constituent, re.IGNORECASE):
-        return "".join(cases.findall(constituent)[0]).lower()
-    # known cases for remapping from different naming conventions
-    mapping = [
-        ("2n", "2n2"),
-        ("alp1", "alpha1"),
-        ("alp2", "alpha2"),
-        ("bet1", "beta1"),
-        ("bet2", "beta2"),
-        ("del2", "delta2"),
-        ("e2", "eps2"),
-        ("ep2", "eps2"),
-        ("gam2", "gamma2"),
-        ("la2", "lambda2"),
-        ("lam2", "lambda2"),
-        ("lm2", "lambda2"),
-        ("msq", "msqm"),
-        ("omega0", "node"),
-        ("om0", "node"),
-        ("rho", "rho1"),
-        ("sgm", "sigma1"),
-        ("sig1", "sigma1"),
-        ("the", "theta1"),
-        ("the1", "theta1"),
-    ]
+    if _compound_rx.search(constituent):
+        match = _cases_rx.search(constituent)
+        return "".join(match.groups(default="")).lower()
     # iterate over known remapped cases
-    for m in mapping:
+    # using a case-insensitive comparison
+    for key, value in _remapping.items():
         # check if tide model is a remapped case
-        if m[0] in constituent.lower():
-            return m[1]
+        if key in name:
+            return value
     # raise a value error if not found
     raise ValueError(f"Constituent not found in {constituent}")
 
@@ -2654,8 +2712,7 @@ def _to_constituent_id(coef: list | np.ndarray, **kwargs):
     # n: mean longitude of ascending lunar node
     # pp: mean longitude of solar perigee
     # k: 90-degree phase
-    with table.open(mode="r", encoding="utf8") as fid:
-        coefficients = json.load(fid)
+    coefficients = dict(_load_coefficients(table))
 
     # use climatologically affected terms without p'
     # following Pugh and Woodworth (2014)
@@ -2707,9 +2764,10 @@ def _to_doodson_number(coef: list | np.ndarray, **kwargs):
     # add 5 to values following Doodson convention (prevent negatives)
     coef[1:] += 5
     # check for unsupported constituents
-    if (np.any(coef < 0) or np.any(coef > 12)) and kwargs["raise_error"]:
+    unsupported = np.any(coef < 0) or np.any(coef > 12)
+    if unsupported and kwargs["raise_error"]:
         raise ValueError("Unsupported constituent")
-    elif np.any(coef < 0) or np.any(coef > 12):
+    elif unsupported:
         return None
     elif np.any(coef >= 10) and np.all(coef <= 12):
         # replace 10 to 12 with Doodson convention values
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 fetch_arcticdata.py
-Written by Tyler Sutterley (12/2025)
+Written by Tyler Sutterley (10/2026)
 Download Arctic Ocean Tide Models from the NSF ArcticData archive
 
 AODTM-5: https://arcticdata.io/catalog/view/doi:10.18739/A2901ZG3N
@@ -33,6 +33,7 @@ PROGRAM DEPENDENCIES:
     utilities.py: download and management utilities for syncing files
 
 UPDATE HISTORY:
+    Updated 10/2026: compile regular expression for model files once
     Updated 12/2025: use URL class to build and operate on URLs
     Updated 10/2025: change default directory for tide models to cache
     Updated 09/2025: renamed module and function to fetch_arcticdata
@@ -61,6 +62,8 @@ import pyTMD.utilities
 
 # default data directory for tide models
 _default_directory = pyTMD.utilities.get_cache_path()
+# regular expression for model files within the zip file
+_model_rx = re.compile(r"(grid|h[0]?|UV[0]?|Model|xy)_(.*?)", re.VERBOSE)
 
 
 # PURPOSE: Download Arctic Ocean Tide Models from the NSF ArcticData archive
@@ -125,8 +128,7 @@ def fetch_arcticdata(
     logger.info(f"{URL} -->\n")
     zfile = zipfile.ZipFile(URL.get(timeout=timeout))
     # find model files within zip file
-    rx = re.compile(r"(grid|h[0]?|UV[0]?|Model|xy)_(.*?)", re.VERBOSE)
-    members = [m for m in zfile.filelist if rx.search(m.filename)]
+    members = [m for m in zfile.filelist if _model_rx.search(m.filename)]
     # extract each member
     for m in members:
         # strip directories from member filename
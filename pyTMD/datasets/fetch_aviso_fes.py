@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 fetch_aviso_fes.py
-Written by Tyler Sutterley (03/2026)
+Written by Tyler Sutterley (10/2026)
 Downloads the FES (Finite Element Solution) global tide model from AVISO
 Decompresses the model tar files into the constituent files and auxiliary files
     https://www.aviso.altimetry.fr/data/products/auxiliary-products/
@@ -43,6 +43,8 @@ PROGRAM DEPENDENCIES:
     utilities.py: download and management utilities for syncing files
 
 UPDATE HISTORY:
+    Updated 10/2026: compress output files at the default zlib level
+        use shared function for opening compressed output files
     Updated 03/2026: added option to download FES2022_native
     Updated 12/2025: simplify function call signatures
     Updated 10/2025: change default directory for tide models to cache
@@ -78,7 +80,6 @@ import sys
 import os
 import io
 import re
-import gzip
 import lzma
 import netrc
 import shutil
@@ -472,8 +473,8 @@ def _ftp_download(
     """
     # remote and local directory for data product
     remote_file = posixpath.join("auxiliary", "tide_model", *remote_path)
-    # if compressing the output file
-    opener = gzip.open if compressed else open
+    # if compressing the output files
+    opener = pyTMD.utilities.gzip_open if compressed else open
 
     # Printing files transferred
     remote_ftp_url = posixpath.join("ftp://", f.host, remote_file)
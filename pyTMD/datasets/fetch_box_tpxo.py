@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 fetch_box_tpxo.py
-Written by Tyler Sutterley (01/2026)
+Written by Tyler Sutterley (10/2026)
 Downloads TPXO ATLAS tide models from the box file sharing service
 
 Need to generate a user token that has sufficient permissions to
@@ -32,6 +32,8 @@ REFERENCE:
     https://developer.box.com/guides/
 
 UPDATE HISTORY:
+    Updated 10/2026: compress output files at the default zlib level
+        use shared function for opening compressed output files
     Updated 01/2026: fixed the box token to allow file downloads
     Updated 12/2025: use URL class to build and operate on URLs
     Updated 11/2025: use from_database to access model parameters
@@ -55,7 +57,6 @@ from __future__ import print_function
 import os
 import re
 import ssl
-import gzip
 import json
 import shutil
 import logging
@@ -149,8 +150,8 @@ def fetch_box_tpxo(
     localpath = m["z"].model_file[0].parent
     # create output directory if non-existent
     localpath.mkdir(mode=mode, parents=True, exist_ok=True)
-    # if compressing the output file
-    opener = gzip.open if compressed else open
+    # if compressing the output files
+    opener = pyTMD.utilities.gzip_open if compressed else open
 
     # regular expression pattern for files of interest
     regex_patterns = []
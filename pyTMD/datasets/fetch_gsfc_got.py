@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 fetch_gsfc_got.py
-Written by Tyler Sutterley (12/2025)
+Written by Tyler Sutterley (10/2026)
 Download Goddard Ocean Tide (GOT) models
 
 CALLING SEQUENCE:
@@ -32,6 +32,8 @@ PROGRAM DEPENDENCIES:
     utilities.py: download and management utilities for syncing files
 
 UPDATE HISTORY:
+    Updated 10/2026: compress output files at the default zlib level
+        use shared function for opening compressed output files
     Updated 12/2025: use URL class to build and operate on URLs
         simplify function call signatures
     Updated 10/2025: change default directory for tide models to cache
@@ -48,7 +50,6 @@ from __future__ import print_function, annotations
 
 import os
 import re
-import gzip
 import shutil
 import logging
 import pathlib
@@ -93,7 +94,7 @@ def fetch_gsfc_got(
     # create logger for verbosity level
     logger = pyTMD.utilities.build_logger(__name__, level=logging.INFO)
     # if compressing the output files
-    opener = gzip.open if compressed else open
+    opener = pyTMD.utilities.gzip_open if compressed else open
 
     # url for each tide model tarfile
     PATH = {}
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 fetch_test_data.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 Download files necessary to run the test suite
 
 CALLING SEQUENCE:
@@ -22,6 +22,8 @@ PROGRAM DEPENDENCIES:
     utilities.py: download and management utilities for syncing files
 
 UPDATE HISTORY:
+    Updated 10/2026: download files concurrently using a pool of threads
+        use a 1 MiB buffer when writing downloaded files to disk
     Updated 04/2026: check if needing to include algorithm in the hash
     Updated 03/2026: try multiple providers for fetching data
     Updated 12/2025: use URL class to build and operate on URLs
@@ -38,6 +40,7 @@ import logging
 import pathlib
 import zipfile
 import argparse
+import concurrent.futures
 import pyTMD.utilities
 
 # default working data directory for tide models
@@ -91,9 +94,10 @@ def _figshare(
     article: str = "30260326",
     timeout: int | None = None,
     context: ssl.SSLContext = _default_ssl_context,
-    chunk: int = 16384,
+    chunk: int = 1048576,
     logger: logging.Logger | None = None,
     mode: oct = 0o775,
+    max_workers: int | None = 4,
     **kwargs,
 ):
     """
@@ -109,58 +113,36 @@ def _figshare(
         Timeout in seconds for blocking operations
     context: obj, default pyTMD.utilities._default_ssl_context
         ``SSL`` context for ``urllib`` opener object
-    chunk: int, default 16384
+    chunk: int, default 1048576
         Chunk size for transfer encoding
     logger: logging.logger object
         Logger for outputting file transfer information
     mode: oct, default 0o775
         Permissions mode of output local file
+    max_workers: int or NoneType, default 4
+        Maximum number of concurrent downloads
     """
     # figshare API host
     HOST = pyTMD.utilities.URL(_figshare_api_url)
     articles_api = HOST.joinpath("articles", article)
     # Create and submit request and load JSON response
     response = articles_api.load(timeout=timeout, context=context)
-    # for each file in the JSON response
-    for f in response["files"]:
-        # check if needing to include algorithm in the hash comparison
-        include_algorithm = re.match(r"md5\:", f["supplied_md5"])
-        # check if file already exists by matching MD5 checksums
-        local_file = directory.joinpath(f["name"])
-        original_md5 = pyTMD.utilities.get_hash(
-            local_file, include_algorithm=include_algorithm
-        )
-        # skip download if checksums match
-        if original_md5 == f["supplied_md5"]:
-            continue
-        # download url for remote file
-        download = pyTMD.utilities.URL(f["download_url"])
-        # output file information
-        logger.info(download.urlname)
-        # get remote file as a byte-stream
-        remote_buffer = download.get(timeout=timeout, context=context)
-        # verify MD5 checksums
-        computed_md5 = pyTMD.utilities.get_hash(
-            remote_buffer, include_algorithm=include_algorithm
-        )
-        # raise exception if checksums do not match
-        if computed_md5 != f["supplied_md5"]:
-            raise Exception(f"Checksum mismatch: {download.urlname}")
-        # download file or extract files from zip
-        if pathlib.Path(f["name"]).suffix == ".zip":
-            # extract the zip file into the local directory
-            with zipfile.ZipFile(remote_buffer) as z:
-                # extract each file and set permissions
-                for member in z.filelist:
-                    z.extract(path=directory, member=member)
-                    local_file = directory.joinpath(member.filename)
-                    local_file.chmod(mode=mode)
-        else:
-            # write the file to the local directory
-            with local_file.open(mode="wb") as f:
-                shutil.copyfileobj(remote_buffer, f, chunk)
-            # change the permissions mode
-            local_file.chmod(mode=mode)
+    # list of remote files with their checksums
+    files = [
+        (f["download_url"], f["name"], f["supplied_md5"])
+        for f in response["files"]
+    ]
+    # download files in parallel
+    _fetch_files(
+        files,
+        directory=directory,
+        timeout=timeout,
+        context=context,
+        chunk=chunk,
+        logger=logger,
+        mode=mode,
+        max_workers=max_workers,
+    )
 
 
 # PURPOSE: download data files from zenodo
@@ -169,9 +151,10 @@ def _zenodo(
     record: str = "18091740",
     timeout: int | None = None,
     context: ssl.SSLContext = _default_ssl_context,
-    chunk: int = 16384,
+    chunk: int = 1048576,
     logger: logging.Logger | None = None,
     mode: oct = 0o775,
+    max_workers: int | None = 4,
     **kwargs,
 ):
     """
@@ -187,12 +170,14 @@ def _zenodo(
         Timeout in seconds for blocking operations
     context: obj, default pyTMD.utilities._default_ssl_context
         ``SSL`` context for ``urllib`` opener object
-    chunk: int, default 16384
+    chunk: int, default 1048576
         Chunk size for transfer encoding
     logger: logging.logger object
         Logger for outputting file transfer information
     mode: oct, default 0o775
         Permissions mode of output local file
+    max_workers: int or NoneType, default 4
+        Maximum number of concurrent downloads
     """
     # zenodo API host
     HOST = pyTMD.utilities.URL(_zenodo_api_url)
@@ -204,46 +189,135 @@ def _zenodo(
     deposit_api = HOST.joinpath("deposit", "depositions", version, "files")
     # Create and submit request and load JSON response
     deposit_response = deposit_api.load(timeout=timeout, context=context)
-    # for each file in the JSON response for deposits
-    for f in deposit_response:
-        # check if file already exists by matching MD5 checksums
-        local_file = directory.joinpath(f["filename"])
-        # check if needing to include algorithm in the hash comparison
-        include_algorithm = re.match(r"md5\:", f["checksum"])
-        original_md5 = pyTMD.utilities.get_hash(
-            local_file, include_algorithm=include_algorithm
-        )
-        # skip download if checksums match
-        if original_md5 == f["checksum"]:
-            continue
-        # download url for remote file
-        download = pyTMD.utilities.URL(f["links"]["download"])
-        # output file information
+    # list of remote files with their checksums
+    files = [
+        (f["links"]["download"], f["filename"], f["checksum"])
+        for f in deposit_response
+    ]
+    # download files in parallel
+    _fetch_files(
+        files,
+        directory=directory,
+        timeout=timeout,
+        context=context,
+        chunk=chunk,
+        logger=logger,
+        mode=mode,
+        max_workers=max_workers,
+    )
+
+
+# PURPOSE: download a list of files using a pool of threads
+def _fetch_files(
+    files: list,
+    directory: str | pathlib.Path = _default_directory,
+    max_workers: int | None = 4,
+    **kwargs,
+):
+    """
+    Download a list of files concurrently using a pool of threads
+
+    Parameters
+    ----------
+    files: list
+        Remote urls, local filenames and checksums of files
+    directory: str or pathlib.Path
+        Download directory
+    max_workers: int or NoneType, default 4
+        Maximum number of concurrent downloads
+    kwargs: dict
+        Keyword arguments for ``_fetch_file``
+    """
+    # skip creating a thread pool if there are no files
+    if not files:
+        return
+    # number of threads to use for downloading files
+    max_workers = min(max_workers or len(files), len(files))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [
+            executor.submit(_fetch_file, *f, directory=directory, **kwargs)
+            for f in files
+        ]
+        # raise any exceptions from the downloads
+        for future in concurrent.futures.as_completed(futures):
+            future.result()
+
+
+# PURPOSE: download a single file and verify its checksum
+def _fetch_file(
+    url: str,
+    filename: str,
+    checksum: str,
+    directory: str | pathlib.Path = _default_directory,
+    timeout: int | None = None,
+    context: ssl.SSLContext = _default_ssl_context,
+    chunk: int = 1048576,
+    logger: logging.Logger | None = None,
+    mode: oct = 0o775,
+):
+    """
+    Download a file if the local checksum does not match the remote
+
+    Parameters
+    ----------
+    url: str
+        Remote url of the file
+    filename: str
+        Local filename of the file
+    checksum: str
+        Remote checksum of the file
+    directory: str or pathlib.Path
+        Download directory
+    timeout: int or NoneType, default None
+        Timeout in seconds for blocking operations
+    context: obj, default pyTMD.utilities._default_ssl_context
+        ``SSL`` context for ``urllib`` opener object
+    chunk: int, default 1048576
+        Chunk size for transfer encoding
+    logger: logging.logger object
+        Logger for outputting file transfer information
+    mode: oct, default 0o775
+        Permissions mode of output local file
+    """
+    # check if file already exists by matching MD5 checksums
+    local_file = directory.joinpath(filename)
+    # check if needing to include algorithm in the hash comparison
+    include_algorithm = re.match(r"md5\:", checksum)
+    original_md5 = pyTMD.utilities.get_hash(
+        local_file, include_algorithm=include_algorithm
+    )
+    # skip download if checksums match
+    if original_md5 == checksum:
+        return
+    # download url for remote file
+    download = pyTMD.utilities.URL(url)
+    # output file information
+    if logger is not None:
         logger.info(download.urlname)
-        # get remote file as a byte-stream
-        remote_buffer = download.get(timeout=timeout, context=context)
-        # verify MD5 checksums
-        computed_md5 = pyTMD.utilities.get_hash(
-            remote_buffer, include_algorithm=include_algorithm
-        )
-        # raise exception if checksums do not match
-        if computed_md5 != f["checksum"]:
-            raise Exception(f"Checksum mismatch: {download.urlname}")
-        # download file or extract files from zip
-        if pathlib.Path(f["filename"]).suffix == ".zip":
-            # extract the zip file into the local directory
-            with zipfile.ZipFile(remote_buffer) as z:
-                # extract each file and set permissions
-                for member in z.filelist:
-                    z.extract(path=directory, member=member)
-                    local_file = directory.joinpath(member.filename)
-                    local_file.chmod(mode=mode)
-        else:
-            # write the file to the local directory
-            with local_file.open(mode="wb") as f:
-                shutil.copyfileobj(remote_buffer, f, chunk)
-            # change the permissions mode
-            local_file.chmod(mode=mode)
+    # get remote file as a byte-stream
+    remote_buffer = download.get(timeout=timeout, context=context)
+    # verify MD5 checksums
+    computed_md5 = pyTMD.utilities.get_hash(
+        remote_buffer, include_algorithm=include_algorithm
+    )
+    # raise exception if checksums do not match
+    if computed_md5 != checksum:
+        raise Exception(f"Checksum mismatch: {download.urlname}")
+    # download file or extract files from zip
+    if pathlib.Path(filename).suffix == ".zip":
+        # extract the zip file into the local directory
+        with zipfile.ZipFile(remote_buffer) as z:
+            # extract each file and set permissions
+            for member in z.filelist:
+                z.extract(path=directory, member=member)
+                local_file = directory.joinpath(member.filename)
+                local_file.chmod(mode=mode)
+    else:
+        # write the file to the local directory
+        with local_file.open(mode="wb") as f:
+            shutil.copyfileobj(remote_buffer, f, chunk)
+        # change the permissions mode
+        local_file.chmod(mode=mode)
 
 
 # PURPOSE: create argument parser
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 reduce_otis.py
-Written by Tyler Sutterley (03/2026)
+Written by Tyler Sutterley (10/2026)
 Read OTIS-format tidal files and reduce to a regional subset
 
 COMMAND LINE OPTIONS:
@@ -29,6 +29,7 @@ PROGRAM DEPENDENCIES:
     utilities.py: download and management utilities for syncing files
 
 UPDATE HISTORY:
+    Updated 10/2026: calculate the cropping bounds once for all datasets
     Updated 03/2026: use lower case for input function arguments
     Updated 12/2025: simplify function call signatures
     Updated 11/2025: use new xarray file access protocols for OTIS files
@@ -131,13 +132,15 @@ def reduce_otis(
     # convert bounds to model coordinates
     # bounds is in the form [xmin,xmax,ymin,ymax]
     x, y = dsg.tmd.transform_as(bounds[:2], bounds[2:], crs=crs)
+    # calculate the cropping bounds once for all datasets
+    extent = [x.min(), x.max(), y.min(), y.max()]
     # merge bathymetry and elevation datasets
     ds = xr.merge([dsg, dsz], compat="override")
     # crop datasets and create new datatree
     dtree = xr.DataTree()
-    dtree["z"] = ds.tmd.crop([x.min(), x.max(), y.min(), y.max()])
-    dtree["U"] = dsu.tmd.crop([x.min(), x.max(), y.min(), y.max()])
-    dtree["V"] = dsv.tmd.crop([x.min(), x.max(), y.min(), y.max()])
+    dtree["z"] = ds.tmd.crop(extent)
+    dtree["U"] = dsu.tmd.crop(extent)
+    dtree["V"] = dsv.tmd.crop(extent)
 
     # create unique filenames for reduced datasets
     new_grid_file = _unique_filename(m["z"].grid_file)
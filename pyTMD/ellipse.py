@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 ellipse.py
-Written by Tyler Sutterley (08/2025)
+Written by Tyler Sutterley (10/2026)
 Expresses the amplitudes and phases for the u and v components in terms of
     four ellipse parameters using Foreman's formula
 
@@ -11,6 +11,7 @@ REFERENCE:
         https://doi.org/10.1016/0309-1708(89)90017-1
 
 UPDATE HISTORY:
+    Updated 10/2026: evaluate ellipse trigonometric functions once
     Updated 08/2025: use divmod to adjust orientation of ellipse
     Updated 06/2025: added function to calculate x and y coordinates of ellipse
     Updated 01/2024: added inverse function to get currents from parameters
@@ -174,15 +175,18 @@ def _xy(
     else:
         # use a full rotation
         th = np.linspace(0, 2 * np.pi, kwargs["N"])
+    # evaluate each trigonometric function once
+    cos_th, sin_th = np.cos(th), np.sin(th)
+    cos_phi, sin_phi = np.cos(phi), np.sin(phi)
     # calculate x and y coordinates
     x = (
         kwargs["xy"][0]
-        + major * np.cos(th) * np.cos(phi)
-        - minor * np.sin(th) * np.sin(phi)
+        + major * cos_th * cos_phi
+        - minor * sin_th * sin_phi
     )
     y = (
         kwargs["xy"][1]
-        + major * np.cos(th) * np.sin(phi)
-        + minor * np.sin(th) * np.cos(phi)
+        + major * cos_th * sin_phi
+        + minor * sin_th * cos_phi
     )
     return (x, y)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 interpolate.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Interpolators for spatial data
 
 PYTHON DEPENDENCIES:
@@ -14,6 +14,9 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: apply triangle mask once after barycentric summation
+        extract valid values once when inpainting
+        find neighbors within the cutoff distance once when extrapolating
     Updated 06/2026: added spherical linear interpolation (slerp) function
         minor refactor of inpaint function to rename some variables
     Updated 05/2026: added parameters to allow for extrapolation with
@@ -176,9 +179,12 @@ def inpaint(
         raise ValueError("No valid values found")
 
     # dimensions of input grid
-    ny, nx = np.shape(zs)
+    ny, nx = zs.shape
     # mask of invalid values
     masked = np.logical_not(W)
+    # extract valid original values once
+    # (boolean indexing already returns a copy)
+    valid = zs[W]
 
     # convert to Cartesian coordinates for distance calculations
     xgrid, ygrid = np.meshgrid(xs, ys)
@@ -195,16 +201,16 @@ def inpaint(
 
     # copy valid original values
     z0 = np.zeros((ny, nx), dtype=zs.dtype)
-    z0[W] = np.copy(zs[W])
+    z0[W] = valid
     # copy nearest neighbors
-    z0[masked] = zs[W][ii]
+    z0[masked] = valid[ii]
     # return nearest neighbors interpolation
     if N == 0:
         return z0
 
     # copy data to new array with 0 values for mask
     ZI = np.zeros((ny, nx), dtype=zs.dtype)
-    ZI[W] = np.copy(z0[W])
+    ZI[W] = valid
 
     # calculate lambda function
     L = np.zeros((ny, nx))
@@ -224,7 +230,7 @@ def inpaint(
         z0 = epsilon * idiscos + (1.0 - epsilon) * z0
 
     # reset original values
-    z0[W] = np.copy(zs[W])
+    z0[W] = valid
     # return the inpainted grid
     return z0
 
@@ -431,13 +437,15 @@ def _query_tree(
     data.mask = np.ones((npts), dtype=bool)
     # initially set all data to fill value
     data.data[:] = data.fill_value
+    # neighbors beyond the cutoff distance are returned as infinite
+    valid = np.isfinite(dd)
     # spatially extrapolate using nearest neighbors or IDW
-    if k == 1 and np.any(np.isfinite(dd)):
+    if k == 1 and np.any(valid):
         # spatially extrapolate using nearest neighbors
-        (ind,) = np.nonzero(np.isfinite(dd))
+        (ind,) = np.nonzero(valid)
         data.data[ind] = flattened[ii[ind]]
         data.mask[ind] = False
-    elif k > 1 and np.any(np.isfinite(dd)):
+    elif k > 1 and np.any(valid):
         # clip distances to handle cases where points overlap
         # this can lead to infinite weights in the IDW extrapolation
         dd = np.clip(dd, a_min=1e-10, a_max=None)
@@ -452,7 +460,7 @@ def _query_tree(
         w = power_inverse_distance / np.broadcast_to(s[:, None], (npts, k))
         # spatially extrapolate using inverse distance weighting
         data.data[:] = np.nansum(w * flattened[ii], axis=1)
-        data.mask[:] = np.logical_not(np.isfinite(dd).any(axis=1))
+        data.mask[:] = np.logical_not(valid.any(axis=1))
     # return extrapolated values
     return xr.DataArray(data)
 
@@ -507,7 +515,9 @@ def barycentric(
     N = _shape_functions(xi, eta, order)
     # calculate interpolation
     for p, sf in enumerate(N):
-        data += sf * valid * ze[..., p]
+        data += sf * ze[..., p]
+    # mask points outside of the triangle in a single pass
+    data *= valid
     # return the interpolated value
     return xr.DataArray(data)
 
@@ -1,15 +1,35 @@
 #!/usr/bin/env python
 """
 ATLAS.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 
 Reads netCDF4 ATLAS tidal solutions provided by Oregon State University
 
 PYTHON DEPENDENCIES:
+    numpy: Scientific Computing Tools For Python
+        https://numpy.org
+        https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
     xarray: N-D labeled arrays and datasets in Python
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: add chunks argument for reading ATLAS grid files
+        use xarray.open_mfdataset for opening files in parallel
+        skip coordinate alignment when merging constituent datasets
+        transpose complex constituents once after combining components
+        keep single precision components as complex64 constituents
+        only decode the components of the requested variable group
+        mask invalid bathymetry values without broadcasting the dataset
+        write constituent files together using xarray.save_mfdataset
+        calculate the reciprocal of bathymetry once when converting currents
+        decode constituent character arrays without an intermediate copy
+        decompress gzipped files into memory before reading with xarray
+        convert transports to currents in place at model precision
+        set units for both real and imaginary components when writing
+        only mask and scale the real and imaginary components
+        use byte shuffling and faster deflate level for netCDF4 output
+        decompress and read compressed files in parallel using dask
+        open HDF5-based netCDF4 files directly with h5netcdf
     Updated 04/2026: added lineage attributes to save model filename(s)
     Updated 02/2026: make dataset and datatree accessors for ATLAS
         be subaccessors from dataset module
@@ -60,9 +80,12 @@ UPDATE HISTORY:
 
 from __future__ import annotations
 
+import io
 import gzip
 import pathlib
+import functools
 import datetime
+import numpy as np
 import xarray as xr
 import pyTMD.version
 import pyTMD.utilities
@@ -85,6 +108,13 @@ __all__ = [
     "ATLASDataTree",
 ]
 
+# variables in ATLAS transport files that are not needed for each group
+_drop_variables = dict(
+    z=None,
+    u=["vRe", "vIm", "lon_v", "lat_v"],
+    v=["uRe", "uIm", "lon_u", "lat_u"],
+)
+
 
 def open_dataset(
     model_files: list[str] | list[pathlib.Path],
@@ -115,13 +145,27 @@ def open_dataset(
     ds2 = open_mfdataset(model_files, **kwargs)
     # convert transports to currents if necessary
     if kwargs["group"] in ("u", "v"):
+        # precision of the constituents (avoids promoting complex64)
+        constituents = ds2.tmd.constituents
+        ctype = np.result_type(*[ds2[c].dtype for c in constituents])
+        # reciprocal of bathymetry (calculated once for all constituents)
+        inverse_depth = 1.0 / ds1["bathymetry"].variable
+        inverse_depth = inverse_depth.astype(np.finfo(ctype).dtype)
+        depth_units = ds1["bathymetry"].tmd.units
         # convert transports to currents and update attributes
-        for c in ds2.tmd.constituents:
-            ds2[c] /= ds1["bathymetry"]
-            units = str(ds2[c].tmd.units / ds1["bathymetry"].tmd.units)
+        # (in place for each constituent to avoid stacked copies)
+        for c in constituents:
+            units = str(ds2[c].tmd.units / depth_units)
+            ds2[c] *= inverse_depth
             ds2[c].attrs["units"] = units
     # merge datasets
-    ds = xr.merge([ds1, ds2], combine_attrs=combine_attrs, compat="override")
+    # grid and constituent files share the same coordinates
+    ds = xr.merge(
+        [ds1, ds2],
+        combine_attrs=combine_attrs,
+        compat="override",
+        join="override",
+    )
     # return xarray dataset
     return ds
 
@@ -140,7 +184,8 @@ def open_mfdataset(
     model_files: list of str or pathlib.Path
         List of ATLAS model files
     parallel: bool, default False
-        Open files in parallel using ``dask.delayed``
+        Open files in parallel using ``xarray.open_mfdataset``
+        (uncompressed) or ``dask.delayed`` (compressed)
     kwargs: dict
         Additional keyword arguments for opening ATLAS files
 
@@ -149,7 +194,36 @@ def open_mfdataset(
     ds: xarray.Dataset
         ATLAS tide model data
     """
-    # merge multiple granules
+    # set default keyword arguments
+    kwargs.setdefault("group", "z")
+    kwargs.setdefault("compressed", None)
+    # check if any files are compressed
+    compressed = kwargs["compressed"] or any(
+        pyTMD.utilities.detect_compression(f) for f in model_files
+    )
+    # read multiple uncompressed granules in parallel using xarray
+    if parallel and dask_available and not compressed:
+        # convert each file to complex constituents as they are opened
+        preprocess = functools.partial(_atlas_to_complex, group=kwargs["group"])
+        ds = xr.open_mfdataset(
+            [pyTMD.utilities.Path(f).resolve() for f in model_files],
+            engine=pyTMD.utilities.detect_engine(model_files[0]),
+            mask_and_scale=False,
+            chunks=kwargs.get("chunks"),
+            drop_variables=_drop_variables.get(kwargs["group"].lower()),
+            parallel=True,
+            preprocess=preprocess,
+            combine="nested",
+            concat_dim=None,
+            data_vars="minimal",
+            coords="minimal",
+            compat="override",
+            join="override",
+            combine_attrs=combine_attrs,
+        )
+        # return xarray dataset
+        return ds
+    # decompress and read files in parallel using dask.delayed
     if parallel and dask_available:
         opener = dask.delayed(open_atlas_dataset)
     else:
@@ -160,7 +234,10 @@ def open_mfdataset(
     if parallel and dask_available:
         (d,) = dask.compute(d)
     # merge datasets
-    ds = xr.merge(d, combine_attrs=combine_attrs, compat="override")
+    # skip index alignment as constituent files share the same coordinates
+    ds = xr.merge(
+        d, combine_attrs=combine_attrs, compat="override", join="override"
+    )
     # return xarray dataset
     return ds
 
@@ -168,6 +245,7 @@ def open_mfdataset(
 def open_atlas_grid(
     input_file: str | pathlib.Path,
     group: str = "z",
+    chunks: int | dict | str | None = None,
     **kwargs,
 ):
     """
@@ -185,6 +263,8 @@ def open_atlas_grid(
             - ``'U'``: zonal depth-averaged transport
             - ``'v'``: meridional currents
             - ``'V'``: meridional depth-averaged transport
+    chunks: int, dict, str, or None, default None
+        Variable chunk sizes for dask [see ``xarray.open_dataset``]
     compressed: bool, default False
         Input file is ``gzip`` compressed
 
@@ -202,11 +282,17 @@ def open_atlas_grid(
         raise FileNotFoundError(f"File not found: {input_file}")
     # read the netCDF4-format file
     if kwargs["compressed"]:
-        # read gzipped netCDF4 file
-        f = gzip.open(input_file, "rb")
-        tmp = xr.open_dataset(f, mask_and_scale=True)
+        # decompress gzipped netCDF4 file into memory
+        with gzip.open(input_file, "rb") as f:
+            fid = io.BytesIO(f.read())
+        tmp = xr.open_dataset(fid, mask_and_scale=True, chunks=chunks)
     else:
-        tmp = xr.open_dataset(input_file, mask_and_scale=True)
+        tmp = xr.open_dataset(
+            input_file,
+            mask_and_scale=True,
+            chunks=chunks,
+            engine=pyTMD.utilities.detect_engine(input_file),
+        )
     # read bathymetry and coordinates for variable group
     if group == "z":
         # get bathymetry at nodes
@@ -224,7 +310,7 @@ def open_atlas_grid(
         ds.coords["x"] = tmp["lon_v"]
         ds.coords["y"] = tmp["lat_v"]
     # mask invalid bathymetries
-    ds = ds.where(ds.bathymetry != 0, None, drop=False)
+    ds["bathymetry"] = ds["bathymetry"].where(ds["bathymetry"] != 0)
     # swap dimension names
     ds = ds.swap_dims(dict(nx="x", ny="y"))
     # add attributes
@@ -274,36 +360,89 @@ def open_atlas_dataset(
     input_file = pyTMD.utilities.Path(input_file).resolve()
     if isinstance(input_file, pathlib.Path) and not input_file.exists():
         raise FileNotFoundError(f"File not found: {input_file}")
+    # skip components of other variable groups in transport files
+    drop_variables = _drop_variables.get(group.lower())
     # read the netCDF4-format file
     if kwargs["compressed"]:
-        # read gzipped netCDF4 file
-        f = gzip.open(input_file, "rb")
-        tmp = xr.open_dataset(f, mask_and_scale=True, chunks=chunks)
+        # decompress gzipped netCDF4 file into memory
+        with gzip.open(input_file, "rb") as f:
+            fid = io.BytesIO(f.read())
+        tmp = xr.open_dataset(
+            fid,
+            mask_and_scale=False,
+            chunks=chunks,
+            drop_variables=drop_variables,
+        )
     else:
-        tmp = xr.open_dataset(input_file, mask_and_scale=True, chunks=chunks)
+        tmp = xr.open_dataset(
+            input_file,
+            mask_and_scale=False,
+            chunks=chunks,
+            drop_variables=drop_variables,
+            engine=pyTMD.utilities.detect_engine(input_file),
+        )
+    # convert to complex constituent
+    ds = _atlas_to_complex(tmp, group=group)
+    ds.attrs["lineage"] = pathlib.Path(input_file).name
+    # return xarray dataset
+    return ds
+
+
+# PURPOSE: convert ATLAS real and imaginary components to complex
+def _atlas_to_complex(
+    tmp: xr.Dataset,
+    group: str = "z",
+):
+    """
+    Convert an ATLAS-formatted netCDF4 dataset to a complex constituent
+
+    Parameters
+    ----------
+    tmp: xarray.Dataset
+        ATLAS netCDF4 dataset with real and imaginary components
+    group: str, default 'z'
+        Tidal variable to read
+
+    Returns
+    -------
+    ds: xarray.Dataset
+        ATLAS tide model data
+    """
     # constituent name
-    con = tmp["con"].values.astype("|S").tobytes().decode("utf-8").strip()
+    # only convert to bytes if not already a character array
+    con = tmp["con"].values
+    if con.dtype.kind != "S":
+        con = con.astype("|S")
+    con = con.tobytes().decode("utf-8").strip()
+    # variable names for group
     if group == "z":
-        ds = (tmp["hRe"].T + 1j * tmp["hIm"].T).to_dataset(name=con)
-        ds.coords["x"] = tmp["lon_z"]
-        ds.coords["y"] = tmp["lat_z"]
-        ds[con].attrs["units"] = tmp["hRe"].attrs.get("units")
+        re, im, lon, lat = ("hRe", "hIm", "lon_z", "lat_z")
     elif group in ("U", "u"):
-        ds = (tmp["uRe"].T + 1j * tmp["uIm"].T).to_dataset(name=con)
-        ds.coords["x"] = tmp["lon_u"]
-        ds.coords["y"] = tmp["lat_u"]
-        ds[con].attrs["units"] = tmp["uRe"].attrs.get("units")
+        re, im, lon, lat = ("uRe", "uIm", "lon_u", "lat_u")
     elif group in ("V", "v"):
-        ds = (tmp["vRe"].T + 1j * tmp["vIm"].T).to_dataset(name=con)
-        ds.coords["x"] = tmp["lon_v"]
-        ds.coords["y"] = tmp["lat_v"]
-        ds[con].attrs["units"] = tmp["vRe"].attrs.get("units")
+        re, im, lon, lat = ("vRe", "vIm", "lon_v", "lat_v")
+    # complex datatype with the precision of the input components
+    # (single precision components are not promoted to complex128)
+    # apply masking and scaling to only the real and imaginary components
+    # (files are opened without decoding the coordinates and constituent)
+    component = xr.decode_cf(tmp[[re, im]], mask_and_scale=True)
+    dtype = np.result_type(
+        component[re].dtype, component[im].dtype, np.complex64
+    )
+    hc = (component[re] + 1j * component[im]).astype(dtype, copy=False)
+    ds = hc.transpose("ny", "nx").to_dataset(name=con)
+    ds.coords["x"] = tmp[lon]
+    ds.coords["y"] = tmp[lat]
+    ds[con].attrs["units"] = tmp[re].attrs.get("units")
     # swap dimension names
     ds = ds.swap_dims(dict(nx="x", ny="y"))
     # add attributes
     ds.attrs["format"] = "ATLAS"
     ds.attrs["group"] = group.upper() if group in ("u", "v") else group
-    ds.attrs["lineage"] = pathlib.Path(input_file).name
+    # get file name from the source encoding (if available)
+    source = tmp.encoding.get("source")
+    if isinstance(source, str):
+        ds.attrs["lineage"] = pathlib.Path(source).name
     # return xarray dataset
     return ds
 
@@ -323,7 +462,7 @@ class ATLASDataset:
         self,
         path: str | pathlib.Path,
         mode: str = "w",
-        encoding: dict = {"zlib": True, "complevel": 9},
+        encoding: dict = {"zlib": True, "complevel": 1, "shuffle": True},
         astype: str = "float32",
         **kwargs,
     ):
@@ -336,7 +475,7 @@ class ATLASDataset:
             Output ATLAS-netcdf grid file name
         mode: str, default 'w'
             netCDF4 file mode
-        encoding: dict, default {"zlib": True, "complevel": 9}
+        encoding: dict, default {"zlib": True, "complevel": 1, "shuffle": True}
             netCDF4 variable compression settings
         kwargs: dict
             Additional keyword arguments for ``xarray`` netCDF4 writer
@@ -386,7 +525,7 @@ class ATLASDataset:
         self,
         path: str | pathlib.Path,
         mode: str = "w",
-        encoding: dict = {"zlib": True, "complevel": 9},
+        encoding: dict = {"zlib": True, "complevel": 1, "shuffle": True},
         astype: str = "float32",
         **kwargs,
     ):
@@ -399,7 +538,7 @@ class ATLASDataset:
             Output directory for ATLAS-netcdf files
         mode: str, default 'w'
             netCDF4 file mode
-        encoding: dict, default {"zlib": True, "complevel": 9}
+        encoding: dict, default {"zlib": True, "complevel": 1, "shuffle": True}
             netCDF4 variable compression settings
         kwargs: dict
             Additional keyword arguments for ``xarray`` netCDF4 writer
@@ -408,7 +547,7 @@ class ATLASDataset:
         path = pyTMD.utilities.Path(path).resolve()
         # set variable names
         group = self._ds.attrs["group"].lower()
-        type_key = dict(z="h", u="U", v="V")[group]
+        type_key = dict(z="h", u="u", v="v")[group]
         lon_key = f"lon_{group}"
         lat_key = f"lat_{group}"
         # set default encoding
@@ -440,6 +579,8 @@ class ATLASDataset:
             attrs[f"{type_key}{key}"] = {}
             attrs[f"{type_key}{key}"]["long_name"] = long_name
             attrs[f"{type_key}{key}"]["field"] = "; ".join(fields)
+        # output datasets and paths for each constituent
+        datasets, paths = ([], [])
         # create output xarray dataset for each constituent
         for v in self._ds.tmd.constituents:
             # create xarray dataset
@@ -456,7 +597,10 @@ class ATLASDataset:
             # update variable attributes
             for att_name, att_val in attrs.items():
                 ds[att_name].attrs.update(att_val)
-            ds[att_name].attrs["units"] = self._ds[v].attrs["units"]
+            # units of the real and imaginary components
+            for key in ("Re", "Im"):
+                units = self._ds[v].attrs["units"]
+                ds[f"{type_key}{key}"].attrs["units"] = units
             ds["con"].attrs["_Encoding"] = "utf8"
             ds["con"].attrs["long_name"] = "tidal constituent"
             # add global attributes
@@ -469,9 +613,14 @@ class ATLASDataset:
             ds.attrs["date_created"] = datetime.datetime.now().isoformat()
             ds.attrs["software_reference"] = pyTMD.version.project_name
             ds.attrs["software_version"] = pyTMD.version.full_version
-            # write ATLAS netCDF4 file
-            FILE = path.joinpath(f"{v}.nc")
-            ds.to_netcdf(FILE, mode=mode, **kwargs)
+            # append to list of ATLAS netCDF4 files to write
+            datasets.append(ds)
+            paths.append(path.joinpath(f"{v}.nc"))
+        # netCDF4 group to write for each constituent file
+        groups = [kwargs.pop("group", None)] * len(datasets)
+        # write ATLAS netCDF4 files
+        # files are written in parallel for dask-backed datasets
+        xr.save_mfdataset(datasets, paths, mode=mode, groups=groups, **kwargs)
 
 
 # PURPOSE: ATLAS-netcdf utilities for xarray DataTrees
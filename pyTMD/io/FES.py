@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 FES.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 
 Reads ascii and netCDF4 files for FES tidal solutions provided by AVISO
     https://www.aviso.altimetry.fr/data/products/auxiliary-products/
@@ -15,6 +15,12 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: use byte shuffling and faster deflate for netCDF4 output
+        parse ascii amplitude and phase rows without per-row conversions
+        calculate complex constituents using sine and cosine evaluations
+        open HDF5-based netCDF4 files directly with h5netcdf
+        build static netCDF4 output attributes once at import
+        compile regular expression for amplitude variables once
     Updated 04/2026: added lineage attributes to save model filename(s)
     Updated 03/2026: add reader for FES-native (unstructured) netCDF4 files
     Updated 02/2026: make dataset accessor for FES be a subaccessor from dataset
@@ -72,6 +78,7 @@ import pathlib
 import datetime
 import numpy as np
 import xarray as xr
+import pyTMD.math
 import pyTMD.constituents
 import pyTMD.utilities
 from .dataset import combine_attrs, register_dataset_subaccessor
@@ -89,6 +96,16 @@ __all__ = [
     "FESDataset",
 ]
 
+# regular expression for amplitude variables in FES-native files
+_amp_rx = re.compile(r"_amp(litude)?")
+
+# variable attributes for netCDF4 outputs
+_attributes = dict(
+    con=dict(_Encoding="utf8", long_name="tidal constituent"),
+    lon=dict(axis="X", units="degrees_east", long_name="longitude"),
+    lat=dict(axis="Y", units="degrees_north", long_name="latitude"),
+)
+
 
 # PURPOSE: read a list of FES ASCII or netCDF4 files
 def open_mfdataset(
@@ -209,7 +226,7 @@ def open_fes_ascii(
     if kwargs["compressed"]:
         # read gzipped ascii file
         with gzip.open(input_file, "rb") as f:
-            file_contents = f.read().splitlines()
+            file_contents = f.read().decode("utf8").splitlines()
     else:
         with open(input_file, mode="r", encoding="utf8") as f:
             file_contents = f.read().splitlines()
@@ -235,33 +252,29 @@ def open_fes_ascii(
     var = dict(dims=("y", "x"), coords={}, data_vars={})
     var["coords"]["y"] = dict(data=lat.copy(), dims="y")
     var["coords"]["x"] = dict(data=lon.copy(), dims="x")
-    # input amplitude and phase
-    amp = np.zeros((nlat, nlon), dtype=np.float32)
-    ph = np.zeros((nlat, nlon), dtype=np.float32)
+    # number of row pairs for each latitude
+    nrow = int(nlon // ncol) + 1
     # starting line to fill amplitude and phase variables
     i1 = 5
-    # for each latitude
-    for i in range(nlat):
-        for j in range(nlon // ncol):
-            j1 = j * ncol
-            # amplitude and phase are on two separate rows
-            amp[i, j1 : j1 + ncol] = np.array(file_contents[i1].split())
-            ph[i, j1 : j1 + ncol] = np.array(file_contents[i1 + 1].split())
-            i1 += 2
-        # add last rows of tidal variables
-        j1 = (j + 1) * ncol
-        j2 = nlon % ncol
-        # amplitude and phase are on two separate rows
-        amp[i, j1 : j1 + j2] = np.array(file_contents[i1].split())
-        ph[i, j1 : j1 + j2] = np.array(file_contents[i1 + 1].split())
-        i1 += 2
+    i2 = i1 + 2 * nrow * nlat
+    # amplitude and phase are on alternating rows
+    # parse each variable from the rows for all latitudes in a single pass
+    amp = np.fromstring(" ".join(file_contents[i1:i2:2]), dtype="f4", sep=" ")
+    ph = np.fromstring(
+        " ".join(file_contents[i1 + 1 : i2 : 2]), dtype="f4", sep=" "
+    )
+    # verify that all values were parsed from the rows
+    if (amp.size != nlat * nlon) or (ph.size != nlat * nlon):
+        raise ValueError(f"Could not parse {nlat * nlon} values")
+    amp = amp.reshape(nlat, nlon)
+    ph = ph.reshape(nlat, nlon)
     # convert to masked arrays
     amp = np.ma.masked_equal(amp, fill_value)
     ph = np.ma.masked_equal(ph, fill_value)
     # store the data variables
     var["data_vars"][cons] = {}
     var["data_vars"][cons]["dims"] = ("y", "x")
-    var["data_vars"][cons]["data"] = amp * np.exp(-1j * np.radians(ph))
+    var["data_vars"][cons]["data"] = pyTMD.math.phasor(amp, ph)
     # convert to xarray Dataset from the data dictionary
     ds = xr.Dataset.from_dict(var)
     # coerce to specified chunks
@@ -316,7 +329,12 @@ def open_fes_netcdf(
         f = gzip.open(input_file, "rb")
         tmp = xr.open_dataset(f, mask_and_scale=True, chunks=chunks)
     else:
-        tmp = xr.open_dataset(input_file, mask_and_scale=True, chunks=chunks)
+        tmp = xr.open_dataset(
+            input_file,
+            mask_and_scale=True,
+            chunks=chunks,
+            engine=pyTMD.utilities.detect_engine(input_file),
+        )
     # parse model file for constituent identifier
     cons = pyTMD.constituents._parse_name(input_file.stem)
     # amplitude and phase components for different versions
@@ -345,7 +363,7 @@ def open_fes_netcdf(
     # create output xarray dataset for file
     ds = xr.Dataset()
     # calculate complex form of constituent oscillation
-    ds[cons] = amplitude * np.exp(-1j * np.radians(phase))
+    ds[cons] = pyTMD.math.phasor(amplitude, phase)
     # rename coordinates
     ds = ds.rename(mapping_coords)
     # add attributes
@@ -398,7 +416,12 @@ def open_fes_native(
         f = gzip.open(input_file, "rb")
         tmp = xr.open_dataset(f, mask_and_scale=True, chunks=chunks)
     else:
-        tmp = xr.open_dataset(input_file, mask_and_scale=True, chunks=chunks)
+        tmp = xr.open_dataset(
+            input_file,
+            mask_and_scale=True,
+            chunks=chunks,
+            engine=pyTMD.utilities.detect_engine(input_file),
+        )
     # create output xarray dataset for file
     ds = xr.Dataset()
     # copy coordinate variables
@@ -425,18 +448,18 @@ def open_fes_native(
     ds["x"] = tmp["lon"][triangle]
     ds["y"] = tmp["lat"][triangle]
     # find amplitude variables in the dataset
-    variables = [v for v in tmp.data_vars if re.search(r"_amp(litude)?", v)]
+    variables = [v for v in tmp.data_vars if _amp_rx.search(v)]
     # for each amplitude variable
     for amp_key in variables:
         # parse variable name for constituent id
         cons = pyTMD.constituents._parse_name(amp_key)
         # get the phase variable name
-        phase_key = re.sub(r"_amp(litude)?", r"_phase", amp_key)
+        phase_key = _amp_rx.sub(r"_phase", amp_key)
         # amplitude and phase of finite element nodes
         amp = tmp[amp_key][nodes]
         phase = tmp[phase_key][nodes]
         # calculate complex form of constituent oscillation
-        ds[cons] = amp * np.exp(-1j * np.radians(phase))
+        ds[cons] = pyTMD.math.phasor(amp, phase)
         ds[cons].attrs["units"] = tmp[amp_key].attrs.get("units", "")
     # rename coordinates
     mapping_coords = dict(triangles="element", three="vertex", six="node")
@@ -473,7 +496,7 @@ class FESDataset:
         self,
         path: str | pathlib.Path,
         mode: str = "w",
-        encoding: dict = {"zlib": True, "complevel": 9},
+        encoding: dict = {"zlib": True, "complevel": 1, "shuffle": True},
         **kwargs,
     ):
         """
@@ -485,7 +508,7 @@ class FESDataset:
             Output directory for netCDF4 files
         mode: str, default 'w'
             netCDF4 file mode
-        encoding: dict, default {"zlib": True, "complevel": 9}
+        encoding: dict, default {"zlib": True, "complevel": 1, "shuffle": True}
             netCDF4 variable compression settings
         kwargs: dict
             Additional keyword arguments for ``xarray`` netCDF4 writer
@@ -506,13 +529,6 @@ class FESDataset:
         kwargs.setdefault("encoding", {amp_key: encoding, phase_key: encoding})
         # coordinate remapping
         mapping_coords = dict(x="lon", y="lat")
-        attrs = dict(lon={}, lat={})
-        attrs["lon"]["axis"] = "X"
-        attrs["lon"]["units"] = "degrees_east"
-        attrs["lon"]["long_name"] = "longitude"
-        attrs["lat"]["axis"] = "Y"
-        attrs["lat"]["units"] = "degrees_north"
-        attrs["lat"]["long_name"] = "latitude"
         # for each variable
         for v in self._ds.data_vars.keys():
             # create xarray dataset
@@ -526,12 +542,10 @@ class FESDataset:
             ds[phase_key].attrs["long_name"] = f"Tide phase at {v} frequency"
             # define and fill constituent ID
             ds["con"] = v.ljust(4).encode("utf8")
-            ds["con"].attrs["_Encoding"] = "utf8"
-            ds["con"].attrs["long_name"] = "tidal constituent"
             # remap coordinates to FES convention
             ds = ds.rename(mapping_coords)
-            # update variable attributes
-            for att_name, att_val in attrs.items():
+            # update variable attributes from the static templates
+            for att_name, att_val in _attributes.items():
                 ds[att_name].attrs.update(att_val)
             # add global attributes
             ds.attrs["title"] = "FES tidal constituent data"
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 GOT.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 
 Reads ascii and netCDF4 files from Richard Ray's Goddard Ocean Tide (GOT) model
     https://earth.gsfc.nasa.gov/geo/data/ocean-tide-models
@@ -14,6 +14,13 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: parse ascii amplitude and phase blocks in a single pass
+        use byte shuffling and faster deflate level for netCDF4 output
+        compile regular expression for ascii header units once
+        calculate complex constituents using sine and cosine evaluations
+        open HDF5-based netCDF4 files directly with h5netcdf
+        write ascii data rows with a single formatted write per row
+        build static netCDF4 output attributes once at import
     Updated 04/2026: added lineage attributes to save model filename(s)
     Updated 03/2026: use numpy functions to convert from degrees to radians
     Updated 02/2026: make dataset accessor for GOT be a subaccessor from dataset
@@ -76,6 +83,7 @@ import datetime
 import numpy as np
 import xarray as xr
 import pyTMD.version
+import pyTMD.math
 import pyTMD.constituents
 import pyTMD.utilities
 from .dataset import combine_attrs, register_dataset_subaccessor
@@ -92,6 +100,23 @@ __all__ = [
     "GOTDataset",
 ]
 
+# regular expression for units in GOT ascii headers
+_units_rx = re.compile(r"\((\w+m)\)", re.IGNORECASE)
+
+# variable attributes for netCDF4 outputs
+_attributes = dict(
+    amplitude=dict(long_name="Tide amplitude"),
+    phase=dict(units="degrees", long_name="Greenwich tide phase lag"),
+    longitude=dict(units="degrees_east", long_name="longitude"),
+    latitude=dict(units="degrees_north", long_name="latitude"),
+)
+# global attributes for netCDF4 outputs
+_global_attributes = dict(
+    title="GOT tidal constituent data",
+    authors="Richard Ray",
+    institution="NASA Goddard Space Flight Center",
+)
+
 
 # PURPOSE: read a list of GOT ASCII or netCDF4 files
 def open_mfdataset(
@@ -217,13 +242,12 @@ def open_got_ascii(
     # constituent identifier
     cons = pyTMD.constituents._parse_name(file_contents[0])
     # get units from header if available
-    rx = re.compile(r"\((\w+m)\)", re.IGNORECASE)
     # GOT headers from Richard Ray have units on the first line
     # some other models have units on the second line
-    if rx.search(file_contents[0]):
-        units = rx.findall(file_contents[0], re.IGNORECASE)
-    elif rx.search(file_contents[1]):
-        units = rx.findall(file_contents[1], re.IGNORECASE)
+    if _units_rx.search(file_contents[0]):
+        units = _units_rx.findall(file_contents[0])
+    elif _units_rx.search(file_contents[1]):
+        units = _units_rx.findall(file_contents[1])
     else:
         units = None
     # grid dimensions
@@ -244,36 +268,22 @@ def open_got_ascii(
     var = dict(dims=("y", "x"), coords={}, data_vars={})
     var["coords"]["y"] = dict(data=lat.copy(), dims="y")
     var["coords"]["x"] = dict(data=lon.copy(), dims="x")
-    # input amplitude and phase
-    amp = np.zeros((nlat, nlon), dtype=np.float32)
-    ph = np.zeros((nlat, nlon), dtype=np.float32)
-    # starting lines to fill amplitude and phase variables
+    # number of rows for each latitude
+    nrow = int(nlon // ncol) + 1
+    # starting lines of amplitude and phase variables
     l1 = 7
-    l2 = 14 + int(nlon // ncol) * nlat + nlat
-    # for each latitude
-    for i in range(nlat):
-        for j in range(nlon // ncol):
-            j1 = j * ncol
-            # amplitude and phase are on two separate rows
-            amp[i, j1 : j1 + ncol] = np.array(file_contents[l1].split())
-            ph[i, j1 : j1 + ncol] = np.array(file_contents[l2].split())
-            l1 += 1
-            l2 += 1
-        # add last row of tidal variables
-        j1 = (j + 1) * ncol
-        j2 = nlon % ncol
-        # amplitude and phase are on two separate rows
-        amp[i, j1 : j1 + j2] = np.array(file_contents[l1].split())
-        ph[i, j1 : j1 + j2] = np.array(file_contents[l2].split())
-        l1 += 1
-        l2 += 1
+    l2 = 14 + nrow * nlat
+    # parse amplitude and phase from the rows for all latitudes
+    # (all values for each variable are parsed in a single pass)
+    amp = _parse_ascii(file_contents[l1 : l1 + nrow * nlat], (nlat, nlon))
+    ph = _parse_ascii(file_contents[l2 : l2 + nrow * nlat], (nlat, nlon))
     # convert to masked arrays
     amp = np.ma.masked_equal(amp, fill_value)
     ph = np.ma.masked_equal(ph, fill_value)
     # store the data variables
     var["data_vars"][cons] = {}
     var["data_vars"][cons]["dims"] = ("y", "x")
-    var["data_vars"][cons]["data"] = amp * np.exp(-1j * np.radians(ph))
+    var["data_vars"][cons]["data"] = pyTMD.math.phasor(amp, ph)
     # convert to xarray Dataset from the data dictionary
     ds = xr.Dataset.from_dict(var)
     # coerce to specified chunks
@@ -288,6 +298,36 @@ def open_got_ascii(
     return ds
 
 
+# PURPOSE: parse a block of ascii rows into an array
+def _parse_ascii(
+    rows: list[str],
+    shape: tuple,
+    dtype: str | np.dtype = np.float32,
+):
+    """
+    Parse a block of whitespace-delimited rows into an array
+
+    Parameters
+    ----------
+    rows: list of str
+        Rows of values from the ascii file
+    shape: tuple
+        Output shape of the array
+    dtype: str or np.dtype, default np.float32
+        Output data type
+
+    Returns
+    -------
+    var: np.ndarray
+        Parsed values from the ascii rows
+    """
+    var = np.fromstring(" ".join(rows), dtype=dtype, sep=" ")
+    # verify that all values were parsed from the rows
+    if var.size != np.prod(shape):
+        raise ValueError(f"Could not parse {np.prod(shape)} values")
+    return var.reshape(shape)
+
+
 # PURPOSE: read GOT netCDF4 files
 def open_got_netcdf(
     input_file: str | pathlib.Path,
@@ -326,7 +366,11 @@ def open_got_netcdf(
         )
     else:
         tmp = xr.open_dataset(
-            input_file, mask_and_scale=True, decode_coords=False, chunks=chunks
+            input_file,
+            mask_and_scale=True,
+            decode_coords=False,
+            chunks=chunks,
+            engine=pyTMD.utilities.detect_engine(input_file),
         )
     # extract constituent from attribute
     cons = pyTMD.constituents._parse_name(tmp.attrs["Constituent"])
@@ -336,7 +380,7 @@ def open_got_netcdf(
     ds.coords["x"] = tmp.longitude
     ds.coords["y"] = tmp.latitude
     # calculate complex form of constituent oscillation
-    ds[cons] = tmp.amplitude * np.exp(-1j * np.radians(tmp.phase))
+    ds[cons] = pyTMD.math.phasor(tmp.amplitude, tmp.phase)
     # rename dimensions
     mapping_coords = dict(lon="x", lat="y")
     ds = ds.rename(mapping_coords)
@@ -392,6 +436,9 @@ class GOTDataset:
             xmin, xmax = ds["x"].values.min(), ds["x"].values.max()
             # number of columns in ascii file
             ncol = 11
+            # format for each row of data split into lines of ncol values
+            lines = [ncol] * (nlon // ncol) + [nlon % ncol]
+            fmt = "\n".join("%7.2f" * n for n in lines)
             # write GOT ASCII file
             FILE = path.joinpath(f"{v}.d")
             with open(FILE, mode=mode, encoding="utf8") as f:
@@ -405,12 +452,7 @@ class GOTDataset:
                 f.write(f"{fill_value:20.2f} {fill_value:20.2f}\n")
                 f.write("\n")
                 # write amplitude  data
-                for i in range(nlat):
-                    amp = ds["amplitude"].isel(y=i).values
-                    fmt = [f"{v:7.2f}" for v in amp]
-                    for j in range(nlon // ncol + 1):
-                        j1 = j * ncol
-                        f.write("".join(fmt[j1 : j1 + ncol]) + "\n")
+                np.savetxt(f, ds["amplitude"].transpose("y", "x"), fmt=fmt)
                 # write header information for phase
                 units = ds["phase"].attrs.get("units", "")
                 f.write(f"{v.upper()} tide phase lags ({units})\n")
@@ -421,19 +463,14 @@ class GOTDataset:
                 f.write(f"{fill_value:20.2f} {fill_value:20.2f}\n")
                 f.write("\n")
                 # write phase data
-                for i in range(nlat):
-                    ph = ds["phase"].isel(y=i).values
-                    fmt = [f"{v:7.2f}" for v in ph]
-                    for j in range(nlon // ncol + 1):
-                        j1 = j * ncol
-                        f.write("".join(fmt[j1 : j1 + ncol]) + "\n")
+                np.savetxt(f, ds["phase"].transpose("y", "x"), fmt=fmt)
 
     # PURPOSE: output tidal constituent file in GOT netCDF format
     def to_netcdf(
         self,
         path: str | pathlib.Path,
         mode: str = "w",
-        encoding: dict = {"zlib": True, "complevel": 9},
+        encoding: dict = {"zlib": True, "complevel": 1, "shuffle": True},
         **kwargs,
     ):
         """
@@ -445,7 +482,7 @@ class GOTDataset:
             Output directory for netCDF4 files
         mode: str, default 'w'
             netCDF4 file mode
-        encoding: dict, default {"zlib": True, "complevel": 9}
+        encoding: dict, default {"zlib": True, "complevel": 1, "shuffle": True}
             netCDF4 variable compression settings
         kwargs: dict
             Additional keyword arguments for ``xarray`` netCDF4 writer
@@ -456,10 +493,6 @@ class GOTDataset:
         kwargs.setdefault("encoding", dict(amplitude=encoding, phase=encoding))
         # coordinate remapping
         mapping_coords = dict(x="longitude", y="latitude")
-        attrs = dict(longitude={}, latitude={})
-        attrs["longitude"] = dict(units="degrees_east", long_name="longitude")
-        attrs["latitude"] = dict(units="degrees_north", long_name="latitude")
-        # get longitude and latitude arrays
         # for each variable
         for v in self._ds.data_vars.keys():
             ds = xr.Dataset()
@@ -467,20 +500,15 @@ class GOTDataset:
             ds["amplitude"] = self._ds[v].tmd.amplitude
             ds["phase"] = self._ds[v].tmd.phase
             ds["amplitude"].attrs["units"] = self._ds[v].attrs.get("units", "")
-            ds["phase"].attrs["units"] = "degrees"
-            ds["amplitude"].attrs["long_name"] = "Tide amplitude"
-            ds["phase"].attrs["long_name"] = "Greenwich tide phase lag"
             # rename dimensions
             ds = ds.swap_dims(dict(x="lon", y="lat"))
             # remap coordinates to GOT convention
             ds = ds.rename(mapping_coords)
-            # update variable attributes
-            for att_name, att_val in attrs.items():
+            # update variable attributes from the static templates
+            for att_name, att_val in _attributes.items():
                 ds[att_name].attrs.update(att_val)
             # add global attributes
-            ds.attrs["title"] = "GOT tidal constituent data"
-            ds.attrs["authors"] = "Richard Ray"
-            ds.attrs["institution"] = "NASA Goddard Space Flight Center"
+            ds.attrs.update(_global_attributes)
             # define and fill constituent ID
             ds.attrs["Constituent"] = v.upper().encode("utf8")
             ds.attrs["date_created"] = datetime.datetime.now().isoformat()
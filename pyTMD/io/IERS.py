@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 IERS.py
-Written by Tyler Sutterley (12/2025)
+Written by Tyler Sutterley (10/2026)
 
 Reads ocean pole load tide coefficients provided by IERS
 http://maia.usno.navy.mil/conventions/2010/2010_official/chapter7/tn36_c7.pdf
@@ -25,6 +25,10 @@ REFERENCES:
         doi: 10.1007/s00190-015-0848-7
 
 UPDATE HISTORY:
+    Updated 10/2026: parse ocean pole tide coefficients as a single array
+        check for the end of the header without regular expressions
+        cache parsed ocean pole tide grids for repeated calls
+        parse coefficients from the file contents without splitting lines
     Updated 12/2025: no longer subclassing pathlib.Path for working directories
         fetch ocean pole tide file if it doesn't exist instead of raising error
     Updated 11/2025: near-complete rewrite of program to use xarray
@@ -48,8 +52,8 @@ UPDATE HISTORY:
 
 from __future__ import annotations
 
-import re
 import gzip
+import functools
 import pyproj
 import pathlib
 import warnings
@@ -106,30 +110,88 @@ def open_dataset(
     # fetch ocean pole tide file if it doesn't exist
     if isinstance(input_file, pathlib.Path) and not input_file.exists():
         fetch_iers_opole(directory=input_file.parent)
+    # read ocean pole tide grids (cached for repeated calls)
+    if isinstance(input_file, pathlib.Path):
+        mtime = input_file.stat().st_mtime_ns
+    else:
+        mtime = None
+    lon, lat, grids = _read_coefficients(
+        input_file, kwargs["compressed"], mtime
+    )
+    # data dictionary
+    var = dict(dims=("y", "x"), coords={}, data_vars={})
+    var["coords"]["y"] = dict(data=lat.copy(), dims="y")
+    var["coords"]["x"] = dict(data=lon.copy(), dims="x")
+    # assign ocean pole tide coefficients to output variables
+    for key, grid in grids.items():
+        var["data_vars"][key] = {}
+        var["data_vars"][key]["dims"] = ("y", "x")
+        var["data_vars"][key]["data"] = grid.copy()
+    # convert to xarray Dataset from the data dictionary
+    ds = xr.Dataset.from_dict(var)
+    # coerce to specified chunks
+    if chunks is not None:
+        ds = ds.chunk(chunks)
+    # add attributes
+    ds.attrs["crs"] = pyproj.CRS.from_user_input(crs).to_dict()
+    # return xarray dataset
+    return ds
+
+
+# PURPOSE: parse ocean pole tide coefficients from an ASCII file
+@functools.lru_cache(maxsize=2)
+def _read_coefficients(
+    input_file: pathlib.Path,
+    compressed: bool = True,
+    mtime: int | None = None,
+):
+    """
+    Parse ocean pole tide coefficients from an ASCII file
+
+    Parameters
+    ----------
+    input_file: pathlib.Path
+        Ocean pole tide file
+    compressed: bool, default True
+        Input file is ``gzip`` compressed
+    mtime: int or NoneType, default None
+        Modification time of the input file for invalidating the cache
+
+    Returns
+    -------
+    lon: np.ndarray
+        Longitude grid vector
+    lat: np.ndarray
+        Latitude grid vector
+    grids: dict
+        Complex ocean pole tide coefficients for each component
+    """
     # read compressed ocean pole tide file
-    if kwargs["compressed"]:
+    # (file contents are kept as a single string rather than split lines)
+    if compressed:
         # read gzipped ascii file
         with gzip.open(input_file, "rb") as f:
-            file_contents = f.read().decode("utf8").splitlines()
+            file_contents = f.read().decode("utf8")
     else:
         with open(input_file, mode="r", encoding="utf8") as f:
-            file_contents = f.read().splitlines()
+            file_contents = f.read()
 
-    # counts the number of lines in the header
-    count = 0
+    # character offset of the current line
+    offset = 0
     # parse over header text
     parameters = {}
     HEADER = True
     while HEADER:
-        # file line at count
-        line = file_contents[count]
+        # file line at offset
+        end = file_contents.index("\n", offset)
+        line = file_contents[offset:end]
         # detect the end of the header text
-        HEADER = not bool(re.match(r"---------", line))
+        HEADER = not line.startswith("---------")
         # parse key-value pairs from header
         key, _, val = line.partition("=")
         parameters[key.strip().lower()] = val.strip()
-        # add 1 to counter
-        count += 1
+        # advance to the next line
+        offset = end + 1
 
     # grid parameters and dimensions
     dlon = float(parameters["longitude_step_degrees"])
@@ -141,37 +203,20 @@ def open_dataset(
     lat_start = float(parameters["first_latitude_degrees"])
     lon = lon_start + np.arange(nlon) * dlon
     lat = lat_start + np.arange(nlat) * dlat
-    # data dictionary
-    var = dict(dims=("y", "x"), coords={}, data_vars={})
-    var["coords"]["y"] = dict(data=lat.copy(), dims="y")
-    var["coords"]["x"] = dict(data=lon.copy(), dims="x")
-    # allocate for output grid maps
-    for key in ["R", "N", "E"]:
-        var["data_vars"][key] = {}
-        var["data_vars"][key]["dims"] = ("y", "x")
-        data = np.zeros((nlat, nlon), dtype=np.clongdouble)
-        var["data_vars"][key]["data"] = data
-
-    # read lines of file and add to output variables
-    for i, line in enumerate(file_contents[count:]):
-        # read line of ocean pole tide file
-        ln, lt, urr, uri, unr, uni, uer, uei = np.array(
-            line.split(), dtype="f8"
-        )
-        # calculate indices of output grid
-        # coerce to -180:180 longitude convention
-        ilon = int(np.mod(ln - lon_start, 360.0) // dlon)
-        ilat = int((lt - lat_start) // dlat)
-        # assign ocean pole tide coefficients to output variables
-        var["data_vars"]["R"]["data"][ilat, ilon] = urr + 1j * uri
-        var["data_vars"]["N"]["data"][ilat, ilon] = unr + 1j * uni
-        var["data_vars"]["E"]["data"][ilat, ilon] = uer + 1j * uei
-    # convert to xarray Dataset from the data dictionary
-    ds = xr.Dataset.from_dict(var)
-    # coerce to specified chunks
-    if chunks is not None:
-        ds = ds.chunk(chunks)
-    # add attributes
-    ds.attrs["crs"] = pyproj.CRS.from_user_input(crs).to_dict()
-    # return xarray dataset
-    return ds
+    # read lines of file as an array of ocean pole tide coefficients
+    # columns: lon, lat, urr, uri, unr, uni, uer, uei
+    data = np.fromstring(file_contents[offset:], dtype="f8", sep=" ")
+    ln, lt, urr, uri, unr, uni, uer, uei = data.reshape(-1, 8).T
+    # calculate indices of output grid
+    # coerce to -180:180 longitude convention
+    ilon = (np.mod(ln - lon_start, 360.0) // dlon).astype(int)
+    ilat = ((lt - lat_start) // dlat).astype(int)
+    # assign ocean pole tide coefficients to output grids
+    grids = {}
+    real, imag = ([urr, unr, uer], [uri, uni, uei])
+    for key, hr, hi in zip(["R", "N", "E"], real, imag):
+        grid = np.zeros((nlat, nlon), dtype=np.clongdouble)
+        grid[ilat, ilon] = hr + 1j * hi
+        grids[key] = grid
+    # return the grid vectors and ocean pole tide coefficients
+    return (lon, lat, grids)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 NOAA.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 Query and parsing functions for NOAA webservices API
 
 PYTHON DEPENDENCIES:
@@ -11,6 +11,9 @@ PYTHON DEPENDENCIES:
         https://pandas.pydata.org
 
 UPDATE HISTORY:
+    Updated 10/2026: calculate complex constituents using sine and cosine
+        explicitly parse webservices responses using lxml
+        store water level data as single precision floats
     Updated 04/2026: added builder for XSLT 1.0 stylesheets
         allows retrieval of prediction stations coordinates
     Updated 01/2026: raise original exception in case of HTTPError
@@ -27,6 +30,7 @@ from __future__ import annotations
 import logging
 import traceback
 import numpy as np
+import pyTMD.math
 import pyTMD.constituents
 import pyTMD.utilities
 from pyTMD.io.dataset import Dataset
@@ -170,6 +174,8 @@ def from_xml(url: str, **kwargs):
     # query the NOAA webservices API
     if not pandas_available:
         raise ValueError("pandas is required for accessing NOAA webservices")
+    # parse responses with lxml rather than the standard library
+    kwargs.setdefault("parser", "lxml")
     try:
         logging.debug(url)
         df = pd.read_xml(url, **kwargs)
@@ -339,6 +345,9 @@ def water_level(
     )
     # replace invalid water level values with NaN
     df = df.replace(to_replace=[-999], value=np.nan)
+    # store water levels as single precision (reported to the millimeter)
+    columns = df.select_dtypes(include="float64").columns
+    df = df.astype(dict.fromkeys(columns, np.float32))
     # return the dataframe
     return df
 
@@ -364,9 +373,11 @@ class DataFrame(Dataset):
             Tide constituent ``Dataset``
         """
         # complex constituent oscillation(s)
-        hc = self._df.amplitude * np.exp(-1j * np.radians(self._df.phase))
-        # convert data series to xarray DataArray
-        darr = hc.to_xarray().rename({"constNum": "constituent"})
+        # from data series converted to xarray DataArrays
+        darr = pyTMD.math.phasor(
+            self._df.amplitude.to_xarray(),
+            self._df.phase.to_xarray(),
+        ).rename({"constNum": "constituent"})
         # assign constituent names as coordinates
         darr = darr.assign_coords({"constituent": self._df.constituent.values})
         # convert DataArray to Dataset with constituents as variables
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 OTIS.py
-Written by Tyler Sutterley (04/2026)
+Written by Tyler Sutterley (10/2026)
 
 Reads OTIS format tidal solutions provided by Oregon State University and ESR
     http://volkov.oce.orst.edu/tides/region.html
@@ -19,6 +19,14 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: view interleaved binary components as complex values
+        read constituents from binary files using a single file handle
+        write interleaved binary components from views of complex values
+        read transport files once when opening both current components
+        open HDF5-based netCDF4 files directly with h5netcdf
+        fill a pre-sized buffer with u and v when writing transport files
+        mask invalid complex values in place without index arrays
+        raise an exception for invalid transport groups
     Updated 04/2026: compact subaccessor should be to dataset
         added lineage attributes to save model filename(s)
     Updated 02/2026: make dataset and datatree accessors for OTIS
@@ -101,6 +109,7 @@ UPDATE HISTORY:
 from __future__ import division, annotations
 
 import pyproj
+import contextlib
 import pathlib
 import warnings
 import numpy as np
@@ -226,51 +235,110 @@ def open_dataset(
             - ``'ATLAS'``
             - ``'OTIS'``
             - ``'TMD3'``
-    group: str, default 'z'
-        Tidal variable to read
+    group: str or list, default 'z'
+        Tidal variable(s) to read
 
             - ``'z'``: heights
             - ``'u'``: zonal currents
             - ``'U'``: zonal depth-averaged transport
             - ``'v'``: meridional currents
             - ``'V'``: meridional depth-averaged transport
+
+        A list of current or transport variables returns a tuple
+        of Datasets with each transport file only read once
     kwargs: dict
         Additional keyword arguments for opening files
 
     Returns
     -------
-    ds: xarray.Dataset
+    ds: xarray.Dataset or tuple
         Tide model data
     """
     # set default keyword arguments
     kwargs.setdefault("group", "z")
-    group = kwargs.get("group").lower()
-    # open file(s) as xarray dataset
+    group = kwargs["group"]
+    # open file(s) as xarray dataset(s)
     if format == "OTIS":
         # OTIS (single or multi-file)
         ds = open_otis_dataset(model_file, grid_file=grid_file, **kwargs)
     elif format == "ATLAS":
         # ATLAS-compact
         ds = open_atlas_dataset(model_file, grid_file=grid_file, **kwargs)
-    elif format == "TMD3":
+    elif format == "TMD3" and isinstance(group, str):
         # TMD3 netCDF4
         ds = open_tmd3_dataset(model_file, **kwargs)
-    # add attributes
-    ds.attrs["format"] = format
-    # convert transports to currents if necessary
-    if kwargs["group"] in ("u", "v"):
-        # convert transports to currents and update attributes
-        for c in ds.tmd.constituents:
-            ds[c] /= ds["bathymetry"]
-            ds[c].attrs.update(_attributes[group]["current"])
-    # return xarray dataset
+    elif format == "TMD3":
+        # TMD3 netCDF4 (lazily loaded for each group)
+        kwargs.pop("group")
+        ds = tuple(
+            open_tmd3_dataset(model_file, group=g, **kwargs) for g in group
+        )
+    # iterate over each output dataset
+    datasets = [ds] if isinstance(group, str) else ds
+    for g, d in zip(_groups(group), datasets):
+        # add attributes
+        d.attrs["format"] = format
+        # convert transports to currents if necessary
+        if g in ("u", "v"):
+            # convert transports to currents and update attributes
+            for c in d.tmd.constituents:
+                d[c] /= d["bathymetry"]
+                d[c].attrs.update(_attributes[g]["current"])
+    # return xarray dataset(s)
     return ds
 
 
+def _groups(group: str | list | tuple):
+    """
+    Create a list of tidal variables to read
+
+    Parameters
+    ----------
+    group: str, list or tuple
+        Tidal variable(s) to read
+    """
+    return [group] if isinstance(group, str) else list(group)
+
+
+def _select(transports: tuple, group: str | list | tuple):
+    """
+    Select zonal and meridional transports for each tidal variable
+
+    Parameters
+    ----------
+    transports: tuple
+        Zonal and meridional transports as a (u, v) pair
+    group: str, list or tuple
+        Tidal variable(s) to read
+    """
+    # index of the zonal and meridional transports
+    index = dict(u=0, v=1)
+    output = []
+    for g in _groups(group):
+        if g.lower() not in index:
+            raise ValueError(f"Invalid transport group {g}")
+        output.append(transports[index[g.lower()]])
+    return output
+
+
+def _output(ds: list, group: str | list | tuple):
+    """
+    Return a single Dataset or a tuple of Datasets for each tidal variable
+
+    Parameters
+    ----------
+    ds: list
+        Tide model data for each tidal variable
+    group: str, list or tuple
+        Tidal variable(s) to read
+    """
+    return ds[0] if isinstance(group, str) else tuple(ds)
+
+
 # PURPOSE: read a list of model files
 def open_mfdataset(
     model_files: list[str] | list[pathlib.Path],
-    group: str = "z",
+    group: str | list = "z",
     **kwargs,
 ):
     """
@@ -280,8 +348,8 @@ def open_mfdataset(
     ----------
     model_files: list of str or pathlib.Path
         List of OTIS model files
-    group: str, default 'z'
-        Tidal variable to read
+    group: str or list, default 'z'
+        Tidal variable(s) to read
 
             - ``'z'``: heights
             - ``'u'``: zonal currents
@@ -295,7 +363,7 @@ def open_mfdataset(
 
     Returns
     -------
-    ds: xarray.Dataset
+    ds: xarray.Dataset or tuple
         OTIS tide model data
     """
     # set default keyword arguments
@@ -309,32 +377,30 @@ def open_mfdataset(
     elif group == "z":
         # elevations
         d = [open_otis_elevation(f, **kwargs) for f in model_files]
-    elif group in ("u", "U") and parallel:
+    elif parallel:
         # transports are returned as (u,v)
         opener = dask.delayed(open_otis_transport)
-        (d,) = dask.compute([opener(f, **kwargs)[0] for f in model_files])
-    elif group in ("u", "U"):
-        # transports are returned as (u,v)
-        d = [open_otis_transport(f, **kwargs)[0] for f in model_files]
-    elif group in ("v", "V") and parallel:
-        # transports are returned as (u,v)
-        opener = dask.delayed(open_otis_transport)
-        (d,) = dask.compute([opener(f, **kwargs)[1] for f in model_files])
-    elif group in ("v", "V"):
+        (d,) = dask.compute([opener(f, **kwargs) for f in model_files])
+    else:
         # transports are returned as (u,v)
-        d = [open_otis_transport(f, **kwargs)[1] for f in model_files]
-    # merge datasets
-    ds = xr.merge(d, combine_attrs=combine_attrs, compat="override")
-    # add attributes
-    ds.attrs["group"] = group.upper() if group in ("u", "v") else group
-    # return xarray dataset
-    return ds
+        d = [open_otis_transport(f, **kwargs) for f in model_files]
+    # merge datasets for each tidal variable
+    output = []
+    for g in _groups(group):
+        # select transport components from each file
+        datasets = d if (g == "z") else [_select(t, g)[0] for t in d]
+        ds = xr.merge(datasets, combine_attrs=combine_attrs, compat="override")
+        # add attributes
+        ds.attrs["group"] = g.upper() if g in ("u", "v") else g
+        output.append(ds)
+    # return xarray dataset(s)
+    return _output(output, group)
 
 
 def open_otis_dataset(
     model_file: str | list | pathlib.Path,
     grid_file: str | pathlib.Path,
-    group: str | None = "z",
+    group: str | list = "z",
     **kwargs,
 ):
     """
@@ -346,8 +412,8 @@ def open_otis_dataset(
         Input model file(s)
     grid_file: str, pathlib.Path
         Input model grid file
-    group: str, default 'z'
-        Tidal variable to read
+    group: str or list, default 'z'
+        Tidal variable(s) to read
 
             - ``'z'``: heights
             - ``'u'``: zonal currents
@@ -361,7 +427,7 @@ def open_otis_dataset(
 
     Returns
     -------
-    ds: xarray.Dataset
+    ds: xarray.Dataset or tuple
         OTIS tide model data
     """
     # default coordinate reference system
@@ -374,27 +440,28 @@ def open_otis_dataset(
     if isinstance(model_file, list):
         # multi-file datasets
         ds2 = open_mfdataset(model_file, group=group, **kwargs)
+        ds2 = [ds2] if isinstance(group, str) else list(ds2)
     elif group == "z":
         # elevations
-        ds2 = open_otis_elevation(model_file, **kwargs)
-    elif group in ("u", "U"):
-        # transports are returned as (u,v)
-        ds2 = open_otis_transport(model_file, **kwargs)[0]
-    elif group in ("v", "V"):
+        ds2 = [open_otis_elevation(model_file, **kwargs)]
+    else:
         # transports are returned as (u,v)
-        ds2 = open_otis_transport(model_file, **kwargs)[1]
-    # merge datasets
-    ds = OTISDataset(ds1).merge(ds2, group=group)
-    # add attributes
-    ds.attrs["group"] = group.upper() if group in ("u", "v") else group
-    # return xarray dataset
-    return ds
+        ds2 = _select(open_otis_transport(model_file, **kwargs), group)
+    # merge datasets for each tidal variable
+    output = []
+    for g, d in zip(_groups(group), ds2):
+        ds = OTISDataset(ds1).merge(d, group=g)
+        # add attributes
+        ds.attrs["group"] = g.upper() if g in ("u", "v") else g
+        output.append(ds)
+    # return xarray dataset(s)
+    return _output(output, group)
 
 
 def open_atlas_dataset(
     model_file: str | pathlib.Path,
     grid_file: str | pathlib.Path,
-    group: str | None = "z",
+    group: str | list = "z",
     chunks: int | dict | str | None = None,
     use_mmap: bool = False,
     **kwargs,
@@ -408,8 +475,8 @@ def open_atlas_dataset(
         Input model file
     grid_file: str, pathlib.Path
         Input model grid file
-    group: str, default 'z'
-        Tidal variable to read
+    group: str or list, default 'z'
+        Tidal variable(s) to read
 
             - ``'z'``: heights
             - ``'u'``: zonal currents
@@ -425,7 +492,7 @@ def open_atlas_dataset(
 
     Returns
     -------
-    ds: xarray.Dataset
+    ds: xarray.Dataset or tuple
         ATLAS tide model data
     """
     # default coordinate reference system
@@ -439,21 +506,24 @@ def open_atlas_dataset(
     if group == "z":
         # elevations are returned as (z, localz)
         dsh, dth = open_atlas_elevation(model_file, use_mmap=use_mmap)
-        ds2 = CompactDataset(dsh).combine_local(dth, chunks=chunks)
-    elif group in ("u", "U"):
-        # transports are returned as (u, v, localu, localv)
-        dsu, dtu, dsv, dtv = open_atlas_transport(model_file, use_mmap=use_mmap)
-        ds2 = CompactDataset(dsu).combine_local(dtu, chunks=chunks)
-    elif group in ("v", "V"):
+        ds2 = [CompactDataset(dsh).combine_local(dth, chunks=chunks)]
+    else:
         # transports are returned as (u, v, localu, localv)
         dsu, dtu, dsv, dtv = open_atlas_transport(model_file, use_mmap=use_mmap)
-        ds2 = CompactDataset(dsv).combine_local(dtv, chunks=chunks)
-    # merge datasets
-    ds = xr.merge([ds1, ds2], combine_attrs=combine_attrs, compat="override")
-    # add attributes
-    ds.attrs["group"] = group.upper() if group in ("u", "v") else group
-    # return xarray dataset
-    return ds
+        transports = ((dsu, dtu), (dsv, dtv))
+        ds2 = [
+            CompactDataset(ds).combine_local(dt, chunks=chunks)
+            for ds, dt in _select(transports, group)
+        ]
+    # merge datasets for each tidal variable
+    output = []
+    for g, d in zip(_groups(group), ds2):
+        ds = xr.merge([ds1, d], combine_attrs=combine_attrs, compat="override")
+        # add attributes
+        ds.attrs["group"] = g.upper() if g in ("u", "v") else g
+        output.append(ds)
+    # return xarray dataset(s)
+    return _output(output, group)
 
 
 # PURPOSE: read TMD3 netCDF4 files
@@ -491,7 +561,12 @@ def open_tmd3_dataset(
     if isinstance(input_file, pathlib.Path) and not input_file.exists():
         raise FileNotFoundError(f"File not found: {input_file}")
     # read the netCDF4-format tide grid file
-    tmp = xr.open_dataset(input_file, mask_and_scale=True, chunks=chunks)
+    tmp = xr.open_dataset(
+        input_file,
+        mask_and_scale=True,
+        chunks=chunks,
+        engine=pyTMD.utilities.detect_engine(input_file),
+    )
     # replace constituents array with names
     constituents = tmp.constituents.attrs["constituent_order"].split()
     tmp["constituents"] = constituents
@@ -759,32 +834,30 @@ def open_otis_elevation(
     h = dict(dims=("y", "x"), coords={}, data_vars={})
     h["coords"]["y"] = dict(data=y.copy(), dims="y")
     h["coords"]["x"] = dict(data=x.copy(), dims="x")
-    # read constituents from file
-    for ic in range(nc):
-        # get constituent name
-        field = constituents[ic].decode("utf8").rstrip()
-        h["data_vars"][field] = dict(dims=("y", "x"))
-        # skip records to constituent
-        offset += 8
-        # read elevations for constituent
-        temp = read_raw_binary(
-            input_file,
-            dtype=">f4",
-            shape=(ny, nx, 2),
-            use_mmap=use_mmap,
-            offset=offset,
-            order="C",
-        )
-        # real and imaginary components of elevation
-        Z = np.ma.array(temp[:, :, 0] + 1j * temp[:, :, 1])
-        # update mask for nan values
-        Z.mask = np.isnan(Z.data) | (np.abs(Z.data) == 0)
-        # replace masked values with fill value
-        Z.data[Z.mask] = Z.fill_value
-        # store the data
-        h["data_vars"][field]["data"] = Z
-        # skip to next constituent
-        offset += 4 * 2 * nx * ny
+    # read constituents from file using a single file handle
+    with open(input_file, mode="rb") as fid:
+        for ic in range(nc):
+            # get constituent name
+            field = constituents[ic].decode("utf8").rstrip()
+            h["data_vars"][field] = dict(dims=("y", "x"))
+            # skip records to constituent
+            offset += 8
+            # read elevations for constituent
+            temp = read_raw_binary(
+                fid,
+                dtype=">f4",
+                shape=(ny, nx, 2),
+                use_mmap=use_mmap,
+                offset=offset,
+                order="C",
+            )
+            # real and imaginary components of elevation
+            # mask nan and zero values and replace with fill value
+            Z = _mask_invalid(_to_complex(temp)[:, :, 0])
+            # store the data
+            h["data_vars"][field]["data"] = Z
+            # skip to next constituent
+            offset += 4 * 2 * nx * ny
     # convert to xarray Dataset from the data dictionary
     ds = xr.Dataset.from_dict(h)
     # coerce to specified chunks
@@ -883,37 +956,34 @@ def open_otis_transport(
     u["coords"]["x"] = dict(data=x - dx / 2.0, dims="x")
     v["coords"]["y"] = dict(data=y - dy / 2.0, dims="y")
     v["coords"]["x"] = dict(data=x.copy(), dims="x")
-    # read constituents from file
-    for ic in range(nc):
-        # get constituent name
-        field = constituents[ic].decode("utf8").rstrip()
-        u["data_vars"][field] = dict(dims=("y", "x"))
-        v["data_vars"][field] = dict(dims=("y", "x"))
-        # skip records to constituent
-        offset += 8
-        # read elevations for constituent
-        temp = read_raw_binary(
-            input_file,
-            dtype=">f4",
-            shape=(ny, nx, 4),
-            use_mmap=use_mmap,
-            offset=offset,
-            order="C",
-        )
-        # real and imaginary components of transport
-        U = np.ma.array(temp[:, :, 0] + 1j * temp[:, :, 1])
-        V = np.ma.array(temp[:, :, 2] + 1j * temp[:, :, 3])
-        # update mask for nan values
-        U.mask = np.isnan(U.data) | (np.abs(U.data) == 0)
-        V.mask = np.isnan(V.data) | (np.abs(V.data) == 0)
-        # replace masked values with fill value
-        U.data[U.mask] = U.fill_value
-        V.data[V.mask] = V.fill_value
-        # store the data
-        u["data_vars"][field]["data"] = U
-        v["data_vars"][field]["data"] = V
-        # skip to next constituent
-        offset += 4 * 4 * nx * ny
+    # read constituents from file using a single file handle
+    with open(input_file, mode="rb") as fid:
+        for ic in range(nc):
+            # get constituent name
+            field = constituents[ic].decode("utf8").rstrip()
+            u["data_vars"][field] = dict(dims=("y", "x"))
+            v["data_vars"][field] = dict(dims=("y", "x"))
+            # skip records to constituent
+            offset += 8
+            # read elevations for constituent
+            temp = read_raw_binary(
+                fid,
+                dtype=">f4",
+                shape=(ny, nx, 4),
+                use_mmap=use_mmap,
+                offset=offset,
+                order="C",
+            )
+            # real and imaginary components of transport
+            hc = _to_complex(temp)
+            # mask nan and zero values and replace with fill value
+            U = _mask_invalid(hc[:, :, 0])
+            V = _mask_invalid(hc[:, :, 1])
+            # store the data
+            u["data_vars"][field]["data"] = U
+            v["data_vars"][field]["data"] = V
+            # skip to next constituent
+            offset += 4 * 4 * nx * ny
     # convert to xarray Datasets from the data dictionaries
     dsu = xr.Dataset.from_dict(u)
     dsv = xr.Dataset.from_dict(v)
@@ -1283,32 +1353,30 @@ def open_atlas_elevation(
     h = dict(dims=("y", "x"), coords={}, data_vars={})
     h["coords"]["y"] = dict(data=y.copy(), dims="y")
     h["coords"]["x"] = dict(data=x.copy(), dims="x")
-    # read constituents from file
-    for ic in range(nc):
-        # get constituent name
-        field = constituents[ic].decode("utf8").rstrip()
-        h["data_vars"][field] = dict(dims=("y", "x"))
-        # skip records to constituent
-        offset += 8
-        # read elevations for constituent
-        temp = read_raw_binary(
-            input_file,
-            dtype=">f4",
-            shape=(ny, nx, 2),
-            use_mmap=use_mmap,
-            offset=offset,
-            order="C",
-        )
-        # real and imaginary components of elevation
-        Z = np.ma.array(temp[:, :, 0] + 1j * temp[:, :, 1])
-        # update mask for nan values
-        Z.mask = np.isnan(Z.data) | (np.abs(Z.data) == 0)
-        # replace masked values with fill value
-        Z.data[Z.mask] = Z.fill_value
-        # store the data
-        h["data_vars"][field]["data"] = Z
-        # skip to next constituent
-        offset += 4 * 2 * nx * ny
+    # read constituents from file using a single file handle
+    with open(input_file, mode="rb") as fid:
+        for ic in range(nc):
+            # get constituent name
+            field = constituents[ic].decode("utf8").rstrip()
+            h["data_vars"][field] = dict(dims=("y", "x"))
+            # skip records to constituent
+            offset += 8
+            # read elevations for constituent
+            temp = read_raw_binary(
+                fid,
+                dtype=">f4",
+                shape=(ny, nx, 2),
+                use_mmap=use_mmap,
+                offset=offset,
+                order="C",
+            )
+            # real and imaginary components of elevation
+            # mask nan and zero values and replace with fill value
+            Z = _mask_invalid(_to_complex(temp)[:, :, 0])
+            # store the data
+            h["data_vars"][field]["data"] = Z
+            # skip to next constituent
+            offset += 4 * 2 * nx * ny
     # convert to xarray Dataset from the data dictionary
     ds = xr.Dataset.from_dict(h)
     # add attributes
@@ -1532,37 +1600,34 @@ def open_atlas_transport(
     u["coords"]["x"] = dict(data=x - dx / 2.0, dims="x")
     v["coords"]["y"] = dict(data=y - dy / 2.0, dims="y")
     v["coords"]["x"] = dict(data=x.copy(), dims="x")
-    # read constituents from file
-    for ic in range(nc):
-        # get constituent name
-        field = constituents[ic].decode("utf8").rstrip()
-        u["data_vars"][field] = dict(dims=("y", "x"))
-        v["data_vars"][field] = dict(dims=("y", "x"))
-        # skip records to constituent
-        offset += 8
-        # read elevations for constituent
-        temp = read_raw_binary(
-            input_file,
-            dtype=">f4",
-            shape=(ny, nx, 4),
-            use_mmap=use_mmap,
-            offset=offset,
-            order="C",
-        )
-        # real and imaginary components of transport
-        U = np.ma.array(temp[:, :, 0] + 1j * temp[:, :, 1])
-        V = np.ma.array(temp[:, :, 2] + 1j * temp[:, :, 3])
-        # update mask for nan values
-        U.mask = np.isnan(U.data) | (np.abs(U.data) == 0)
-        V.mask = np.isnan(V.data) | (np.abs(V.data) == 0)
-        # replace masked values with fill value
-        U.data[U.mask] = U.fill_value
-        V.data[V.mask] = V.fill_value
-        # store the data
-        u["data_vars"][field]["data"] = U
-        v["data_vars"][field]["data"] = V
-        # skip to next constituent
-        offset += 4 * 4 * nx * ny
+    # read constituents from file using a single file handle
+    with open(input_file, mode="rb") as fid:
+        for ic in range(nc):
+            # get constituent name
+            field = constituents[ic].decode("utf8").rstrip()
+            u["data_vars"][field] = dict(dims=("y", "x"))
+            v["data_vars"][field] = dict(dims=("y", "x"))
+            # skip records to constituent
+            offset += 8
+            # read elevations for constituent
+            temp = read_raw_binary(
+                fid,
+                dtype=">f4",
+                shape=(ny, nx, 4),
+                use_mmap=use_mmap,
+                offset=offset,
+                order="C",
+            )
+            # real and imaginary components of transport
+            hc = _to_complex(temp)
+            # mask nan and zero values and replace with fill value
+            U = _mask_invalid(hc[:, :, 0])
+            V = _mask_invalid(hc[:, :, 1])
+            # store the data
+            u["data_vars"][field]["data"] = U
+            v["data_vars"][field]["data"] = V
+            # skip to next constituent
+            offset += 4 * 4 * nx * ny
     # convert to xarray Datasets from the data dictionaries
     dsu = xr.Dataset.from_dict(u)
     dsv = xr.Dataset.from_dict(v)
@@ -1776,8 +1841,8 @@ def read_raw_binary(
 
     Parameters
     ----------
-    path: str or pathlib.Path
-        Path to input file
+    path: str, pathlib.Path or file object
+        Path to input file or an open binary file
     dtype: numpy.dtype or str
         Variable data type
     shape: tuple
@@ -1794,8 +1859,12 @@ def read_raw_binary(
     var: numpy.ndarray
         Data variable
     """
-    # open the file and read the variable
-    with open(path, mode="rb") as fid:
+    # open the file (if not already open) and read the variable
+    if hasattr(path, "read"):
+        context = contextlib.nullcontext(path)
+    else:
+        context = open(path, mode="rb")
+    with context as fid:
         if use_mmap:
             # use memory-mapping
             var = np.memmap(
@@ -1809,15 +1878,83 @@ def read_raw_binary(
         else:
             # read variable directly
             count = np.prod(shape)
-            var = np.fromfile(
-                fid, dtype=np.dtype(dtype), offset=offset, count=count
-            )
+            fid.seek(offset)
+            var = np.fromfile(fid, dtype=np.dtype(dtype), count=count)
             var = var.reshape(shape, order=order)
     # verify data shape
     var.shape = shape
     return var
 
 
+# PURPOSE: reinterpret interleaved components as complex values
+def _to_complex(temp: np.ndarray):
+    """
+    Convert interleaved real and imaginary components to complex values
+
+    Parameters
+    ----------
+    temp: numpy.ndarray
+        Variable with alternating real and imaginary components
+        along the last dimension
+
+    Returns
+    -------
+    var: numpy.ndarray
+        Complex variable in native byte order
+    """
+    # convert to native byte order with a single copy
+    # and view pairs of components as complex values
+    var = np.ascontiguousarray(temp, dtype=np.float32)
+    return var.view(np.complex64)
+
+
+# PURPOSE: mask invalid complex values
+def _mask_invalid(var: np.ndarray):
+    """
+    Mask nan and zero-valued complex values
+
+    Parameters
+    ----------
+    var: numpy.ndarray
+        Complex variable
+
+    Returns
+    -------
+    var: numpy.ma.MaskedArray
+        Complex variable with invalid values masked
+        and replaced with the fill value
+    """
+    # build the mask in place with a single boolean array
+    mask = var == 0
+    np.logical_or(mask, np.isnan(var), out=mask)
+    # wrap the variable without copying the data or mask
+    var = np.ma.array(var, mask=mask)
+    # replace masked values with the fill value without indexing
+    np.copyto(var.data, var.fill_value, where=mask)
+    return var
+
+
+# PURPOSE: view complex values as interleaved components
+def _from_complex(var: np.ndarray):
+    """
+    Convert complex values to interleaved real and imaginary components
+
+    Parameters
+    ----------
+    var: numpy.ndarray
+        Complex variable
+
+    Returns
+    -------
+    temp: numpy.ndarray
+        Variable with alternating real and imaginary components
+        along the last dimension
+    """
+    # view complex values as pairs of single precision components
+    temp = np.ascontiguousarray(var, dtype=np.complex64).view(np.float32)
+    return temp.reshape(*np.shape(var)[:-1], -1)
+
+
 # PURPOSE: write a variable to a raw binary file with memory-mapping
 def write_raw_binary(
     path: str | pathlib.Path,
@@ -1842,8 +1979,8 @@ def write_raw_binary(
     kwargs: dict
         Additional keyword arguments for ``np.memmap``
     """
-    # convert variable to array
-    variable = np.array(variable)
+    # convert variable to array (without copying)
+    variable = np.asarray(variable)
     # set default keyword arguments
     kwargs.setdefault("shape", variable.shape)
     kwargs.setdefault("dtype", variable.dtype)
@@ -1858,7 +1995,8 @@ def write_raw_binary(
         shape=kwargs["shape"],
         order=order,
     )
-    var[:] = variable.astype(kwargs["dtype"])
+    # cast to output data type while writing
+    var[:] = variable
     var.flush()
 
 
@@ -2069,10 +2207,8 @@ class OTISDataTree:
         # write each constituent to file
         for c in ds.tmd.constituents:
             offset += 4
-            # merge real and imaginary components of elevation
-            temp = np.zeros((ny, nx, 2), dtype=">f4")
-            temp[:, :, 0] = ds[c].real.values
-            temp[:, :, 1] = ds[c].imag.values
+            # view elevation as interleaved real and imaginary components
+            temp = _from_complex(ds[c].values)
             write_raw_binary(path, temp, dtype=">f4", offset=offset)
             offset += 4 * 2 * nx * ny
             offset += 4
@@ -2121,15 +2257,16 @@ class OTISDataTree:
         )
         offset += 4 * nc
         offset += 4
+        # pre-sized buffer for u and v transports of each constituent
+        # viewed as interleaved real and imaginary components
+        buffer = np.empty((ny, nx, 2), dtype=np.complex64)
+        temp = _from_complex(buffer)
         # write each constituent to file
         for c in dsu.tmd.constituents:
             offset += 4
-            # merge real and imaginary components of u and v transports
-            temp = np.zeros((ny, nx, 4), dtype=">f4")
-            temp[:, :, 0] = dsu[c].real.values
-            temp[:, :, 1] = dsu[c].imag.values
-            temp[:, :, 2] = dsv[c].real.values
-            temp[:, :, 3] = dsv[c].imag.values
+            # fill buffer with u and v transports
+            buffer[:, :, 0] = dsu[c].values
+            buffer[:, :, 1] = dsv[c].values
             write_raw_binary(path, temp, dtype=">f4", offset=offset)
             offset += 4 * 4 * nx * ny
             offset += 4
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 dataset.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 An xarray.Dataset extension for tidal model data
 
 PYTHON DEPENDENCIES:
@@ -20,6 +20,20 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: cache parsed units strings to avoid repeated parsing
+        cache coordinate transformers between reference systems
+        cache padded global datasets instead of replacing the original
+        cache unit conversion factors and skip scaling by unity
+        flatten multidimensional coordinates before transforming
+        skip transforming coordinates between equivalent reference systems
+        use broadcast views of grid coordinates before transforming
+        transform copied coordinate arrays in place within pyproj
+        cache KD-trees of valid points for uncropped extrapolations
+        validate units attributes before caching unit conversions
+        defer importing pint and building the unit registry until needed
+        invalidate cached padded datasets and trees when variables change
+        retain masks when transforming masked coordinate arrays
+        only skip transforming plain arrays between equivalent systems
     Updated 06/2026: moved peak finding algorithm to prediction module
         drift type renamed to trajectory. drift still accepted as an alias
         added function to infer minor constituents and add to dataset
@@ -48,7 +62,7 @@ UPDATE HISTORY:
 """
 
 import re
-import pint
+import functools
 import pyproj
 import warnings
 import numpy as np
@@ -72,8 +86,6 @@ __all__ = [
     "_coords",
 ]
 
-# pint unit registry
-__ureg__ = pint.UnitRegistry()
 # default units for pyTMD outputs
 _default_units = {
     "elevation": "m",
@@ -387,6 +399,40 @@ class Dataset:
     def __init__(self, ds):
         # initialize Dataset
         self._ds = ds
+        # padded global Dataset (cached for repeated interpolations)
+        # stored with the variables used to create it
+        self._padded = None
+        # KD-tree of valid points (cached for repeated extrapolations)
+        # stored with the variables used to create it
+        self._tree = None
+
+    def _cache_key(self) -> tuple:
+        """
+        Variables of the ``Dataset`` for validating cached data
+
+        Assigning to a variable replaces it and invalidates the cache
+        """
+        return tuple(self._ds.variables.items())
+
+    def _cached(self, cache: tuple | None) -> Any:
+        """
+        Get cached data if created from the current ``Dataset`` variables
+
+        Parameters
+        ----------
+        cache: tuple or None
+            Variables used to create the cached data and the cached data
+        """
+        if cache is None:
+            return None
+        key, value = cache
+        current = self._cache_key()
+        if (len(key) != len(current)) or any(
+            (k1 != k2) or (v1 is not v2)
+            for (k1, v1), (k2, v2) in zip(key, current)
+        ):
+            return None
+        return value
 
     def to_dataarray(self, **kwargs):
         """
@@ -479,8 +525,8 @@ class Dataset:
         # crop dataset to bounding box of other dataset plus buffer
         if np.isfinite(cutoff) and self.crs.is_geographic:
             # use twice the cutoff distance as a buffer
-            cutoff_km = cutoff * __ureg__.parse_units("km")
-            a_axis = 6378.137 * __ureg__.parse_units("km")
+            cutoff_km = cutoff * _unit_registry().parse_units("km")
+            a_axis = 6378.137 * _unit_registry().parse_units("km")
             buffer = 2.0 * (cutoff_km / a_axis).to(self.axis_units).magnitude
             # bounds of interpolation coordinates
             bounds = [np.min(x), np.max(x), np.min(y), np.max(y)]
@@ -488,7 +534,7 @@ class Dataset:
             ds = self.crop(bounds=bounds, buffer=buffer)
         elif np.isfinite(cutoff):
             # use twice the cutoff distance as a buffer
-            cutoff_km = cutoff * __ureg__.parse_units("km")
+            cutoff_km = cutoff * _unit_registry().parse_units("km")
             buffer = 2.0 * cutoff_km.to(self.axis_units).magnitude
             # bounds of interpolation coordinates
             bounds = [np.min(x), np.max(x), np.min(y), np.max(y)]
@@ -703,14 +749,14 @@ class Dataset:
         # crop dataset to bounding box of other dataset plus buffer
         if np.isfinite(cutoff) and self.crs.is_geographic:
             # use twice the cutoff distance as a buffer
-            cutoff_km = cutoff * __ureg__.parse_units("km")
-            a_axis = 6378.137 * __ureg__.parse_units("km")
+            cutoff_km = cutoff * _unit_registry().parse_units("km")
+            a_axis = 6378.137 * _unit_registry().parse_units("km")
             buffer = 2.0 * (cutoff_km / a_axis).to(self.axis_units).magnitude
             # crop dataset to bounding box of other dataset plus buffer
             ds = self.crop(bounds=bounds, buffer=buffer)
         elif np.isfinite(cutoff):
             # use twice the cutoff distance as a buffer
-            cutoff_km = cutoff * __ureg__.parse_units("km")
+            cutoff_km = cutoff * _unit_registry().parse_units("km")
             buffer = 2.0 * cutoff_km.to(self.axis_units).magnitude
             # crop dataset to bounding box of other dataset plus buffer
             ds = self.crop(bounds=bounds, buffer=buffer)
@@ -729,9 +775,16 @@ class Dataset:
         else:
             # calculate meshgrid of cropped model coordinates
             gridx, gridy = np.meshgrid(ds.x.values, ds.y.values)
-        # initialize valid mask for building tree
-        valid_mask = np.zeros_like(gridx, dtype=bool)
-        tree = None
+        # KD-tree of the uncropped dataset can be reused between calls
+        # until variables in the dataset are replaced
+        cache = not np.isfinite(cutoff)
+        cached_tree = self._cached(self._tree) if cache else None
+        if cached_tree is not None:
+            valid_mask, valid_indices, tree = cached_tree
+        else:
+            # initialize valid mask for building tree
+            valid_mask = np.zeros_like(gridx, dtype=bool)
+            tree = None
         # iterate over variables in dataset
         for i, v in enumerate(other.data_vars.keys()):
             # check for missing values
@@ -756,6 +809,10 @@ class Dataset:
                 tree = _build_tree(p_in)
                 # copy valid mask for next iteration
                 valid_mask = np.copy(mask)
+                # cache tree for later extrapolations
+                if cache:
+                    cached_tree = (valid_mask, valid_indices, tree)
+                    self._tree = (self._cache_key(), cached_tree)
             # reduce model to valid original values
             flattened = ds[v].values[valid_indices]
             # extrapolate missing values using NN or IDW
@@ -807,23 +864,30 @@ class Dataset:
             Interpolated ``Dataset``
         """
         # pad global grids along x-dimension (if necessary)
+        # padded dataset is cached and reused for later interpolations
+        # until variables in the dataset are replaced
         if self.is_global:
-            self._ds = self.pad(n=1)
+            ds = self._cached(self._padded)
+            if ds is None:
+                ds = self.pad(n=1)
+                self._padded = (self._cache_key(), ds)
+        else:
+            ds = self._ds
         # verify longitudinal convention for geographic models
         if self.crs.is_geographic:
             # grid spacing in x-direction
             dx = self._x[1] - self._x[0]
             # adjust input longitudes to be consistent with model
-            if (np.min(x) < 0.0) & (self._x.max() > (180.0 + dx)):
+            if (np.min(x) < 0.0) & (ds.x.values.max() > (180.0 + dx)):
                 # input points convention (-180:180)
                 # tide model convention (0:360)
                 x = xr.where(x < 0.0, x + 360.0, x)
-            elif (np.max(x) > 180.0) & (self._x.min() < (0.0 - dx)):
+            elif (np.max(x) > 180.0) & (ds.x.values.min() < (0.0 - dx)):
                 # input points convention (0:360)
                 # tide model convention (-180:180)
                 x = xr.where(x > 180.0, x - 360.0, x)
         # interpolate dataset using built-in xarray methods
-        other = self._ds.interp(x=x, y=y, method=method)
+        other = ds.interp(x=x, y=y, method=method)
         # return xarray dataset
         return other
 
@@ -1299,9 +1363,9 @@ class DataArray:
             Scaling factor to apply
         """
         # convert to specified units
-        conversion = value * self.quantity.to(units)
-        da = self._da * conversion.magnitude
-        da.attrs["units"] = str(conversion.units)
+        scale, units = self._conversion(units)
+        da = self._scale(value * scale)
+        da.attrs["units"] = units
         return da
 
     def to_base_units(self, value=1.0):
@@ -1313,9 +1377,9 @@ class DataArray:
             Scaling factor to apply
         """
         # convert to base units
-        conversion = value * self.quantity.to_base_units()
-        da = self._da * conversion.magnitude
-        da.attrs["units"] = str(conversion.units)
+        scale, units = self._conversion()
+        da = self._scale(value * scale)
+        da.attrs["units"] = units
         return da
 
     def to_default_units(self, value=1.0):
@@ -1363,6 +1427,7 @@ class DataArray:
             raise ValueError(f"Unknown unit group: {self._units}")
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def _parse_units(units: str):
         """
         Convert units attributes to ``pint`` units
@@ -1375,7 +1440,61 @@ class DataArray:
             flags=re.IGNORECASE,
         )
         # parse units string using pint
-        return __ureg__.parse_units(units.lower())
+        return _unit_registry().parse_units(units.lower())
+
+    def _conversion(self, target: str | None = None):
+        """
+        Scaling factor and units string for converting the ``DataArray``
+
+        Parameters
+        ----------
+        target: str or None, default None
+            Output units (``None`` for base units)
+        """
+        # validate units before the (hashed) cached conversion
+        if not isinstance(self._units, str):
+            raise ValueError(f"Unknown units: {self._units}")
+        return self._cached_conversion(self._units, target)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _cached_conversion(units: str, target: str | None = None):
+        """
+        Scaling factor and units string for converting units
+
+        Parameters
+        ----------
+        units: str
+            Input units attribute
+        target: str or None, default None
+            Output units (``None`` for base units)
+        """
+        # parse units and convert to target units
+        try:
+            quantity = 1.0 * DataArray._parse_units(units)
+        except TypeError as exc:
+            raise ValueError(f"Unknown units: {units}") from exc
+        if target is None:
+            conversion = quantity.to_base_units()
+        else:
+            conversion = quantity.to(target)
+        return (float(conversion.magnitude), str(conversion.units))
+
+    def _scale(self, scale: float):
+        """
+        Scale the ``DataArray`` (skipping if the scale is unity)
+
+        Unscaled outputs are shallow copies that share data with the
+        input ``DataArray`` and should not be modified in place
+
+        Parameters
+        ----------
+        scale: float
+            Scaling factor to apply
+        """
+        if scale == 1.0:
+            return self._da.copy(deep=False)
+        return self._da * scale
 
     @property
     def _units(self):
@@ -1549,17 +1668,90 @@ def _transform(
     kwargs.setdefault("direction", "FORWARD")
     if kwargs["direction"] not in ("FORWARD", "INVERSE", "IDENT"):
         raise ValueError("Invalid transformation direction")
-    # get the coordinate reference system and transform
+    # get the coordinate reference systems and (cached) transformer
     source_crs = pyproj.CRS.from_user_input(source_crs)
-    transformer = pyproj.Transformer.from_crs(
-        source_crs, target_crs, always_xy=True
-    )
+    target_crs = pyproj.CRS.from_user_input(target_crs)
+    # skip the transformation for equivalent coordinate reference systems
+    # other input types are passed to pyproj to retain types and masks
+    if (
+        source_crs.equals(target_crs, ignore_axis_order=True)
+        and _is_plain_array(i1)
+        and _is_plain_array(i2)
+    ):
+        o1 = np.array(i1, dtype=np.float64, order="C")
+        o2 = np.array(i2, dtype=np.float64, order="C")
+        return (o1, o2)
+    transformer = _transformer(source_crs, target_crs)
+    # copy arrays once into flattened double precision output arrays
+    # that are transformed in place to avoid further copies within pyproj
+    # masked arrays are transformed by pyproj to retain their masks
+    if _is_plain_array(i1) and _is_plain_array(i2) and (i1.shape == i2.shape):
+        shape = i1.shape
+        o1 = np.array(i1, dtype=np.float64, order="C").ravel()
+        o2 = np.array(i2, dtype=np.float64, order="C").ravel()
+        # convert coordinate reference system and restore shape
+        transformer.transform(o1, o2, inplace=True, **kwargs)
+        return (o1.reshape(shape), o2.reshape(shape))
     # convert coordinate reference system
     o1, o2 = transformer.transform(i1, i2, **kwargs)
     # return the transformed coordinates
     return (o1, o2)
 
 
+def _is_plain_array(i: Any) -> bool:
+    """
+    Check if an input is a non-scalar and unmasked ``numpy`` array
+
+    Parameters
+    ----------
+    i: Any
+        Input coordinates
+    """
+    return (
+        isinstance(i, np.ndarray)
+        and not np.ma.isMaskedArray(i)
+        and (i.ndim > 0)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _unit_registry():
+    """
+    Build and cache the ``pint`` unit registry on first use
+
+    Returns
+    -------
+    ureg: pint.UnitRegistry
+        Registry of units
+    """
+    import pint
+
+    return pint.UnitRegistry()
+
+
+@functools.lru_cache(maxsize=16)
+def _transformer(
+    source_crs: pyproj.CRS,
+    target_crs: pyproj.CRS,
+):
+    """
+    Build and cache a transformer between coordinate reference systems
+
+    Parameters
+    ----------
+    source_crs: pyproj.CRS
+        Coordinate reference system of input coordinates
+    target_crs: pyproj.CRS
+        Coordinate reference system of output coordinates
+
+    Returns
+    -------
+    transformer: pyproj.Transformer
+        Transformer between the coordinate reference systems
+    """
+    return pyproj.Transformer.from_crs(source_crs, target_crs, always_xy=True)
+
+
 def _coords(
     x: np.ndarray,
     y: np.ndarray,
@@ -1625,7 +1817,9 @@ def _coords(
         raise ValueError("Coordinate data type must be a string")
     # convert coordinates to a new coordinate reference system
     if (coord_type == "grid") and (np.size(x) != np.size(y)):
-        gridx, gridy = np.meshgrid(x, y)
+        # broadcast views of the grid coordinates (copied once when
+        # converted to contiguous arrays for the transformation)
+        gridx, gridy = np.meshgrid(x, y, copy=False)
         mx, my = _transform(
             gridx,
             gridy,
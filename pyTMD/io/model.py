@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 model.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Retrieves tide model parameters for named tide models and
     from model definition files
 
@@ -13,6 +13,9 @@ PYTHON DEPENDENCIES:
         https://docs.xarray.dev/en/stable/
 
 UPDATE HISTORY:
+    Updated 10/2026: read shared OTIS transport files once for currents
+        reduce model files of the requested group to a subset of constituents
+        look up current groups case-insensitively for shared transports
     Updated 06/2026: add validate argument to from_dict method
         split old parse json function into a series of validation functions
     Updated 04/2026: add __variables__ attribute containing model variables
@@ -850,10 +853,10 @@ class model:
         group = kwargs["group"].lower()
         if group not in ("z", "u", "v"):
             raise ValueError(f"Invalid model group {group}")
+        # reduce constituents if specified
+        self.reduce_constituents(kwargs["constituents"], group=group)
         # extract model file
         model_file = self[group].get("model_file")
-        # reduce constituents if specified
-        self.reduce_constituents(kwargs["constituents"])
         if self.format in ("OTIS", "ATLAS-compact", "TMD3"):
             # open OTIS/TMD3/ATLAS-compact files as xarray Dataset
             ds = OTIS.open_dataset(
@@ -881,6 +884,97 @@ class model:
             ds = FES.open_mfdataset(
                 model_file, format=self.file_format, **kwargs
             )
+        # return xarray dataset
+        return self._update_dataset(ds, self[group].units, **kwargs)
+
+    def _open_transports(self, group: list, **kwargs):
+        """
+        Open model currents sharing OTIS-formatted transport files
+        as xarray Datasets while reading each file only once
+
+        Parameters
+        ----------
+        group: list
+            List of model current groups to extract
+        kwargs: dict
+            Additional keyword arguments for opening model files
+
+        Returns
+        -------
+        ds: tuple
+            Tide model data for each group
+        """
+        # import tide model functions
+        from pyTMD.io import OTIS
+
+        # set default keyword arguments
+        kwargs.setdefault("use_default_units", True)
+        kwargs.setdefault("append_node", False)
+        kwargs.setdefault("compressed", self.compressed)
+        kwargs.setdefault("constituents", None)
+        # keep the case of the groups to read transports (U, V)
+        # or currents (u, v) while model attributes are lower case
+        kwargs["group"] = list(group)
+        g0 = group[0].lower()
+        # reduce constituents if specified
+        self.reduce_constituents(kwargs["constituents"], group=g0)
+        # open OTIS/ATLAS-compact files as xarray Datasets
+        ds = OTIS.open_dataset(
+            self[g0].get("model_file"),
+            grid_file=self[g0].get("grid_file"),
+            format=self.file_format,
+            crs=self.crs,
+            **kwargs,
+        )
+        # return xarray datasets
+        return tuple(
+            self._update_dataset(d, self[g.lower()].units, **kwargs)
+            for d, g in zip(ds, kwargs["group"])
+        )
+
+    def _shared_transports(self, group: tuple | list) -> list:
+        """
+        Find model current groups that share OTIS-formatted transport files
+
+        Parameters
+        ----------
+        group: tuple or list
+            List of model types to extract
+        """
+        # only OTIS-formatted models store currents as (u, v) pairs
+        if self.format not in ("OTIS", "ATLAS-compact"):
+            return []
+        # reduce to available current groups
+        currents = [g for g in group if g.lower() in ("u", "v")]
+        currents = [g for g in currents if hasattr(self, g.lower())]
+        # check that the currents share the same model and grid files
+        files = {
+            (
+                str(self[g.lower()].get("model_file")),
+                str(self[g.lower()].get("grid_file")),
+            )
+            for g in currents
+        }
+        return currents if (len(currents) > 1) and (len(files) == 1) else []
+
+    def _update_dataset(self, ds: xr.Dataset, units: str, **kwargs):
+        """
+        Update attributes and units of model Datasets
+
+        Parameters
+        ----------
+        ds: xarray.Dataset
+            Tide model data
+        units: str
+            Units of the model group defined in the database
+        kwargs: dict
+            Additional keyword arguments for opening model files
+
+        Returns
+        -------
+        ds: xarray.Dataset
+            Tide model data
+        """
         # append node equilibrium tide if not in constituents list
         if kwargs["append_node"] and ("node" not in ds.tmd.constituents):
             # calculate and append node equilibrium tide
@@ -893,7 +987,7 @@ class model:
         # if units cannot be parsed: use value defined in the model database
         for c in ds.tmd.constituents:
             if not ds[c].tmd._has_compatible_units:
-                ds[c].attrs["units"] = self[group].units
+                ds[c].attrs["units"] = units
         # convert to default units
         if kwargs["use_default_units"]:
             ds = ds.tmd.to_default_units()
@@ -920,6 +1014,12 @@ class model:
         dtree: xr.DataTree
             Tide model data
         """
+        # read currents sharing OTIS-formatted transport files at once
+        shared = self._shared_transports(group)
+        transports = {}
+        if shared:
+            ds = self._open_transports(shared, **kwargs)
+            transports.update(zip(shared, ds))
         # output dictionary of xarray Datasets
         ds = {}
         # try to read model files
@@ -928,7 +1028,10 @@ class model:
             if not hasattr(self, g.lower()):
                 continue
             # open xarray Dataset
-            ds[g] = self.open_dataset(group=g, **kwargs)
+            if g in transports:
+                ds[g] = transports[g]
+            else:
+                ds[g] = self.open_dataset(group=g, **kwargs)
         # create xarray DataTree from dictionary
         dtree = xr.DataTree.from_dict(ds)
         # return the model xarray DataTree
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 math.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Special functions of mathematical physics
 
 PYTHON DEPENDENCIES:
@@ -12,6 +12,10 @@ PYTHON DEPENDENCIES:
         https://docs.scipy.org/doc/
 
 UPDATE HISTORY:
+    Updated 10/2026: add phasor function using sine and cosine evaluations
+        fill real and imaginary components of phasors in place
+        apply phasor calculation to the underlying data of DataArrays
+        evaluate associated Legendre coefficients for all terms at once
     Updated 06/2026: standardize use of lambda (lmda) to denote longitudes
     Updated 05/2026: added kronecker delta function and updated docstrings
     Updated 03/2026: add radius and scalar product functions
@@ -32,7 +36,8 @@ UPDATE HISTORY:
 from __future__ import annotations
 
 import numpy as np
-from scipy.special import factorial
+import xarray as xr
+from scipy.special import factorial, gamma
 
 __all__ = [
     "asec2rad",
@@ -41,6 +46,7 @@ __all__ = [
     "rad2masec",
     "polynomial_sum",
     "normalize_angle",
+    "phasor",
     "radius",
     "rotate",
     "scalar_product",
@@ -140,6 +146,71 @@ def normalize_angle(
     return np.mod(theta, circle)
 
 
+def phasor(
+    amplitude: float | np.ndarray | xr.DataArray,
+    phase: float | np.ndarray | xr.DataArray,
+):
+    """
+    Calculate the complex form of an oscillation from its
+    amplitude and phase lag
+
+    Parameters
+    ----------
+    amplitude: float, np.ndarray or xr.DataArray
+        Amplitude of the oscillation
+    phase: float, np.ndarray or xr.DataArray
+        Phase lag of the oscillation (degrees)
+    """
+    # apply to the underlying (numpy or dask) data of DataArrays
+    if isinstance(amplitude, xr.DataArray) or isinstance(phase, xr.DataArray):
+        dtypes = [getattr(x, "dtype", np.float64) for x in (amplitude, phase)]
+        dtype = np.result_type(*dtypes, np.complex64)
+        return xr.apply_ufunc(
+            _phasor,
+            amplitude,
+            phase,
+            dask="parallelized",
+            output_dtypes=[dtype],
+        )
+    return _phasor(amplitude, phase)
+
+
+def _phasor(
+    amplitude: float | np.ndarray,
+    phase: float | np.ndarray,
+):
+    """
+    Calculate the complex form of an oscillation by filling the
+    real and imaginary components of a single output array
+
+    Parameters
+    ----------
+    amplitude: float or np.ndarray
+        Amplitude of the oscillation
+    phase: float or np.ndarray
+        Phase lag of the oscillation (degrees)
+    """
+    # masked arrays are calculated at double precision
+    masked = np.ma.isMaskedArray(amplitude) or np.ma.isMaskedArray(phase)
+    ctype = np.complex128 if masked else np.complex64
+    amp = np.asarray(np.ma.getdata(amplitude))
+    theta = np.radians(np.ma.getdata(phase))
+    dtype = np.result_type(amp, theta, ctype)
+    # evaluate the real sine and cosine functions rather
+    # than the exponential of complex phase angles
+    hc = np.empty(np.broadcast_shapes(amp.shape, theta.shape), dtype=dtype)
+    ftype = hc.real.dtype
+    np.multiply(amp, np.cos(theta), out=hc.real, dtype=ftype)
+    np.multiply(amp, np.sin(theta), out=hc.imag, dtype=ftype)
+    np.negative(hc.imag, out=hc.imag)
+    # propagate masks from the amplitude and phase
+    if masked:
+        mask = np.ma.getmaskarray(amplitude) | np.ma.getmaskarray(phase)
+        hc = np.ma.array(hc, mask=mask)
+    # return as a scalar for scalar inputs
+    return hc[()]
+
+
 def radius(
     x: float | np.ndarray,
     y: float | np.ndarray,
@@ -354,17 +425,18 @@ def _assoc_legendre(
     u = np.sqrt(1.0 - x**2)
     # calculate un-normalized polynomials
     # function 1.67 from Hofmann-Wellenhof (2006)
+    # coefficients for each term are evaluated for all k at once
+    k = np.arange((l - m) // 2 + 1, dtype=np.float64)
+    coefficients = (
+        np.power(-1.0, k)
+        * gamma(2.0 * l - 2.0 * k + 1.0)
+        / gamma(k + 1.0)
+        / gamma(l - k + 1.0)
+        / gamma(l - m - 2.0 * k + 1.0)
+    )
     P = 0.0
-    r = int((l - m) // 2)
-    for k in range(r + 1):
-        P += (
-            np.power(-1.0, k)
-            * factorial(2.0 * l - 2.0 * k)
-            / factorial(k)
-            / factorial(l - k)
-            / factorial(l - m - 2.0 * k)
-            * np.power(x, l - m - 2.0 * k)
-        )
+    for c, p in zip(coefficients, l - m - 2.0 * k):
+        P += c * np.power(x, p)
     # calculate for degree l and order m
     Plm = P * np.power(2.0, -l) * np.power(u, m)
     # apply Condon-Shortley phase
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 ocean_load.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Prediction routines for ocean, load and (long-period) equilibrium tides
 
 REFERENCES:
@@ -27,6 +27,16 @@ PROGRAM DEPENDENCIES:
     math.py: Special functions of mathematical physics
 
 UPDATE HISTORY:
+    Updated 10/2026: sum harmonics with a single contraction of complex weights
+        predict gridded outputs in blocks of times to bound peak memory
+        add option to sum harmonics in single precision
+        skip predicting and inferring tides at invalid trajectory points
+        evaluate nodal arguments once for all admittance-inferred species
+        sum gridded harmonics as a real-valued matrix product
+        only evaluate complex phases of inferred short-period constituents
+        find valid trajectory points without stacking the constituents
+        fuse nodal factors and phase angles into a single array of weights
+        accumulate phase angles in place to avoid temporary arrays
     Updated 06/2026: moved function to find peaks in a tidal time series
         separated interpolation of admittances from inference functions
         added an admittance function for short-period minor constituents
@@ -127,6 +137,7 @@ __all__ = [
     "_infer_semi_diurnal",
     "_infer_diurnal",
     "_infer_long_period",
+    "_infer_admittances",
     "minor_admittance",
     "_admittance_short_period",
     "_admittance_semi_diurnal",
@@ -154,6 +165,11 @@ def time_series(
         Days relative to 1992-01-01T00:00:00
     ds: xarray.Dataset
         Dataset containing tidal harmonic constants
+    dtype: np.dtype or None, default None
+        Floating point precision of the predicted tides
+
+            - ``None``: promote to double precision
+            - ``np.float32``: single precision for 32-bit models
     kwargs: dict
         Keyword arguments for :py:func:`pyTMD.constituents.arguments`
 
@@ -164,6 +180,13 @@ def time_series(
     """
     # set default keyword arguments
     kwargs.setdefault("corrections", "OTIS")
+    # reduce trajectories to points with valid harmonic constants
+    valid = _valid_points(ds)
+    if valid is not None:
+        kwargs = _reduce_deltat(valid, **kwargs)
+        i = valid.values
+        tpred = time_series(np.atleast_1d(t)[i], ds.isel(time=i), **kwargs)
+        return _expand_points(tpred, valid, t)
     # convert time to Modified Julian Days (MJD)
     MJD = t + _mjd_tide
     # list of constituents
@@ -176,33 +199,31 @@ def time_series(
         t = np.atleast_1d(t)
         # load parameters for constituents
         _, p, o, _, _ = pyTMD.constituents._constituent_parameters(constituents)
-        # broadcast parameters to time and constituent dimensions
-        omega, phase0, t0 = np.broadcast_arrays(
-            o[None, :], p[None, :], t[:, None], subok=True
-        )
         # calculate phase angle from frequency and phase-0
         # convert angular frequency to radians per day
-        theta = 86400.0 * omega * t0 + phase0 + pu
+        # (broadcast to time and constituent dimensions with a single
+        # allocation and accumulate the phase terms in place)
+        theta = (86400.0 * o)[None, :] * t[:, None]
+        theta += p[None, :]
+        theta += pu
     else:
         # phase angle from arguments
-        theta = np.radians(G) + pu
+        theta = np.radians(G)
+        theta += pu
     # dataset of arguments
     arguments = xr.Dataset(
         data_vars=dict(
             u=(["time", "constituent"], pu),
             f=(["time", "constituent"], pf),
             G=(["time", "constituent"], G),
-            theta=(["time", "constituent"], np.exp(1j * theta)),
+            theta=(["time", "constituent"], theta),
         ),
         coords=dict(time=np.atleast_1d(MJD), constituent=constituents),
     )
     # convert Dataset to DataArray of complex tidal harmonics
     darr = ds.tmd.to_dataarray(constituents=constituents)
     # sum over tidal constituents
-    tpred = (
-        darr.real * arguments.f * arguments.theta.real
-        - darr.imag * arguments.f * arguments.theta.imag
-    ).sum(dim="constituent", skipna=False)
+    tpred = _harmonic_sum(darr, arguments, dtype=kwargs.get("dtype"))
     # check if chunks are present
     if hasattr(tpred, "chunks") and tpred.chunks is not None:
         tpred = tpred.chunk(-1).compute()
@@ -213,6 +234,171 @@ def time_series(
     return tpred
 
 
+# PURPOSE: find trajectory points with valid harmonic constants
+def _valid_points(ds: xr.Dataset):
+    """
+    Find trajectory points where all tidal harmonic constants are valid
+
+    Parameters
+    ----------
+    ds: xarray.Dataset
+        Dataset containing tidal harmonic constants
+
+    Returns
+    -------
+    valid: xr.DataArray or None
+        Valid points if any trajectory points are invalid
+    """
+    # only reduce trajectories that are not chunked with dask
+    if ("time" not in ds.dims) or ds.chunks:
+        return None
+    # points where all constituents are valid (for any component)
+    # reduce in place without stacking the constituents into a new array
+    c0, *constituents = ds.tmd.constituents
+    darr = ds[c0].notnull()
+    for c in constituents:
+        darr &= ds[c].notnull()
+    dims = [d for d in darr.dims if d != "time"]
+    valid = darr.any(dim=dims) if dims else darr
+    # skip reducing if all (or no) points are valid
+    if valid.all() or not valid.any():
+        return None
+    return valid
+
+
+# PURPOSE: reduce time corrections to valid trajectory points
+def _reduce_deltat(valid: xr.DataArray, **kwargs):
+    """
+    Reduce time corrections to valid trajectory points
+
+    Parameters
+    ----------
+    valid: xr.DataArray
+        Valid trajectory points
+    kwargs: dict
+        Keyword arguments for prediction functions
+
+    Returns
+    -------
+    kwargs: dict
+        Keyword arguments with reduced time corrections
+    """
+    if np.ndim(kwargs.get("deltat", 0.0)) > 0:
+        kwargs["deltat"] = np.asarray(kwargs["deltat"])[valid.values]
+    return kwargs
+
+
+# PURPOSE: expand predictions at valid points to all trajectory points
+def _expand_points(
+    darr: xr.DataArray | float,
+    valid: xr.DataArray,
+    t: np.ndarray,
+):
+    """
+    Expand predictions at valid points to all trajectory points
+
+    Parameters
+    ----------
+    darr: xr.DataArray or float
+        Predicted tides at valid points
+    valid: xr.DataArray
+        Valid trajectory points
+    t: np.ndarray
+        Days relative to 1992-01-01T00:00:00
+
+    Returns
+    -------
+    tpred: xr.DataArray or float
+        Predicted tides with invalid points set to NaN
+    """
+    # no tides were predicted
+    if not isinstance(darr, xr.DataArray):
+        return darr
+    # index of the nearest preceding valid point for each point
+    index = np.maximum(np.cumsum(valid.values) - 1, 0)
+    # expand to all points and mask the invalid points
+    mask = xr.DataArray(valid.values, dims="time")
+    tpred = darr.isel(time=index).where(mask)
+    # restore coordinates of all points
+    tpred = tpred.assign_coords(time=np.atleast_1d(t + _mjd_tide))
+    tpred = tpred.assign_coords(valid.coords)
+    tpred.attrs.update(darr.attrs)
+    return tpred
+
+
+# PURPOSE: sum the complex tidal harmonics over constituents
+def _harmonic_sum(
+    darr: xr.DataArray,
+    arguments: xr.Dataset,
+    dtype: np.dtype | None = None,
+    max_size: int = 2**24,
+):
+    """
+    Sum the real component of the complex tidal harmonics
+    multiplied by the nodal factors and phase angles
+
+    Parameters
+    ----------
+    darr: xr.DataArray
+        complex tidal harmonics
+    arguments: xr.Dataset
+        nodal factors (``f``) and phase angles (``theta``)
+    dtype: np.dtype or None, default None
+        Floating point precision of the summation
+
+            - ``None``: promote to the precision of the arguments
+    max_size: int, default 2**24
+        Maximum number of values to evaluate at once
+        when predicting gridded outputs at multiple times
+    """
+    # complex weights for each time and constituent: f*exp(i*theta)
+    # filled from the real sine and cosine of the phase angles
+    # without allocating temporary complex arrays
+    theta = arguments.theta.values
+    w = np.empty(theta.shape, dtype=np.result_type(theta, np.complex64))
+    np.cos(theta, out=w.real)
+    np.sin(theta, out=w.imag)
+    w.real *= arguments.f.values
+    w.imag *= arguments.f.values
+    weights = arguments.theta.copy(data=w)
+    # reduce precision of complex products if specified
+    # (single precision halves the memory of the summation)
+    if dtype is not None:
+        ctype = np.result_type(dtype, np.complex64)
+        weights = weights.astype(ctype)
+        darr = darr.astype(ctype, copy=False)
+    # contract over the constituent dimension for trajectories
+    # and dask arrays (propagates invalid points as with skipna=False)
+    if ("time" in darr.dims) or darr.chunks:
+        return xr.dot(darr, weights, dim="constituent").real
+    # align weights with the constituents of the harmonics
+    weights = weights.sel(constituent=darr["constituent"].values)
+    # output dimensions and coordinates
+    dims = [d for d in darr.dims if d != "constituent"]
+    coords = {
+        k: v for k, v in darr.coords.items() if "constituent" not in v.dims
+    }
+    # stack the real and imaginary components of the harmonics and weights
+    # to calculate the real part of the complex summation as a single
+    # real-valued matrix product: Re(h*w) = Re(h)*Re(w) - Im(h)*Im(w)
+    h = darr.transpose(*dims, "constituent").values
+    h = np.concatenate([h.real, -h.imag], axis=-1)
+    w = weights.transpose("time", "constituent").values
+    w = np.concatenate([w.real, w.imag], axis=-1)
+    # number of spatial points and times in the output
+    npts = darr.size // darr.sizes["constituent"]
+    nt = weights.sizes["time"]
+    # predict in blocks of times to bound the size of temporary products
+    # with the real output allocated once and filled for each block
+    tpred = np.empty((*h.shape[:-1], nt), dtype=np.result_type(h, w))
+    step = max(1, max_size // npts)
+    for i in range(0, nt, step):
+        tpred[..., i : i + step] = h @ w[i : i + step].T
+    # return the summation as a DataArray
+    tpred = xr.DataArray(tpred, dims=(*dims, "time"), coords=coords)
+    return tpred.assign_coords(time=weights["time"])
+
+
 # PURPOSE: infer the minor corrections from the major constituents
 def infer_minor(
     t: float | np.ndarray,
@@ -240,6 +426,8 @@ def infer_minor(
         Try to infer long period tides from constituents
     raise_exception: bool, default False
         Raise a ``ValueError`` if major constituents are not found
+    dtype: np.dtype or None, default None
+        Floating point precision of the inferred tides
 
     Returns
     -------
@@ -253,6 +441,13 @@ def infer_minor(
     kwargs.setdefault("raise_exception", False)
     # list of minor constituents
     kwargs.setdefault("minor", None)
+    # reduce trajectories to points with valid harmonic constants
+    valid = _valid_points(ds)
+    if valid is not None:
+        kwargs = _reduce_deltat(valid, **kwargs)
+        i = valid.values
+        tinfer = infer_minor(np.atleast_1d(t)[i], ds.isel(time=i), **kwargs)
+        return _expand_points(tinfer, valid, t)
     # infer the minor tidal constituents
     tinfer = 0.0
     constituents = []
@@ -265,12 +460,26 @@ def infer_minor(
     # infer long-period tides for minor constituents
     if kwargs["infer_long_period"]:
         species.append("long_period")
-    # infer minor constituents for each species
+    # interpolate admittances or infer minor constituents for each species
+    admittances = []
     for s in species:
+        if s in ("semi_diurnal", "diurnal", "long_period"):
+            darr = _admittance[s](ds, **kwargs)
+            if hasattr(darr, "coords") and "constituent" in darr.coords:
+                admittances.append(darr)
+            continue
         result = _infer[s](t, ds, **kwargs)
         tinfer += result
         if hasattr(result, "constituents"):
             constituents.extend(result.constituents)
+    # infer minor constituents from all interpolated admittances
+    # with nodal arguments evaluated once for all species
+    if admittances:
+        darr = xr.concat(admittances, dim="constituent")
+        units = ds[ds.tmd.constituents[0]].attrs.get("units", None)
+        result = _infer_admittances(t, darr, units=units, **kwargs)
+        tinfer += result
+        constituents.extend(result.constituents)
     # check if chunks are present
     if hasattr(tinfer, "chunks") and tinfer.chunks is not None:
         tinfer = tinfer.chunk(-1).compute()
@@ -309,6 +518,8 @@ def _infer_short_period(
         Tidal constituent IDs of minor constituents for inference
     raise_exception: bool, default False
         Raise a ``ValueError`` if major constituents are not found
+    dtype: np.dtype or None, default None
+        Floating point precision of the inferred tides
 
     Returns
     -------
@@ -422,26 +633,26 @@ def _infer_short_period(
     pu, pf, G = pyTMD.constituents.minor_arguments(
         MJD, deltat=kwargs["deltat"], corrections=kwargs["corrections"]
     )
+    # reduce arguments to only those constituents to infer
+    # (complex phases are only evaluated for inferred constituents)
+    i = [minor_constituents.index(c) for c in constituents]
+    pu, pf, G = pu[:, i], pf[:, i], G[:, i]
     # phase angle from arguments
-    theta = np.radians(G) + pu
+    theta = np.radians(G)
+    theta += pu
     # dataset of minor arguments
     arguments = xr.Dataset(
         data_vars=dict(
             u=(["time", "constituent"], pu),
             f=(["time", "constituent"], pf),
-            theta=(["time", "constituent"], np.exp(1j * theta)),
+            theta=(["time", "constituent"], theta),
         ),
-        coords=dict(time=np.atleast_1d(MJD), constituent=minor_constituents),
+        coords=dict(time=np.atleast_1d(MJD), constituent=constituents),
     )
     # convert Dataset to DataArray of complex tidal harmonics
-    # (reduce list to only those constituents to infer)
     darr = dmin.tmd.to_dataarray(constituents=constituents)
-    # select argument for constituents
-    arg = arguments.sel(constituent=constituents)
     # sum over tidal constituents
-    tinfer = (
-        darr.real * arg.f * arg.theta.real - darr.imag * arg.f * arg.theta.imag
-    ).sum(dim="constituent", skipna=False)
+    tinfer = _harmonic_sum(darr, arguments, dtype=kwargs.get("dtype"))
     # copy units attribute
     tinfer.attrs["units"] = ds["q1"].attrs.get("units", None)
     tinfer.attrs["constituents"] = constituents
@@ -482,42 +693,14 @@ def _infer_semi_diurnal(
     # set default keyword arguments
     kwargs.setdefault("deltat", 0.0)
     kwargs.setdefault("corrections", "GOT")
-    # convert time to Modified Julian Days (MJD)
-    MJD = t + _mjd_tide
     # interpolate admittances for semi-diurnal minor constituents
     darr = _admittance_semi_diurnal(ds, **kwargs)
     # check if there are any constituents to infer
     if not hasattr(darr, "coords") or "constituent" not in darr.coords:
         return 0.0
-    # list of constituents to infer
-    constituents = darr.coords["constituent"].values
-    # load the nodal corrections for minor constituents
-    pu, pf, G = pyTMD.constituents.arguments(
-        MJD,
-        constituents,
-        deltat=kwargs["deltat"],
-        corrections=kwargs["corrections"],
-    )
-    # phase angle from arguments
-    theta = np.radians(G) + pu
-    # dataset of arguments
-    arg = xr.Dataset(
-        data_vars=dict(
-            u=(["time", "constituent"], pu),
-            f=(["time", "constituent"], pf),
-            theta=(["time", "constituent"], np.exp(1j * theta)),
-        ),
-        coords=dict(time=np.atleast_1d(MJD), constituent=constituents),
-    )
     # sum over tidal constituents
-    tinfer = (
-        darr.real * arg.f * arg.theta.real - darr.imag * arg.f * arg.theta.imag
-    ).sum(dim="constituent", skipna=False)
-    # copy units attribute
-    tinfer.attrs["units"] = ds["n2"].attrs.get("units", None)
-    tinfer.attrs["constituents"] = constituents
-    # return the inferred values
-    return tinfer
+    units = ds["n2"].attrs.get("units", None)
+    return _infer_admittances(t, darr, units=units, **kwargs)
 
 
 # PURPOSE: infer diurnal minor constituents
@@ -554,42 +737,14 @@ def _infer_diurnal(
     # set default keyword arguments
     kwargs.setdefault("deltat", 0.0)
     kwargs.setdefault("corrections", "GOT")
-    # convert time to Modified Julian Days (MJD)
-    MJD = t + _mjd_tide
     # interpolate admittances for diurnal minor constituents
     darr = _admittance_diurnal(ds, **kwargs)
     # check if there are any constituents to infer
     if not hasattr(darr, "coords") or "constituent" not in darr.coords:
         return 0.0
-    # list of constituents to infer
-    constituents = darr.coords["constituent"].values
-    # load the nodal corrections for minor constituents
-    pu, pf, G = pyTMD.constituents.arguments(
-        MJD,
-        constituents,
-        deltat=kwargs["deltat"],
-        corrections=kwargs["corrections"],
-    )
-    # phase angle from arguments
-    theta = np.radians(G) + pu
-    # dataset of arguments
-    arg = xr.Dataset(
-        data_vars=dict(
-            u=(["time", "constituent"], pu),
-            f=(["time", "constituent"], pf),
-            theta=(["time", "constituent"], np.exp(1j * theta)),
-        ),
-        coords=dict(time=np.atleast_1d(MJD), constituent=constituents),
-    )
     # sum over tidal constituents
-    tinfer = (
-        darr.real * arg.f * arg.theta.real - darr.imag * arg.f * arg.theta.imag
-    ).sum(dim="constituent", skipna=False)
-    # copy units attribute
-    tinfer.attrs["units"] = ds["q1"].attrs.get("units", None)
-    tinfer.attrs["constituents"] = constituents
-    # return the inferred values
-    return tinfer
+    units = ds["q1"].attrs.get("units", None)
+    return _infer_admittances(t, darr, units=units, **kwargs)
 
 
 # PURPOSE: infer long-period minor constituents
@@ -626,13 +781,50 @@ def _infer_long_period(
     # set default keyword arguments
     kwargs.setdefault("deltat", 0.0)
     kwargs.setdefault("corrections", "GOT")
-    # convert time to Modified Julian Days (MJD)
-    MJD = t + _mjd_tide
     # interpolate admittances for long-period minor constituents
     darr = _admittance_long_period(ds, **kwargs)
     # check if there are any constituents to infer
     if not hasattr(darr, "coords") or "constituent" not in darr.coords:
         return 0.0
+    # sum over tidal constituents
+    units = ds["node"].attrs.get("units", None)
+    return _infer_admittances(t, darr, units=units, **kwargs)
+
+
+# PURPOSE: sum minor constituents from interpolated admittances
+def _infer_admittances(
+    t: float | np.ndarray,
+    darr: xr.DataArray,
+    units: str | None = None,
+    **kwargs,
+):
+    """
+    Calculate the tidal values for minor constituents from
+    their interpolated complex admittances
+
+    Parameters
+    ----------
+    t: float or np.ndarray
+        Days relative to 1992-01-01T00:00:00
+    darr: xr.DataArray
+        Complex admittances of minor constituents
+    units: str or None, default None
+        Units of the tidal values
+    deltat: float or np.ndarray, default 0.0
+        Time correction for converting to Ephemeris Time (days)
+    corrections: str, default 'GOT'
+        Use nodal corrections from OTIS/ATLAS or GOT/FES models
+
+    Returns
+    -------
+    tinfer: xr.DataArray
+        Tidal time series for minor constituents
+    """
+    # set default keyword arguments
+    kwargs.setdefault("deltat", 0.0)
+    kwargs.setdefault("corrections", "GOT")
+    # convert time to Modified Julian Days (MJD)
+    MJD = t + _mjd_tide
     # list of constituents to infer
     constituents = darr.coords["constituent"].values
     # load the nodal corrections for minor constituents
@@ -643,22 +835,21 @@ def _infer_long_period(
         corrections=kwargs["corrections"],
     )
     # phase angle from arguments
-    theta = np.radians(G) + pu
+    theta = np.radians(G)
+    theta += pu
     # dataset of arguments
     arg = xr.Dataset(
         data_vars=dict(
             u=(["time", "constituent"], pu),
             f=(["time", "constituent"], pf),
-            theta=(["time", "constituent"], np.exp(1j * theta)),
+            theta=(["time", "constituent"], theta),
         ),
         coords=dict(time=np.atleast_1d(MJD), constituent=constituents),
     )
     # sum over tidal constituents
-    tinfer = (
-        darr.real * arg.f * arg.theta.real - darr.imag * arg.f * arg.theta.imag
-    ).sum(dim="constituent", skipna=False)
+    tinfer = _harmonic_sum(darr, arg, dtype=kwargs.get("dtype"))
     # copy units attribute
-    tinfer.attrs["units"] = ds["node"].attrs.get("units", None)
+    tinfer.attrs["units"] = units
     tinfer.attrs["constituents"] = constituents
     # return the inferred values
     return tinfer
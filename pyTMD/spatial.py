@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 spatial.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 
 Spatial transformation routines
 
@@ -11,6 +11,8 @@ PYTHON DEPENDENCIES:
         https://numpy.org/doc/stable/user/numpy-for-matlab-users.html
 
 UPDATE HISTORY:
+    Updated 10/2026: copy and cast input coordinates with a single allocation
+        adjust negative longitudes with a single comparison pass
     Updated 06/2026: use item() to extract scalars from 0-dimensional arrays
         standardize use of lambda (lmda) to denote longitudes
         drift type renamed to trajectory to better fit CF conventions
@@ -447,8 +449,8 @@ def to_cartesian(
     """
     # verify axes and copy to not modify inputs
     singular_values = np.ndim(lon) == 0
-    lon = np.atleast_1d(np.copy(lon)).astype(np.float64)
-    lat = np.atleast_1d(np.copy(lat)).astype(np.float64)
+    lon = np.array(lon, dtype=np.float64, ndmin=1)
+    lat = np.array(lat, dtype=np.float64, ndmin=1)
     # fix coordinates to be 0:360
     lon[lon < 0] += 360.0
     # Linear eccentricity and first numerical eccentricity
@@ -499,9 +501,9 @@ def to_sphere(
     """
     # verify axes and copy to not modify inputs
     singular_values = np.ndim(x) == 0
-    x = np.atleast_1d(np.copy(x)).astype(np.float64)
-    y = np.atleast_1d(np.copy(y)).astype(np.float64)
-    z = np.atleast_1d(np.copy(z)).astype(np.float64)
+    x = np.array(x, dtype=np.float64, ndmin=1)
+    y = np.array(y, dtype=np.float64, ndmin=1)
+    z = np.array(z, dtype=np.float64, ndmin=1)
     # calculate radius
     rad = np.sqrt(x**2.0 + y**2.0 + z**2.0)
     # calculate angular coordinates
@@ -511,9 +513,7 @@ def to_sphere(
     th = np.arccos(z / rad)
     # convert to degrees and fix to 0:360
     lon = np.degrees(lmda)
-    if np.any(lon < 0):
-        lt0 = np.nonzero(lon < 0)
-        lon[lt0] += 360.0
+    np.add(lon, 360.0, out=lon, where=(lon < 0))
     # convert to degrees and fix to -90:90
     lat = 90.0 - np.degrees(th)
     np.clip(lat, -90, 90, out=lat)
@@ -573,9 +573,9 @@ def to_geodetic(
     """
     # verify axes and copy to not modify inputs
     singular_values = np.ndim(x) == 0
-    x = np.atleast_1d(np.copy(x)).astype(np.float64)
-    y = np.atleast_1d(np.copy(y)).astype(np.float64)
-    z = np.atleast_1d(np.copy(z)).astype(np.float64)
+    x = np.array(x, dtype=np.float64, ndmin=1)
+    y = np.array(y, dtype=np.float64, ndmin=1)
+    z = np.array(z, dtype=np.float64, ndmin=1)
     # calculate the geodetic coordinates using the specified method
     if method.lower() == "moritz":
         lon, lat, h = _moritz_iterative(
@@ -842,9 +842,9 @@ def to_ENU(
     """
     # verify axes and copy to not modify inputs
     singular_values = np.ndim(x) == 0
-    x = np.atleast_1d(np.copy(x)).astype(np.float64)
-    y = np.atleast_1d(np.copy(y)).astype(np.float64)
-    z = np.atleast_1d(np.copy(z)).astype(np.float64)
+    x = np.array(x, dtype=np.float64, ndmin=1)
+    y = np.array(y, dtype=np.float64, ndmin=1)
+    z = np.array(z, dtype=np.float64, ndmin=1)
     # convert latitude and longitude to ECEF
     X0, Y0, Z0 = to_cartesian(lon0, lat0, h=h0, a_axis=a_axis, flat=flat)
     # latitude and longitude in radians
@@ -915,9 +915,9 @@ def from_ENU(
     """
     # verify axes and copy to not modify inputs
     singular_values = np.ndim(E) == 0
-    E = np.atleast_1d(np.copy(E)).astype(np.float64)
-    N = np.atleast_1d(np.copy(N)).astype(np.float64)
-    U = np.atleast_1d(np.copy(U)).astype(np.float64)
+    E = np.array(E, dtype=np.float64, ndmin=1)
+    N = np.array(N, dtype=np.float64, ndmin=1)
+    U = np.array(U, dtype=np.float64, ndmin=1)
     # convert latitude and longitude to ECEF
     X0, Y0, Z0 = to_cartesian(lon0, lat0, h=h0, a_axis=a_axis, flat=flat)
     # latitude and longitude in radians
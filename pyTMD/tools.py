@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 tools.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Jupyter notebook, user interface and plotting tools
 
 PYTHON DEPENDENCIES:
@@ -14,6 +14,7 @@ PYTHON DEPENDENCIES:
         https://github.com/jupyter-widgets/ipyleaflet
 
 UPDATE HISTORY:
+    Updated 10/2026: defer loading of notebook dependencies until used
     Updated 06/2026: standardize use of lambda (lmda) to denote longitudes
         simpify ipyleaflet marker control by not having text option
     Updated 12/2025: no longer subclassing pathlib.Path for working directories
@@ -46,9 +47,9 @@ import pyTMD.io.model
 import pyTMD.utilities
 
 # attempt imports
-IPython = pyTMD.utilities.import_dependency("IPython")
-ipyleaflet = pyTMD.utilities.import_dependency("ipyleaflet")
-ipywidgets = pyTMD.utilities.import_dependency("ipywidgets")
+IPython = pyTMD.utilities.import_dependency("IPython", lazy=True)
+ipyleaflet = pyTMD.utilities.import_dependency("ipyleaflet", lazy=True)
+ipywidgets = pyTMD.utilities.import_dependency("ipywidgets", lazy=True)
 
 
 class widgets:
@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 """
 utilities.py
-Written by Tyler Sutterley (06/2026)
+Written by Tyler Sutterley (10/2026)
 Download and management utilities for syncing time and auxiliary files
 
 PYTHON DEPENDENCIES:
@@ -11,6 +11,12 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/platformdirs/
 
 UPDATE HISTORY:
+    Updated 10/2026: add function to detect netCDF4 backend engine
+        compile regular expressions for model file extensions once
+        add option to lazily import optional dependencies
+        read file-like objects in chunks when calculating hashes
+        resolve the package directory once at import
+        add function to open gzip files at the default zlib level
     Updated 06/2026: can use an environment variable to set cache directory
         this overrides the default platform-specific cache directory
     Updated 05/2026: add exists to URL class to check if URL is valid
@@ -77,6 +83,7 @@ import io
 import ssl
 import json
 import time
+import gzip
 import ftplib
 import shutil
 import socket
@@ -87,6 +94,7 @@ import pathlib
 import calendar
 import warnings
 import importlib
+import importlib.util
 import posixpath
 import subprocess
 import lxml.etree
@@ -114,6 +122,8 @@ __all__ = [
     "URL",
     "detect_format",
     "detect_compression",
+    "gzip_open",
+    "detect_engine",
     "compressuser",
     "get_hash",
     "get_git_revision_hash",
@@ -141,6 +151,16 @@ __all__ = [
     "uhslc_list",
 ]
 
+# regular expressions for model file extensions
+_ascii_rx = re.compile(r"(\.asc|\.d)(\.gz)?$", re.IGNORECASE)
+_netcdf_rx = re.compile(r"\.nc(\.gz)?$", re.IGNORECASE)
+_gzip_rx = re.compile(r"\.gz$", re.IGNORECASE)
+
+# absolute path to the package directory
+_package_path = pathlib.Path(
+    inspect.getframeinfo(inspect.currentframe()).filename
+).absolute().parent
+
 
 class reify:
     """Class decorator that puts the result of the method it
@@ -169,14 +189,11 @@ def get_data_path(relpath: list | str | pathlib.Path):
     relpath: list, str or pathlib.Path
         Relative path
     """
-    # current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    filepath = pathlib.Path(filename).absolute().parent
     if isinstance(relpath, list):
         # use *splat operator to extract from list
-        return filepath.joinpath(*relpath)
+        return _package_path.joinpath(*relpath)
     elif isinstance(relpath, (str, pathlib.Path)):
-        return filepath.joinpath(relpath)
+        return _package_path.joinpath(relpath)
 
 
 # PURPOSE: get the path to the user cache directory
@@ -256,6 +273,7 @@ def import_dependency(
     name: str,
     extra: str = "",
     raise_exception: bool = False,
+    lazy: bool = False,
 ):
     """
     Import an optional dependency
@@ -270,6 +288,8 @@ def import_dependency(
         Additional text to include in the ``ImportError`` message
     raise_exception: bool, default False
         Raise an ``ImportError`` if the module is not found
+    lazy: bool, default False
+        Defer executing the module until an attribute is accessed
 
     Returns
     -------
@@ -284,7 +304,7 @@ def import_dependency(
     module = type("module", (), {})
     # try to import the module
     try:
-        module = importlib.import_module(name)
+        module = _lazy_import(name) if lazy else importlib.import_module(name)
     except (ImportError, ModuleNotFoundError) as exc:
         if raise_exception:
             raise ImportError(err) from exc
@@ -294,6 +314,36 @@ def import_dependency(
     return module
 
 
+def _lazy_import(name: str):
+    """
+    Import a module that is only executed on first attribute access
+
+    Parameters
+    ----------
+    name: str
+        Module name
+
+    Returns
+    -------
+    module: obj
+        Lazily-loaded module
+    """
+    # return the module if already imported
+    if name in sys.modules:
+        return sys.modules[name]
+    # find the module specification without importing
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+    # wrap the loader to defer execution of the module
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
 def dependency_available(
     name: str,
     minversion: str | None = None,
@@ -559,10 +609,10 @@ def detect_format(filename: str | pathlib.Path) -> str:
             - ``'netcdf'``: netCDF4 format
     """
     filename = Path(filename).resolve()
-    if re.search(r"(\.asc|\.d)(\.gz)?$", filename.name, re.IGNORECASE):
+    if _ascii_rx.search(filename.name):
         # FES or GOT ASCII formats
         return "ascii"
-    elif re.search(r"\.nc(\.gz)?$", filename.name, re.IGNORECASE):
+    elif _netcdf_rx.search(filename.name):
         # FES or GOT netCDF4 formats
         return "netcdf"
     else:
@@ -584,7 +634,58 @@ def detect_compression(filename: str | pathlib.Path) -> bool:
         Input file is ``gzip`` compressed
     """
     filename = Path(filename).resolve()
-    return bool(re.search(r"\.gz$", filename.name, re.IGNORECASE))
+    return bool(_gzip_rx.search(filename.name))
+
+
+def gzip_open(
+    filename: str | pathlib.Path,
+    mode: str = "rb",
+    compresslevel: int = 6,
+    **kwargs,
+):
+    """
+    Open a ``gzip`` compressed file at the default ``zlib``
+    compression level rather than the ``gzip`` maximum
+
+    Parameters
+    ----------
+    filename: str or pathlib.Path
+        Compressed file
+    mode: str, default 'rb'
+        Mode for opening the file
+    compresslevel: int, default 6
+        Compression level for writing the file
+    **kwargs: dict
+        Keyword arguments for ``gzip.open``
+    """
+    return gzip.open(filename, mode=mode, compresslevel=compresslevel, **kwargs)
+
+
+def detect_engine(filename: str | pathlib.Path) -> str | None:
+    """
+    Detect the ``xarray`` backend engine for a netCDF4 file
+    based on the file signature
+
+    Parameters
+    ----------
+    filename: str or pathlib.Path
+        Model file
+
+    Returns
+    -------
+    engine: str or None
+        ``xarray`` backend engine
+
+            - ``'h5netcdf'``: HDF5-based netCDF4 format
+            - ``None``: determined by ``xarray``
+    """
+    filename = Path(filename).resolve()
+    if not isinstance(filename, pathlib.Path) or not filename.is_file():
+        return None
+    # read the HDF5 format signature
+    with filename.open(mode="rb") as f:
+        signature = f.read(8)
+    return "h5netcdf" if (signature == b"\x89HDF\r\n\x1a\n") else None
 
 
 def compressuser(filename: str | pathlib.Path):
@@ -611,27 +712,27 @@ def get_hash(
     local: str | io.IOBase | pathlib.Path,
     algorithm: str = "md5",
     include_algorithm: bool = False,
+    chunk: int = 1048576,
 ):
     """
-    Get the hash value from a local file or ``BytesIO`` object
+    Get the hash value from a local file or file-like object
 
     Parameters
     ----------
     local: obj, str or pathlib.Path
-        ``BytesIO`` object or path to file
+        ``BytesIO`` object, file-like object or path to file
     algorithm: str, default 'md5'
         Hashing algorithm for checksum validation
     include_algorithm: bool, default False
         Include the algorithm name in the returned hash
+    chunk: int, default 1048576
+        Chunk size for reading file-like objects
     """
     # check if open file object or if local file exists
     if isinstance(local, io.IOBase):
         # generate checksum hash for a given type
-        if algorithm in hashlib.algorithms_available:
-            value = hashlib.new(algorithm, local.getvalue()).hexdigest()
-            return f"{algorithm}:{value}" if include_algorithm else value
-        else:
-            raise ValueError(f"Invalid hashing algorithm: {algorithm}")
+        value = _hash_fileobj(local, algorithm=algorithm, chunk=chunk)
+        return f"{algorithm}:{value}" if include_algorithm else value
     elif isinstance(local, (str, pathlib.Path)):
         # generate checksum hash for local file
         local = pathlib.Path(local).expanduser()
@@ -641,15 +742,46 @@ def get_hash(
         # open the local_file in binary read mode
         with local.open(mode="rb") as local_buffer:
             # generate checksum hash for a given type
-            if algorithm in hashlib.algorithms_available:
-                value = hashlib.new(algorithm, local_buffer.read()).hexdigest()
-                return f"{algorithm}:{value}" if include_algorithm else value
-            else:
-                raise ValueError(f"Invalid hashing algorithm: {algorithm}")
+            value = _hash_fileobj(
+                local_buffer, algorithm=algorithm, chunk=chunk
+            )
+            return f"{algorithm}:{value}" if include_algorithm else value
     else:
         return ""
 
 
+def _hash_fileobj(
+    fileobj: io.IOBase,
+    algorithm: str = "md5",
+    chunk: int = 1048576,
+):
+    """
+    Get the hash value of a file-like object without copying its contents
+
+    Parameters
+    ----------
+    fileobj: obj
+        ``BytesIO`` object or file-like object opened in binary mode
+    algorithm: str, default 'md5'
+        Hashing algorithm for checksum validation
+    chunk: int, default 1048576
+        Chunk size for reading file-like objects
+    """
+    # check if hashing algorithm is valid
+    if algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Invalid hashing algorithm: {algorithm}")
+    h = hashlib.new(algorithm)
+    if isinstance(fileobj, io.BytesIO):
+        # hash in-memory buffers without changing the stream position
+        with fileobj.getbuffer() as buffer:
+            h.update(buffer)
+    else:
+        # read file objects in chunks to limit memory usage
+        for data in iter(lambda: fileobj.read(chunk), b""):
+            h.update(data)
+    return h.hexdigest()
+
+
 # PURPOSE: get the git hash value
 def get_git_revision_hash(
     refname: str = "HEAD",
@@ -665,10 +797,8 @@ def get_git_revision_hash(
     short: bool, default False
         Return the shorted hash value
     """
-    # get path to .git directory from current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    basepath = pathlib.Path(filename).absolute().parent.parent
-    gitpath = basepath.joinpath(".git")
+    # get path to .git directory from package path
+    gitpath = _package_path.parent.joinpath(".git")
     # build command
     cmd = ["git", f"--git-dir={gitpath}", "rev-parse"]
     cmd.append("--short") if short else None
@@ -681,10 +811,8 @@ def get_git_revision_hash(
 # PURPOSE: get the current git status
 def get_git_status():
     """Get the status of a ``git`` repository as a boolean value"""
-    # get path to .git directory from current file path
-    filename = inspect.getframeinfo(inspect.currentframe()).filename
-    basepath = pathlib.Path(filename).absolute().parent.parent
-    gitpath = basepath.joinpath(".git")
+    # get path to .git directory from package path
+    gitpath = _package_path.parent.joinpath(".git")
     # build command
     cmd = ["git", f"--git-dir={gitpath}", "status", "--porcelain"]
     with warnings.catch_warnings():
@@ -1,12 +1,19 @@
 import sys
-import json
+# use orjson for faster parsing and serialization if available
+try:
+    import orjson as _json
+    loads, dumps = _json.loads, _json.dumps
+except ImportError:
+    import json as _json
+    # match the compact UTF-8 output of orjson
+    loads, dumps = _json.loads, lambda obj: _json.dumps(obj,
+        separators=(',', ':'), ensure_ascii=False).encode()
 
 # variable long names for tidal currents
 long_name = dict(u='zonal_tidal_current', v='meridional_tidal_current')
 
-with open(sys.argv[1],'r') as fid:
-    p = json.load(fid)
-    d = p.copy()
+with open(sys.argv[1],'rb') as fid:
+    d = loads(fid.read())
     model_type = d.pop('type')
     model_format = d.get('format', None)   
     model_files = d.pop('model_file', None)
@@ -27,8 +34,8 @@ with open(sys.argv[1],'r') as fid:
         d['z']['units'] = 'm'
 
 if len(sys.argv) > 2:
-    with open(sys.argv[2], 'r') as fid:
-        p = json.load(fid)
+    with open(sys.argv[2], 'rb') as fid:
+        p = loads(fid.read())
         model_type = p.pop('type')
         model_format = p.get('format', None)   
         model_files = p.pop('model_file', None)
@@ -51,5 +58,5 @@ if len(sys.argv) > 2:
                 d[key]['units'] = 'm^2/s'
         
 # write restructured dictionary to file
-with open(sys.argv[1], 'w') as fid:
-    json.dump(d, fid)
+with open(sys.argv[1], 'wb') as fid:
+    fid.write(dumps(d))
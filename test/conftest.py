@@ -1,5 +1,6 @@
 import pytest
 import pathlib
+import pyTMD.io
 from pyTMD.utilities import get_cache_path
 
 # default working data directory for tide models
@@ -12,3 +13,13 @@ def pytest_addoption(parser):
 def directory(request):
     """ Returns Data Directory """
     return request.config.getoption("--directory")
+
+@pytest.fixture(scope="session")
+def fes2014_model(directory):
+    """ Returns FES2014 elevation model parameters """
+    return pyTMD.io.model(directory).from_database('FES2014', group='z')
+
+@pytest.fixture(scope="session")
+def got47_model(directory):
+    """ Returns GOT4.7 model parameters """
+    return pyTMD.io.model(directory).from_database('GOT4.7')
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-test_atlas_read.py (11/2025)
+test_atlas_read.py (10/2026)
 Tests that ATLAS compact and netCDF4 data can be downloaded from AWS S3 bucket
 Tests the read program to verify that constituents are being extracted
 
@@ -16,6 +16,7 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/timescale/
 
 UPDATE HISTORY:
+    Updated 10/2026: compare all constituents with a single array difference
     Updated 11/2025: using new xarray interface for tidal model data
     Updated 10/2025: split directories between validation and model data
         fetch data from pyTMD developers test data repository
@@ -86,18 +87,22 @@ def test_read_TPXO9_v2(directory, CROP):
     amp_eps = 0.05
     ph_eps = 10.0
     # calculate differences between OTPSnc and python version
-    for i,cons in enumerate(local.tmd.constituents):
-        # amplitude and phase
-        amp = local[cons].tmd.amplitude
-        ph = local[cons].tmd.phase
-        # convert phase from 0:360 to -180:180
-        phase = np.arctan2(np.sin(np.radians(ph)), np.cos(np.radians(ph)))
-        ph = np.degrees(phase)
-        # calculate differences
-        amp_diff = amp.values - val[f'{cons}_amp']
-        ph_diff = ph.values - val[f'{cons}_ph']
-        assert np.all(np.abs(amp_diff) <= amp_eps)
-        assert np.all(np.abs(ph_diff) <= ph_eps)
+    # amplitude and phase for all constituents
+    hc = local.tmd.to_dataarray()
+    amp = hc.tmd.amplitude
+    ph = hc.tmd.phase
+    # convert phase from 0:360 to -180:180
+    phase = np.arctan2(np.sin(np.radians(ph)), np.cos(np.radians(ph)))
+    ph = np.degrees(phase)
+    # validation amplitude and phase for all constituents
+    constituents = local.tmd.constituents
+    val_amp = np.column_stack([val[f'{c}_amp'] for c in constituents])
+    val_ph = np.column_stack([val[f'{c}_ph'] for c in constituents])
+    # calculate differences
+    amp_diff = amp.values - val_amp
+    ph_diff = ph.values - val_ph
+    assert np.all(np.abs(amp_diff) <= amp_eps)
+    assert np.all(np.abs(ph_diff) <= ph_eps)
 
 # parametrize over cropping the model fields
 @pytest.mark.parametrize("CROP", [False, True])
@@ -1,8 +1,9 @@
 """
-test_constituents.py (05/2026)
+test_constituents.py (10/2026)
 Tests parsing model constituents from strings
 
 UPDATE HISTORY:
+    Updated 10/2026: compare parsed constituent lists in single assertions
     Updated 05/2026: refactored constituent parameters: verify match
     Updated 02/2025: try parsing the entire Doodson table
     Written 02/2025
@@ -23,14 +24,14 @@ def test_constituents():
         'gamma2','r2','k2','eta2','mns2','2sm2','m3','mk3','s3','mn4',
         'm4','ms4','mk4','so1','s4','s5','m6','s6','s7','s8','m8','mks2',
         'msqm','mtm','n4','eps2','ups1','z0','node']
-    for c in cindex:
-        # test standard case
-        assert (pyTMD.constituents._parse_name(c) == c)
-        # test with uppercase
-        assert (pyTMD.constituents._parse_name(c.upper()) == c)
-        # test with additional characters
-        assert (pyTMD.constituents._parse_name(f'_{c}_') == c)
-        assert (pyTMD.constituents._parse_name(f'{c:10}') == c)
+    parse = pyTMD.constituents._parse_name
+    # test standard case
+    assert list(map(parse, cindex)) == cindex
+    # test with uppercase
+    assert [parse(c.upper()) for c in cindex] == cindex
+    # test with additional characters
+    assert [parse(f'_{c}_') for c in cindex] == cindex
+    assert [parse(f'{c:10}') for c in cindex] == cindex
 
 def test_remapping():
     """
@@ -62,8 +63,8 @@ def test_doodson_table():
     with table.open(mode='r', encoding='utf8') as fid:
         coefficients = json.load(fid)
     # test parsing of Doodson coefficients
-    for key, val in coefficients.items():
-        assert (pyTMD.constituents._parse_name(key) == key)
+    keys = list(coefficients.keys())
+    assert list(map(pyTMD.constituents._parse_name, keys)) == keys
 
 def test_doodson():
     """
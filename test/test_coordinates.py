@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 """
-test_coordinates.py (06/2026)
+test_coordinates.py (10/2026)
 Verify forward and backwards coordinate conversions
 
 UPDATE HISTORY:
+    Updated 10/2026: test that masks are retained when transforming
     Updated 06/2026: test dataset coordinate types and dimensions
     Updated 11/2025: use pyproj.CRS.from_user_input for definitions
     Updated 09/2024: add test for Arctic regions with new projection
@@ -192,3 +193,33 @@ def test_dataset_invalid():
     msg = "Coordinate data type must be a string"
     with pytest.raises(ValueError, match=msg):
         pyTMD.io.dataset._coords(x, y, type=coord_type, target_crs=4326)
+
+
+# PURPOSE: verify that masks are retained when transforming coordinates
+def test_transform_masked():
+    # gridded coordinates with a masked point
+    x = np.ma.array(np.full((2, 3), -45.0), mask=False)
+    y = np.ma.array(np.full((2, 3), -75.0), mask=False)
+    x.mask[0, 1] = y.mask[0, 1] = True
+    X, Y = pyTMD.io.dataset._transform(x, y, target_crs=3031)
+    assert isinstance(X, np.ma.MaskedArray)
+    assert isinstance(Y, np.ma.MaskedArray)
+    assert X.shape == x.shape
+    assert np.all(X.mask == x.mask)
+    assert np.all(Y.mask == y.mask)
+    # trajectory coordinates with a masked point
+    x = np.ma.array([-45.0, -40.0, -35.0], mask=[False, True, False])
+    y = np.ma.array([-75.0, -76.0, -77.0], mask=[False, True, False])
+    X, Y = pyTMD.io.dataset._transform(x, y, target_crs=3031)
+    assert isinstance(X, np.ma.MaskedArray)
+    assert isinstance(Y, np.ma.MaskedArray)
+    assert np.all(X.mask == x.mask)
+    assert np.all(Y.mask == y.mask)
+    # equivalent reference systems retain masks and input types
+    X, Y = pyTMD.io.dataset._transform(x, y, target_crs=4326)
+    assert isinstance(X, np.ma.MaskedArray)
+    assert np.all(X.mask == x.mask)
+    X, Y = pyTMD.io.dataset._transform([-45.0], [-75.0], target_crs=4326)
+    assert isinstance(X, list)
+    X, Y = pyTMD.io.dataset._transform(-45.0, -75.0, target_crs=4326)
+    assert isinstance(X, float)
@@ -1,5 +1,5 @@
 """
-test_equilibrium_tide.py (11/2025)
+test_equilibrium_tide.py (10/2026)
 Tests the calculation of long-period equilibrium tides with respect
 to the LPEQMT subroutine
 
@@ -11,6 +11,7 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/timescale/
 
 UPDATE HISTORY:
+    Updated 10/2026: reuse GOT4.7 model parameters from a fixture
     Updated 11/2025: use xarray interface for both equilibrium tide tests
     Updated 08/2025: added option to include mantle anelasticity
     Updated 11/2024: moved normalize_angle to math.py
@@ -114,12 +115,12 @@ def test_equilibrium_tide(TYPE, include_anelasticity):
     assert np.all(np.abs(lpet - computed) < eps)
 
 # PURPOSE: test the estimation of long-period equilibrium tides
-def test_node_tide(directory):
+def test_node_tide(got47_model):
     """
     Test the computation of the equilibrium node tides
     """
     # model parameters for GOT4.7
-    m = pyTMD.io.model(directory).from_database('GOT4.7')
+    m = got47_model
     # open dataset
     ds = m.open_dataset(group='z', chunks='auto')
     # append node equilibrium tide to dataset
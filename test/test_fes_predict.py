@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-test_fes_predict.py (06/2026)
+test_fes_predict.py (10/2026)
 Tests that FES2014 data can be downloaded from AWS S3 bucket
 Tests the read program to verify that constituents are being extracted
 Tests that interpolated results are comparable to FES2014 program
@@ -15,8 +15,16 @@ PYTHON DEPENDENCIES:
         https://h5netcdf.org/
     timescale: Python tools for time and astronomical calculations
         https://pypi.org/project/timescale/
+    pandas: Python Data Analysis Library
+        https://pandas.pydata.org
 
 UPDATE HISTORY:
+    Updated 10/2026: read validation data with the pandas C parser
+        share FES2014 model parameters with a session fixture
+        convert CNES days into a preallocated array of seconds
+        only parse validation columns that are used in each test
+        calculate differences at valid points without masked arrays
+        keep validation data in single precision until converting times
     Updated 06/2026: add test to verify short-term admittance calculations
     Updated 11/2025: using new xarray interface for tidal model data
     Updated 10/2025: split directories between validation and model data
@@ -36,6 +44,7 @@ UPDATE HISTORY:
     Written 08/2020
 """
 import io
+import copy
 import json
 import pytest
 import inspect
@@ -45,6 +54,9 @@ import xarray as xr
 import pyTMD
 import timescale
 
+# attempt imports
+pd = pyTMD.utilities.import_dependency('pandas')
+
 # current file path
 filename = inspect.getframeinfo(inspect.currentframe()).filename
 filepath = pathlib.Path(filename).absolute().parent
@@ -61,9 +73,9 @@ def test_check_FES2014(directory):
 # parametrize over cropping the model fields
 @pytest.mark.parametrize("CROP", [False, True])
 # PURPOSE: Tests that interpolated results are comparable to FES program
-def test_verify_FES2014(directory, CROP):
+def test_verify_FES2014(fes2014_model, CROP):
     # model parameters for FES2014
-    m = pyTMD.io.model(directory).from_database('FES2014', group='z')
+    m = copy.deepcopy(fes2014_model)
     # constituent files included in test
     c = ['2n2','k1','k2','m2','m4','mf','mm','msqm','mtm','n2','o1',
         'p1','q1','s1','s2']
@@ -77,15 +89,19 @@ def test_verify_FES2014(directory, CROP):
     names = ('CNES','Hour','Latitude','Longitude','Short_tide','LP_tide',
         'Pure_tide','Geo_tide','Rad_tide')
     formats = ('f','i','f','f','f','f','f','f','f')
-    file_contents = np.loadtxt(filepath.joinpath('fes_slev.txt.gz'),
-        skiprows=1,dtype=dict(names=names,formats=formats))
-    longitude = file_contents['Longitude']
-    latitude = file_contents['Latitude']
-    validation = file_contents['Short_tide']
+    file_contents = pd.read_csv(filepath.joinpath('fes_slev.txt.gz'),
+        sep=r'\s+', skiprows=1, names=names,
+        dtype=dict(zip(names, formats)),
+        usecols=['CNES','Latitude','Longitude','Short_tide'])
+    longitude = file_contents['Longitude'].to_numpy()
+    latitude = file_contents['Latitude'].to_numpy()
+    validation = file_contents['Short_tide'].to_numpy()
     npts = len(file_contents)
 
     # CNES Julian Days = Days relative to 1950-01-01 (MJD:33282)
-    delta_time = timescale.time._to_sec['day']*file_contents['CNES']
+    delta_time = np.empty((npts))
+    np.multiply(file_contents['CNES'].to_numpy(), timescale.time._to_sec['day'],
+        out=delta_time, dtype=np.float64)
     ts = timescale.from_deltatime(delta_time,
         epoch=timescale.time._cnes_epoch)
 
@@ -112,18 +128,20 @@ def test_verify_FES2014(directory, CROP):
     # will verify differences between model outputs are within tolerance
     eps = 5.0
     # calculate differences between fes2014 and python version
-    difference = np.ma.zeros((npts))
-    difference.data[:] = tide.values - validation
-    difference.mask = np.isnan(tide.values)
-    if not np.all(difference.mask):
-        assert np.all(np.abs(difference) <= eps)
+    # only for valid points (not masked as nan)
+    values = tide.values
+    valid = np.logical_not(np.isnan(values))
+    difference = np.zeros((npts), dtype=validation.dtype)
+    np.subtract(values, validation, out=difference, where=valid)
+    if np.any(valid):
+        assert np.all(np.abs(difference[valid]) <= eps)
 
 # parametrize over correction types
 @pytest.mark.parametrize("corrections", ["FES", "OTIS"])
 # PURPOSE: Tests that the inference methods match
-def test_infer_FES2014(directory, corrections):
+def test_infer_FES2014(fes2014_model, corrections):
     # model parameters for FES2014
-    m = pyTMD.io.model(directory).from_database('FES2014', group='z')
+    m = copy.deepcopy(fes2014_model)
     # constituent files included in test
     c = ['2n2','k1','k2','m2','m4','mf','mm','msqm','mtm','n2','o1',
         'p1','q1','s1','s2']
@@ -137,8 +155,10 @@ def test_infer_FES2014(directory, corrections):
     names = ('CNES','Hour','Latitude','Longitude','Short_tide','LP_tide',
         'Pure_tide','Geo_tide','Rad_tide')
     formats = ('f','i','f','f','f','f','f','f','f')
-    file_contents = np.loadtxt(filepath.joinpath('fes_slev.txt.gz'),
-        skiprows=1,dtype=dict(names=names,formats=formats))
+    file_contents = pd.read_csv(filepath.joinpath('fes_slev.txt.gz'),
+        sep=r'\s+', skiprows=1, names=names,
+        dtype=dict(zip(names, formats)),
+        usecols=['Latitude','Longitude'])
     # convert to xarray DataArrays
     X, Y = ds.tmd.coords_as(
         file_contents['Longitude'][0],
@@ -221,9 +241,9 @@ def test_definition_file(MODEL):
 # parametrize over reading with dask
 @pytest.mark.parametrize("CHUNKS", [None, "auto"])
 # PURPOSE: test extend function
-def test_extend_array(directory, CHUNKS):
+def test_extend_array(fes2014_model, CHUNKS):
     # model parameters for FES2014
-    m = pyTMD.io.model(directory).from_database('FES2014', group='z')
+    m = copy.deepcopy(fes2014_model)
     # reduce to constituents for test
     m.reduce_constituents(['m2'])
     # open dataset
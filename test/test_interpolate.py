@@ -1,9 +1,11 @@
 #!/usr/bin/env python
 u"""
-test_interpolate.py (01/2026)
+test_interpolate.py (10/2026)
 Test the interpolation and extrapolation routines
 
 UPDATE HISTORY:
+    Updated 10/2026: test that cached padded grids are updated
+        test that cached KD-trees are updated with coordinates
     Updated 01/2026: xfail tests on HTTPError exceptions
     Updated 08/2025: added 1d interpolation routine test
         added inpaint interpolation test based on 2D franke function
@@ -17,6 +19,7 @@ import pytest
 import inspect
 import pathlib
 import numpy as np
+import xarray as xr
 import scipy.io
 import pyTMD.interpolate
 import pyTMD.spatial
@@ -208,3 +211,42 @@ def test_extrapolation_checks(N=324):
     # in case where there are no points to be extrapolated
     test = pyTMD.interpolate.extrapolate(LON, LAT, FI, [], [])
     assert np.logical_not(test)
+
+# PURPOSE: test that cached padded grids are updated with variables
+def test_padded_cache():
+    # global grid of constant values
+    x = np.arange(0.0, 360.0, 1.0)
+    y = np.arange(-80.0, 81.0, 1.0)
+    ds = xr.Dataset(coords=dict(x=x, y=y), attrs=dict(crs=4326))
+    ds['m2'] = (('y','x'), np.ones((len(y),len(x)), dtype=np.complex64))
+    ds['m2'].attrs['units'] = 'm'
+    # interpolate across the padded boundary
+    X = xr.DataArray([359.5, 10.2], dims='i')
+    Y = xr.DataArray([0.0, 5.0], dims='i')
+    local = ds.tmd.grid_interp(X, Y)
+    assert np.allclose(local['m2'], 1.0)
+    # replace the constituent and interpolate again
+    ds['m2'] = 2.0*ds['m2']
+    local = ds.tmd.grid_interp(X, Y)
+    assert np.allclose(local['m2'], 2.0)
+
+# PURPOSE: test that cached KD-trees are updated with coordinates
+def test_tree_cache():
+    # regional grid with values increasing to the east
+    x = np.arange(0.0, 10.0, 1.0)
+    y = np.arange(0.0, 5.0, 1.0)
+    ds = xr.Dataset(coords=dict(x=x, y=y), attrs=dict(crs=4326))
+    m2 = np.broadcast_to(x, (len(y), len(x))).astype(np.complex64)
+    ds['m2'] = (('y','x'), m2.copy())
+    ds['m2'].attrs['units'] = 'm'
+    # mask the eastern half of the grid
+    ds['m2'][:, 5:] = np.nan
+    # extrapolate to a point within the masked region
+    X = xr.DataArray([8.0], dims='i')
+    Y = xr.DataArray([2.0], dims='i')
+    local = ds.tmd.interp(X, Y, extrapolate=True, cutoff=np.inf)
+    assert np.allclose(local['m2'], 4.0)
+    # shift the grid to the east and extrapolate again
+    ds['x'] = x + 10.0
+    local = ds.tmd.interp(X, Y, extrapolate=True, cutoff=np.inf)
+    assert np.allclose(local['m2'], 0.0)
@@ -4,6 +4,7 @@ test_math.py (11/2024)
 """
 import pytest
 import numpy as np
+import xarray as xr
 import pyTMD.ellipse
 import pyTMD.math
 from scipy.special import factorial
@@ -60,6 +61,31 @@ def test_normalize_angle():
     test = pyTMD.math.normalize_angle(angles)
     assert np.all(exp == test)
 
+def test_phasor():
+    """
+    Tests the calculation of complex oscillations from amplitude and phase
+    """
+    # test amplitudes and phases in degrees
+    amplitude = np.array([0.5, 1.0, 1.5, 2.0, 2.5, 3.0])
+    phase = np.array([-90, 0, 45, 90, 180, 270])
+    # expected values
+    exp = amplitude*np.exp(-1j*np.radians(phase))
+    # test complex oscillations
+    test = pyTMD.math.phasor(amplitude, phase)
+    assert np.allclose(exp, test)
+    assert np.allclose(amplitude, np.abs(test))
+    # test complex oscillations from masked arrays
+    mask = (phase < 0)
+    test = pyTMD.math.phasor(np.ma.array(amplitude, mask=mask),
+        np.ma.array(phase, mask=mask))
+    assert np.all(test.mask == mask)
+    assert np.allclose(exp[~mask], test.compressed())
+    # test complex oscillations from DataArrays
+    test = pyTMD.math.phasor(xr.DataArray(amplitude, dims='i'),
+        xr.DataArray(phase, dims='i'))
+    assert isinstance(test, xr.DataArray)
+    assert np.allclose(exp, test)
+
 def test_aliasing():
     """
     Tests the calculation of an aliasing frequency
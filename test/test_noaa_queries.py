@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-test_noaa_queries.py (07/2025)
+test_noaa_queries.py (10/2026)
 Verify NOAA webservices API query functions
 
 PYTHON DEPENDENCIES:
@@ -8,6 +8,9 @@ PYTHON DEPENDENCIES:
         https://pandas.pydata.org
 
 UPDATE HISTORY:
+    Updated 10/2026: compare query results with vectorized assertions
+        check connection to NOAA webservices once for all tests
+        align harmonic constituents by number before comparing
     Updated 04/2026: add check for latitude and longiude columns
     Updated 01/2026: xfail tests on HTTPError exceptions
     Updated 11/2025: added test for pandas dataframe accessor
@@ -17,6 +20,16 @@ UPDATE HISTORY:
 import pytest
 import pyTMD.io.NOAA
 import numpy as np
+import pandas as pd
+
+@pytest.fixture(scope="module", autouse=True)
+def noaa_connection():
+    """ Skip tests if NOAA webservices cannot be reached """
+    try:
+        pyTMD.utilities.check_connection('https://tidesandcurrents.noaa.gov',
+            timeout=5)
+    except Exception as exc:
+        pytest.skip(f'NOAA webservices unreachable: {exc}')
 
 def test_noaa_stations():
     """Test NOAA station information retrieval
@@ -112,15 +125,14 @@ def test_noaa_harmonic_constituents():
     # check if the values match expected
     assert 'm2' in df['constituent'].values
     # check if the values match between queries
-    for i, row in df.iterrows():
-        assert row['amplitude'] == hcons.loc[i, 'amplitude']
-        assert row['phase'] == hcons.loc[i, 'phase']
-        assert row['speed'] == hcons.loc[i, 'speed']
-        # get constituent
-        c = row['constituent']
-        # compare dataset values
-        assert np.isclose(ds[c].tmd.amplitude, row['amplitude'])
-        assert np.isclose(ds[c].tmd.phase, row['phase'])
+    # align constituents by number before comparing
+    columns = ['amplitude', 'phase', 'speed']
+    aligned = df.reindex(hcons.index)
+    pd.testing.assert_frame_equal(aligned[columns], hcons[columns])
+    # compare dataset values for all constituents
+    hc = ds.tmd.to_dataarray(constituents=df['constituent'].tolist())
+    assert np.allclose(hc.tmd.amplitude, df['amplitude'].values)
+    assert np.allclose(hc.tmd.phase, df['phase'].values)
 
 def test_noaa_water_level():
     """Test NOAA water level data retrieval
@@ -168,9 +180,4 @@ def test_noaa_water_level():
     assert df['timeStamp'][0] == np.datetime64('2020-01-01')
     assert np.allclose(df['WL'].values, expected_WL)
     # check if the values match between queries
-    for i, row in df.iterrows():
-        assert row['timeStamp'] == wlevel.loc[i, 'timeStamp']
-        assert row['WL'] == wlevel.loc[i, 'WL']
-        assert row['sigma'] == wlevel.loc[i, 'sigma']
-        assert row['I'] == wlevel.loc[i, 'I']
-        assert row['L'] == wlevel.loc[i, 'L']
+    pd.testing.assert_frame_equal(df, wlevel, check_dtype=False)
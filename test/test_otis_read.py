@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-test_otis_read.py (11/2025)
+test_otis_read.py (10/2026)
 Tests for OTIS-formatted tide model data
 
 Tests that constituents are being extracted
@@ -19,6 +19,10 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/timescale/
 
 UPDATE HISTORY:
+    Updated 10/2026: test caching interpolated model constituents
+        test predicting tides in single precision
+        test reading currents and transports from shared files
+        test that cache files differ for masked coordinates
     Updated 11/2025: using new xarray interface for tidal model data
     Updated 10/2025: split directories between validation and model data
         fetch data from pyTMD developers test data repository
@@ -587,6 +591,19 @@ class Test_CATS2008:
         for k,cons in enumerate(c):
             assert np.isclose(local[cons], ds[cons], rtol=eps, atol=eps)
 
+    # parameterize over currents and transports
+    @pytest.mark.parametrize("GROUPS", [['u','v'], ['U','V']])
+    # PURPOSE: test reading currents and transports from shared files
+    def test_shared_transports(self, GROUPS):
+        # model parameters for CATS2008
+        model = pyTMD.io.model(self.directory).from_database('CATS2008')
+        # open datatree reading the transport file once
+        dtree = model.open_datatree(group=GROUPS)
+        # verify that each group matches opening as a dataset
+        for group in GROUPS:
+            ds = model.open_dataset(group=group)
+            xr.testing.assert_identical(dtree[group].to_dataset(), ds)
+
     # PURPOSE: test the tide correction wrapper function
     def test_Ross_Ice_Shelf(self):
         # create a drift track along the Ross Ice Shelf
@@ -629,6 +646,96 @@ class Test_CATS2008:
         for key,val in tide.items():
             assert np.any(val)
 
+    # PURPOSE: test caching interpolated model constituents
+    def test_Ross_Ice_Shelf_cache(self, tmp_path, monkeypatch):
+        # use a temporary directory for cache files
+        monkeypatch.setenv("PYTMD_CACHE_DIR", str(tmp_path))
+        # track reads of cache files
+        cache_reads = []
+        read_cache = pyTMD.compute._read_cache
+        def _read_cache(cache_file):
+            cache_reads.append(cache_file)
+            return read_cache(cache_file)
+        monkeypatch.setattr(pyTMD.compute, "_read_cache", _read_cache)
+        # create a drift track along the Ross Ice Shelf
+        xlimits = np.array([-740000,520000])
+        ylimits = np.array([-1430000,-300000])
+        # limits of x and y coordinates for region
+        xrange = xlimits[1] - xlimits[0]
+        yrange = ylimits[1] - ylimits[0]
+        # x and y coordinates
+        x = xlimits[0] + xrange*np.random.random((100))
+        y = ylimits[0] + yrange*np.random.random((100))
+        # time dimension
+        delta_time = np.random.random((100))*86400
+        kwargs = dict(directory=self.directory, model='CATS2008',
+            epoch=timescale.time._j2000_epoch, type='trajectory',
+            standard='UTC', crs=3031, extrapolate=True, cache=True)
+        # calculate tide drift corrections without and with the cache
+        tide = pyTMD.compute.tide_elevations(x, y, delta_time, **kwargs)
+        assert not cache_reads
+        cached = pyTMD.compute.tide_elevations(x, y, delta_time, **kwargs)
+        assert len(cache_reads) == 1
+        assert cache_reads[0].exists()
+        xr.testing.assert_identical(tide, cached)
+        # calculate tide currents without and with the cache
+        tide = pyTMD.compute.tide_currents(x, y, delta_time, **kwargs)
+        assert len(cache_reads) == 1
+        cached = pyTMD.compute.tide_currents(x, y, delta_time, **kwargs)
+        assert len(cache_reads) == 3
+        for key in ['u', 'v']:
+            xr.testing.assert_identical(tide[key], cached[key])
+
+    # PURPOSE: test that cache files differ for masked coordinates
+    def test_cache_file_masks(self):
+        # get model parameters
+        model = pyTMD.io.model(verify=False).from_database('CATS2008')
+        # coordinates with and without masked points
+        x = np.ma.array([-740000.0, 520000.0], mask=[False, False])
+        y = np.ma.array([-1430000.0, -300000.0], mask=[False, False])
+        options = dict(extrapolate=True, cutoff=10.0)
+        cache_file = pyTMD.compute._cache_file(model, 'z', x, y, **options)
+        x.mask[1] = True
+        masked = pyTMD.compute._cache_file(model, 'z', x, y, **options)
+        assert masked != cache_file
+        # extrapolation settings change the cache file
+        options.update(cutoff=np.inf)
+        cutoff = pyTMD.compute._cache_file(model, 'z', x, y, **options)
+        assert cutoff != masked
+
+    # PURPOSE: test predicting tides in single precision
+    def test_Ross_Ice_Shelf_single_precision(self):
+        # create a drift track along the Ross Ice Shelf
+        xlimits = np.array([-740000,520000])
+        ylimits = np.array([-1430000,-300000])
+        # limits of x and y coordinates for region
+        xrange = xlimits[1] - xlimits[0]
+        yrange = ylimits[1] - ylimits[0]
+        # x and y coordinates
+        x = xlimits[0] + xrange*np.random.random((100))
+        y = ylimits[0] + yrange*np.random.random((100))
+        # time dimension
+        delta_time = np.random.random((100))*86400
+        kwargs = dict(directory=self.directory, model='CATS2008',
+            epoch=timescale.time._j2000_epoch, type='trajectory',
+            standard='UTC', crs=3031, extrapolate=True)
+        # calculate tide drift corrections in double and single precision
+        tide = pyTMD.compute.tide_elevations(x, y, delta_time, **kwargs)
+        single = pyTMD.compute.tide_elevations(x, y, delta_time,
+            dtype=np.float32, **kwargs)
+        assert tide.dtype == np.float64
+        assert single.dtype == np.float32
+        eps = np.finfo(np.float32).eps
+        assert np.allclose(single, tide, rtol=eps, atol=1e-5)
+        # calculate tide currents in double and single precision
+        tide = pyTMD.compute.tide_currents(x, y, delta_time, **kwargs)
+        single = pyTMD.compute.tide_currents(x, y, delta_time,
+            dtype=np.float32, **kwargs)
+        for key in ['u', 'v']:
+            assert tide[key].dtype == np.float64
+            assert single[key].dtype == np.float32
+            assert np.allclose(single[key], tide[key], rtol=eps, atol=1e-3)
+
     # PURPOSE: test definition file functionality
     @pytest.mark.parametrize("MODEL", ['CATS2008'])
     def test_definition_file(self, MODEL):
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 u"""
-test_perth3_read.py (11/2025)
+test_perth3_read.py (10/2026)
 Tests the read program to verify that constituents are being extracted
 Tests that interpolated results are comparable to NASA PERTH3 program
 
@@ -14,6 +14,13 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/timescale/
 
 UPDATE HISTORY:
+    Updated 10/2026: parse validation data as fixed-width columns
+        read validation data once with a module-scoped fixture
+        reuse GOT4.7 model parameters from a session-scoped fixture
+        build Ross Ice Shelf coordinate grids with numpy.mgrid
+        decompress validation data in a single read
+        compare valid points without masked arrays
+        open GOT4.7 dataset once with a module-scoped fixture
     Updated 11/2025: using new xarray interface for tidal model data
     Updated 10/2025: split directories between validation and model data
         fetch data from pyTMD developers test data repository
@@ -39,6 +46,7 @@ UPDATE HISTORY:
     Written 08/2020
 """
 import io
+import copy
 import gzip
 import json
 import pytest
@@ -53,37 +61,41 @@ import timescale
 filename = inspect.getframeinfo(inspect.currentframe()).filename
 filepath = pathlib.Path(filename).absolute().parent
 
-# parametrize over cropping the model fields
-@pytest.mark.parametrize("CROP", [False, True])
-# PURPOSE: Tests that interpolated results are comparable to PERTH3 program
-def test_verify_GOT47(directory, CROP):
+@pytest.fixture(scope="module")
+def perth3_validation():
+    """ Returns PERTH3 validation data """
+    # extract latitude, longitude, time (Modified Julian Days) and tide data
+    # fixed-width columns as tide values are blank for invalid points
+    validation_file = filepath.joinpath('perth_output_got4.7.gz')
+    raw = gzip.decompress(validation_file.read_bytes())
+    lat, lon, MJD, validation = np.genfromtxt(io.BytesIO(raw), skip_header=2,
+        delimiter=(11,10,15,10), usecols=(0,1,2,3), unpack=True,
+        encoding='ISO-8859-1')
+    return (lat, lon, MJD, validation)
+
+@pytest.fixture(scope="module")
+def got47_dataset(got47_model):
+    """ Returns GOT4.7 elevation dataset for the PERTH3 constituents """
     # model parameters for GOT4.7
-    m = pyTMD.io.model(directory).from_database('GOT4.7')
+    m = copy.deepcopy(got47_model)
     # perth3 test program infers m4 tidal constituent
     # constituent files included in test
     constituents = ['q1','o1','p1','k1','n2','m2','s2','k2','s1']
     m.reduce_constituents(constituents)
     # open dataset
-    ds = m.open_dataset(group='z', chunks='auto', use_default_units=False)
+    return m.open_dataset(group='z', chunks='auto', use_default_units=False)
+
+# parametrize over cropping the model fields
+@pytest.mark.parametrize("CROP", [False, True])
+# PURPOSE: Tests that interpolated results are comparable to PERTH3 program
+def test_verify_GOT47(got47_model, got47_dataset, perth3_validation, CROP):
+    # model parameters and dataset for GOT4.7
+    m = got47_model
+    ds = got47_dataset
 
     # read validation dataset
-    with gzip.open(filepath.joinpath('perth_output_got4.7.gz'),'r') as fid:
-        file_contents = fid.read().decode('ISO-8859-1').splitlines()
-    # extract latitude, longitude, time (Modified Julian Days) and tide data
-    npts = len(file_contents) - 2
-    lat = np.zeros((npts))
-    lon = np.zeros((npts))
-    MJD = np.zeros((npts))
-    validation = np.ma.zeros((npts))
-    validation.mask = np.ones((npts),dtype=bool)
-    for i in range(npts):
-        line_contents = file_contents[i+2].split()
-        lat[i] = np.float64(line_contents[0])
-        lon[i] = np.float64(line_contents[1])
-        MJD[i] = np.float64(line_contents[2])
-        if (len(line_contents) == 5):
-            validation.data[i] = np.float64(line_contents[3])
-            validation.mask[i] = False
+    lat, lon, MJD, validation = perth3_validation
+    npts = len(validation)
 
     # convert time from MJD to timescale object
     ts = timescale.time.Timescale(MJD=MJD)
@@ -113,11 +125,13 @@ def test_verify_GOT47(directory, CROP):
     # will verify differences between model outputs are within tolerance
     eps = 0.01
     # calculate differences between perth3 and python version
-    difference = np.ma.zeros((npts))
-    difference.data[:] = tide - validation
-    difference.mask = np.isnan(tide) | validation.mask
-    if not np.all(difference.mask):
-        assert np.all(np.abs(difference) <= eps)
+    # only for valid points (not masked as nan)
+    values = tide.values
+    valid = np.isfinite(values) & np.isfinite(validation)
+    difference = np.zeros((npts))
+    np.subtract(values, validation, out=difference, where=valid)
+    if np.any(valid):
+        assert np.all(np.abs(difference[valid]) <= eps)
 
 # PURPOSE: Tests check point program
 def test_check_GOT47(directory):
@@ -136,9 +150,8 @@ def test_Ross_Ice_Shelf(directory):
     ylimits = np.array([-1450000,-300000])
     spacing = np.array([50e3,-50e3])
     # x and y coordinates
-    x = np.arange(xlimits[0],xlimits[1]+spacing[0],spacing[0])
-    y = np.arange(ylimits[1],ylimits[0]+spacing[1],spacing[1])
-    xgrid,ygrid = np.meshgrid(x,y)
+    ygrid,xgrid = np.mgrid[ylimits[1]:ylimits[0]+spacing[1]:spacing[1],
+        xlimits[0]:xlimits[1]+spacing[0]:spacing[0]]
     # time dimension
     delta_time = 0.0
     # calculate tide map
@@ -166,9 +179,9 @@ def test_definition_file(MODEL):
 # parametrize over reading with dask
 @pytest.mark.parametrize("CHUNKS", [None, "auto"])
 # PURPOSE: test extend function
-def test_extend_array(directory, CHUNKS):
+def test_extend_array(got47_model, CHUNKS):
     # model parameters for GOT4.7
-    m = pyTMD.io.model(directory).from_database('GOT4.7')
+    m = copy.deepcopy(got47_model)
     # reduce to constituents for test
     m.reduce_constituents(['m2'])
     # open dataset
@@ -1,5 +1,5 @@
 """
-test_solid_earth.py (05/2026)
+test_solid_earth.py (10/2026)
 Tests the steps for calculating the solid earth tides
 
 PYTHON DEPENDENCIES:
@@ -10,6 +10,13 @@ PYTHON DEPENDENCIES:
         https://pypi.org/project/timescale/
 
 UPDATE HISTORY:
+    Updated 10/2026: share IERS station and ephemerides datasets as fixtures
+        parametrize IERS correction tests over functions and outputs
+        test frequency dependence corrections directly with station fixture
+        share ICESat-2 coordinates and tides as a module-scoped fixture
+        convert ICESat-2 times to a timescale object once per module
+        compare all displacement components in a single assertion
+        use numpy testing assertions for ICESat-2 comparisons
     Updated 05/2026: add unit tests for body tides using HW1995 and W1990
     Updated 03/2026: refactored IERS corrections to reduce redundancy
     Updated 09/2025: check body tides for both tide-free and mean-tide
@@ -33,177 +40,129 @@ import timescale.time
 filename = inspect.getframeinfo(inspect.currentframe()).filename
 filepath = pathlib.Path(filename).absolute().parent
 
-def test_out_of_phase_diurnal():
-    """Test out-of-phase diurnal corrections with IERS outputs
-    """
-    # station locations and planetary ephemerides
-    XYZ = xr.Dataset(data_vars=dict(
+@pytest.fixture(scope="module")
+def iers_xyz():
+    """ Returns station location for IERS case 1 """
+    return xr.Dataset(data_vars=dict(
         X=4075578.385, Y=931852.890, Z=4801570.154
     ))
-    SXYZ = xr.Dataset(data_vars=dict(
-        X=137859926952.015, Y=54228127881.4350, Z=23509422341.6960
-    ))
-    LXYZ = xr.Dataset(data_vars=dict(
-        X=-179996231.920342, Y=-312468450.131567, Z=-169288918.592160
-    ))
-    # factors for Sun and Moon
-    F2_solar = 0.163271964478954
-    F2_lunar = 0.321989090026845
-    # expected results
-    dx_expected = -0.2836337012840008001e-3
-    dy_expected = 0.1125342324347507444e-3
-    dz_expected = -0.2471186224343683169e-3
-    # calculate displacements
-    dXYZ = pyTMD.predict._out_of_phase_diurnal(XYZ, SXYZ, F2_solar)
-    dXYZ += pyTMD.predict._out_of_phase_diurnal(XYZ, LXYZ, F2_lunar)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
 
-def test_out_of_phase_semidiurnal():
-    """Test out-of-phase semidiurnal corrections with IERS outputs
-    """
-    # station locations and planetary ephemerides
-    XYZ = xr.Dataset(data_vars=dict(
-        X=4075578.385, Y=931852.890, Z=4801570.154
-    ))
-    SXYZ = xr.Dataset(data_vars=dict(
+@pytest.fixture(scope="module")
+def iers_sxyz():
+    """ Returns solar ephemerides for IERS case 1 """
+    return xr.Dataset(data_vars=dict(
         X=137859926952.015, Y=54228127881.4350, Z=23509422341.6960
     ))
-    LXYZ = xr.Dataset(data_vars=dict(
-        X=-179996231.920342, Y=-312468450.131567, Z=-169288918.592160
-    ))
-    # factors for Sun and Moon
-    F2_solar = 0.163271964478954
-    F2_lunar = 0.321989090026845
-    # expected results
-    dx_expected = -0.2801334805106874015e-3
-    dy_expected = 0.2939522229284325029e-4
-    dz_expected = -0.6051677912316721561e-4
-    # calculate displacements
-    dXYZ = pyTMD.predict._out_of_phase_semidiurnal(XYZ, SXYZ, F2_solar)
-    dXYZ += pyTMD.predict._out_of_phase_semidiurnal(XYZ, LXYZ, F2_lunar)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
 
-def test_latitude_dependence():
-    """Test latitude dependence corrections with IERS outputs
-    """
-    # station locations and planetary ephemerides
-    XYZ = xr.Dataset(data_vars=dict(
-        X=4075578.385, Y=931852.890, Z=4801570.154
-    ))
-    SXYZ = xr.Dataset(data_vars=dict(
-        X=137859926952.015, Y=54228127881.4350, Z=23509422341.6960
-    ))
-    LXYZ = xr.Dataset(data_vars=dict(
+@pytest.fixture(scope="module")
+def iers_lxyz():
+    """ Returns lunar ephemerides for IERS case 1 """
+    return xr.Dataset(data_vars=dict(
         X=-179996231.920342, Y=-312468450.131567, Z=-169288918.592160
     ))
-    # factors for Sun and Moon
-    F2_solar = 0.163271964478954
-    F2_lunar = 0.321989090026845
-    # expected results
-    dx_expected = 0.2367189532359759044e-3
-    dy_expected = 0.5181609907284959182e-3
-    dz_expected = -0.3014881422940427977e-3
+
+# factors for Sun and Moon
+_F2_solar = 0.163271964478954
+_F2_lunar = 0.321989090026845
+# Modified Julian Day for IERS frequency dependence outputs
+_MJD = 55414.0
+
+def _out_of_phase_diurnal(XYZ, SXYZ, LXYZ):
+    dXYZ = pyTMD.predict._out_of_phase_diurnal(XYZ, SXYZ, _F2_solar)
+    dXYZ += pyTMD.predict._out_of_phase_diurnal(XYZ, LXYZ, _F2_lunar)
+    return dXYZ
+
+def _out_of_phase_semidiurnal(XYZ, SXYZ, LXYZ):
+    dXYZ = pyTMD.predict._out_of_phase_semidiurnal(XYZ, SXYZ, _F2_solar)
+    dXYZ += pyTMD.predict._out_of_phase_semidiurnal(XYZ, LXYZ, _F2_lunar)
+    return dXYZ
+
+def _latitude_dependence_bands(XYZ, SXYZ, LXYZ):
     # calculate displacements with individual functions
-    dXYZ = pyTMD.predict._latitude_dependence_diurnal(XYZ, SXYZ, F2_solar)
-    dXYZ += pyTMD.predict._latitude_dependence_diurnal(XYZ, LXYZ, F2_lunar)
-    dXYZ += pyTMD.predict._latitude_dependence_semidiurnal(XYZ, SXYZ, F2_solar)
-    dXYZ += pyTMD.predict._latitude_dependence_semidiurnal(XYZ, LXYZ, F2_lunar)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
+    dXYZ = pyTMD.predict._latitude_dependence_diurnal(XYZ, SXYZ, _F2_solar)
+    dXYZ += pyTMD.predict._latitude_dependence_diurnal(XYZ, LXYZ, _F2_lunar)
+    dXYZ += pyTMD.predict._latitude_dependence_semidiurnal(XYZ, SXYZ,
+        _F2_solar)
+    dXYZ += pyTMD.predict._latitude_dependence_semidiurnal(XYZ, LXYZ,
+        _F2_lunar)
+    return dXYZ
+
+def _latitude_dependence(XYZ, SXYZ, LXYZ):
+    return pyTMD.predict._latitude_dependence(XYZ, SXYZ, LXYZ,
+        _F2_solar, _F2_lunar)
+
+# IERS correction functions and expected displacements
+_iers_cases = [
+    (_out_of_phase_diurnal, (-0.2836337012840008001e-3,
+        0.1125342324347507444e-3, -0.2471186224343683169e-3)),
+    (_out_of_phase_semidiurnal, (-0.2801334805106874015e-3,
+        0.2939522229284325029e-4, -0.6051677912316721561e-4)),
+    (_latitude_dependence_bands, (0.2367189532359759044e-3,
+        0.5181609907284959182e-3, -0.3014881422940427977e-3)),
+    (_latitude_dependence, (0.2367189532359759044e-3,
+        0.5181609907284959182e-3, -0.3014881422940427977e-3)),
+]
+
+# parametrize over IERS correction functions
+@pytest.mark.parametrize("func, expected", _iers_cases,
+    ids=[func.__name__.lstrip('_') for func, _ in _iers_cases])
+def test_iers_corrections(func, expected, iers_xyz, iers_sxyz, iers_lxyz):
+    """Test solid earth tide corrections with IERS outputs
+    """
     # calculate displacements
-    dXYZ = pyTMD.predict._latitude_dependence(XYZ, SXYZ, LXYZ,
-        F2_solar, F2_lunar)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
+    dXYZ = func(iers_xyz, iers_sxyz, iers_lxyz)
+    # assert matching for all components
+    assert np.allclose(expected, np.ravel(dXYZ[['X','Y','Z']].to_dataarray()))
 
-def test_frequency_dependence_diurnal():
+def test_frequency_dependence_diurnal(iers_xyz):
     """Test diurnal band frequency dependence corrections
     with IERS outputs
     """
-    # station locations
-    XYZ = xr.Dataset(data_vars=dict(
-        X=4075578.385, Y=931852.890, Z=4801570.154
-    ))
-    MJD = 55414.0
-    # convert from MJD to centuries relative to 2000-01-01T12:00:00
-    T = (MJD - 51544.5)/36525.0
-    T_expected = 0.1059411362080767
-    assert np.isclose(T_expected, T)
-    T_test = (MJD - pyTMD.astro._mjd_j2000)/pyTMD.astro._century
-    assert np.isclose(T_expected, T_test)
     # expected results
-    dx_expected = 0.4193085327321284701e-2
-    dy_expected = 0.1456681241014607395e-2
-    dz_expected = 0.5123366597450316508e-2
+    expected = np.array([0.4193085327321284701e-2,
+        0.1456681241014607395e-2, 0.5123366597450316508e-2])
     # calculate displacements
-    dXYZ = pyTMD.predict._frequency_dependence_diurnal(XYZ, MJD)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
+    dXYZ = pyTMD.predict._frequency_dependence_diurnal(iers_xyz, _MJD)
+    # assert matching for all components
+    assert np.allclose(expected, np.ravel(dXYZ[['X','Y','Z']].to_dataarray()))
 
-def test_frequency_dependence_long_period():
+def test_frequency_dependence_long_period(iers_xyz):
     """Test long period band frequency dependence corrections
     with IERS outputs
     """
-    # station locations
-    XYZ = xr.Dataset(data_vars=dict(
-        X=4075578.385, Y=931852.890, Z=4801570.154
-    ))
-    MJD = 55414.0
+    # expected results
+    expected = np.array([-0.9780962849562107762e-4,
+        -0.2236349699932734273e-4, 0.3561945821351565926e-3])
+    # calculate displacements
+    dXYZ = pyTMD.predict._frequency_dependence_long_period(iers_xyz, _MJD)
+    # assert matching for all components
+    assert np.allclose(expected, np.ravel(dXYZ[['X','Y','Z']].to_dataarray()))
+
+def test_julian_centuries():
+    """Test conversion from MJD to centuries for IERS outputs
+    """
     # convert from MJD to centuries relative to 2000-01-01T12:00:00
-    T = (MJD - 51544.5)/36525.0
+    T = (_MJD - 51544.5)/36525.0
     T_expected = 0.1059411362080767
     assert np.isclose(T_expected, T)
-    T_test = (MJD - pyTMD.astro._mjd_j2000)/pyTMD.astro._century
+    T_test = (_MJD - pyTMD.astro._mjd_j2000)/pyTMD.astro._century
     assert np.isclose(T_expected, T_test)
-    # expected results
-    dx_expected = -0.9780962849562107762e-4
-    dy_expected = -0.2236349699932734273e-4
-    dz_expected = 0.3561945821351565926e-3
-    # calculate displacements
-    dXYZ = pyTMD.predict._frequency_dependence_long_period(XYZ, MJD)
-    # assert matching
-    assert np.isclose(dx_expected, dXYZ['X'])
-    assert np.isclose(dy_expected, dXYZ['Y'])
-    assert np.isclose(dz_expected, dXYZ['Z'])
 
-def test_solid_earth_tide():
+def test_solid_earth_tide(iers_xyz, iers_sxyz, iers_lxyz):
     """Test solid earth tides with IERS outputs
     """
     # case 1 from IERS
-    XYZ = xr.Dataset(data_vars=dict(
-        X=4075578.385, Y=931852.890, Z=4801570.154
-    ))
-    SXYZ = xr.Dataset(data_vars=dict(
-        X=137859926952.015, Y=54228127881.4350, Z=23509422341.6960
-    ))
-    LXYZ = xr.Dataset(data_vars=dict(
-        X=-179996231.920342, Y=-312468450.131567, Z=-169288918.592160
-    ))
+    XYZ, SXYZ, LXYZ = iers_xyz, iers_sxyz, iers_lxyz
     tide_time = timescale.time.convert_calendar_dates(2009, 4, 13,
         hour=0, minute=0, second=0,
         epoch=timescale.time._tide_epoch)
     # expected results
-    dx_expected = 0.7700420357108125891e-01
-    dy_expected = 0.6304056321824967613e-01
-    dz_expected = 0.5516568152597246810e-01
+    expected = np.array([0.7700420357108125891e-01,
+        0.6304056321824967613e-01, 0.5516568152597246810e-01])
     # calculate solid earth tides
     dxt = pyTMD.predict.solid_earth_tide(tide_time, XYZ, SXYZ, LXYZ)
-    # assert matching
-    assert np.isclose(dx_expected, dxt['X'])
-    assert np.isclose(dy_expected, dxt['Y'])
-    assert np.isclose(dz_expected, dxt['Z'])
+    # assert matching for all components
+    assert np.allclose(expected, np.ravel(dxt[['X','Y','Z']].to_dataarray()))
     # case 2 from IERS
     XYZ = xr.Dataset(data_vars=dict(
         X=1112200.5696, Y=-4842957.8511, Z=3985345.9122
@@ -218,21 +177,17 @@ def test_solid_earth_tide():
         hour=0, minute=0, second=0,
         epoch=timescale.time._tide_epoch)
     # expected results
-    dx_expected = 0.00509570869172363845
-    dy_expected = 0.0828663025983528700
-    dz_expected = -0.0636634925404189617
+    expected = np.array([0.00509570869172363845,
+        0.0828663025983528700, -0.0636634925404189617])
     # calculate solid earth tides
     dxt = pyTMD.predict.solid_earth_tide(tide_time, XYZ, SXYZ, LXYZ)
-    # assert matching
-    assert np.isclose(dx_expected, dxt['X'])
-    assert np.isclose(dy_expected, dxt['Y'])
-    assert np.isclose(dz_expected, dxt['Z'])
+    # assert matching for all components
+    assert np.allclose(expected, np.ravel(dxt[['X','Y','Z']].to_dataarray()))
 
-# parametrize over approximate methods
-@pytest.mark.parametrize("method", ['Kubo', 'Meeus', 'Montenbruck', 'JPL'])
-def test_solid_earth_radial(method):
-    """Test radial solid tides with predictions from ICESat-2
-    """
+# ICESat-2 times, coordinates and solid earth tides
+@pytest.fixture(scope="module")
+def icesat2_tides():
+    """ Returns ICESat-2 coordinates and solid earth tides """
     times = np.array(['2018-10-14 00:21:48','2018-10-14 00:21:48',
         '2018-10-14 00:21:48','2018-10-14 00:21:48',
         '2022-07-23 13:53:08','2022-07-23 13:53:08',
@@ -251,6 +206,24 @@ def test_solid_earth_radial(method):
     tide_earth_free2mean = np.array([-0.09726650,-0.09726728,
         -0.09726749,-0.09726755,-0.11400376,-0.11400391,
         -0.11400412,-0.11400434])
+    # squared sine of latitude for permanent tide offsets
+    sinlat2 = np.sin(np.radians(latitudes))**2
+    return (times, longitudes, latitudes, sinlat2,
+        tide_earth, tide_earth_free2mean)
+
+@pytest.fixture(scope="module")
+def ts_icesat2(icesat2_tides):
+    """ Returns timescale object for ICESat-2 times """
+    times = icesat2_tides[0]
+    return timescale.from_datetime(times)
+
+# parametrize over approximate methods
+@pytest.mark.parametrize("method", ['Kubo', 'Meeus', 'Montenbruck', 'JPL'])
+def test_solid_earth_radial(icesat2_tides, method):
+    """Test radial solid tides with predictions from ICESat-2
+    """
+    times, longitudes, latitudes, sinlat2, tide_earth, \
+        tide_earth_free2mean = icesat2_tides
     # check permanent tide offsets (additive correction in ICESat-2)
     # expected results (mean-tide)
     tide_expected = tide_earth - tide_earth_free2mean
@@ -262,45 +235,30 @@ def test_solid_earth_radial(method):
         crs=4326, type='trajectory', standard='datetime', ellipsoid='WGS84',
         tide_system='mean_tide', ephemerides=method)
     # as using estimated ephemerides, assert within 1/2 mm
-    assert np.allclose(tide_earth, tide_free, atol=5e-4)
+    np.testing.assert_allclose(tide_free, tide_earth, atol=5e-4)
     # sign differences with ATLAS product: correction is subtractive
-    predicted = -0.06029 + 0.180873*np.sin(latitudes*np.pi/180.0)**2
-    assert np.allclose(tide_expected, tide_mean, atol=5e-4)
-    assert np.allclose(-tide_earth_free2mean, predicted, atol=5e-4)
-    assert np.allclose(tide_mean-tide_free, predicted, atol=5e-4)
+    predicted = -0.06029 + 0.180873*sinlat2
+    np.testing.assert_allclose(tide_mean, tide_expected, atol=5e-4)
+    np.testing.assert_allclose(predicted, -tide_earth_free2mean, atol=5e-4)
+    np.testing.assert_allclose(predicted, tide_mean-tide_free, atol=5e-4)
 
 # parameterize method
 @pytest.mark.parametrize("catalog", ['CTE1973','T1987'])
 @pytest.mark.parametrize("method", ['ASTRO5','IERS'])
-def test_body_tides(catalog, method):
+def test_body_tides(icesat2_tides, ts_icesat2, catalog, method):
     """Test simplified solid tides using predictions from ICESat-2
     """
-    times = np.array(['2018-10-14 00:21:48','2018-10-14 00:21:48',
-        '2018-10-14 00:21:48','2018-10-14 00:21:48',
-        '2022-07-23 13:53:08','2022-07-23 13:53:08',
-        '2022-07-23 13:53:08','2022-07-23 13:53:08'], dtype=np.datetime64)
-    longitudes = xr.DataArray([-136.79534534,-136.79545175,
-        -136.79548250,-136.79549453,-71.77356870,-71.77374742,
-        -71.77392700,-71.77410705], dims=('time'))
-    latitudes = xr.DataArray([68.95910366,68.95941755,
-        68.95950895,68.95954490,-79.00591611,-79.00609103,
-        -79.00626593,-79.00644081], dims=('time'))
+    times, x, y, _, tide_earth, tide_earth_free2mean = icesat2_tides
+    longitudes = xr.DataArray(x, dims=('time'))
+    latitudes = xr.DataArray(y, dims=('time'))
     # dataset with spatial coordinates
     ds = xr.Dataset(coords={'x':longitudes,'y':latitudes})
-    # expected results (tide-free)
-    tide_earth = np.array([-0.14320290,-0.14320324,
-        -0.14320339,-0.14320345,-0.11887791,-0.11887763,
-        -0.11887724,-0.11887683])
-    # tide_mean = tide_free + tide_earth_free2mean
-    tide_earth_free2mean = np.array([-0.09726650,-0.09726728,
-        -0.09726749,-0.09726755,-0.11400376,-0.11400391,
-        -0.11400412,-0.11400434])
     # check permanent tide offsets (additive correction in ICESat-2)
     # expected results (mean-tide)
     tide_expected = tide_earth - tide_earth_free2mean
     # predict tides using simplified body tides
     # using tide potentials from Cartwright and Tayler (1971)
-    ts = timescale.from_datetime(times)
+    ts = ts_icesat2
     tide_free = pyTMD.predict.body_tide(ts.tide, ds,
         deltat=ts.tt_ut1, tide_system='tide_free', method=method,
         catalog=catalog)
@@ -308,8 +266,8 @@ def test_body_tides(catalog, method):
         deltat=ts.tt_ut1, tide_system='mean_tide', method=method,
         catalog=catalog)
     # since we are using simplified body tides: assert within 2 mm
-    assert np.allclose(tide_earth, tide_free['R'], atol=2e-3)
-    assert np.allclose(tide_expected, tide_mean['R'], atol=2e-3)
+    np.testing.assert_allclose(tide_free['R'], tide_earth, atol=2e-3)
+    np.testing.assert_allclose(tide_mean['R'], tide_expected, atol=2e-3)
     # predict radial solid earth tides
     tide_free = pyTMD.compute.SET_displacements(longitudes, latitudes, times,
         crs=4326, type='trajectory', standard='datetime', tide_system='tide_free',
@@ -318,8 +276,8 @@ def test_body_tides(catalog, method):
         crs=4326, type='trajectory', standard='datetime', tide_system='mean_tide',
         method='catalog', ephemerides=method, catalog=catalog)
     # since we are using simplified body tides: assert within 2 mm
-    assert np.allclose(tide_earth, tide_free, atol=2e-3)
-    assert np.allclose(tide_expected, tide_mean, atol=2e-3)
+    np.testing.assert_allclose(tide_free, tide_earth, atol=2e-3)
+    np.testing.assert_allclose(tide_mean, tide_expected, atol=2e-3)
 
 def test_body_tides_HW1995():
     """
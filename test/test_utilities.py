@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 """
-test_utilities.py (12/2020)
+test_utilities.py (10/2026)
 Verify file utility functions
 """
 
-import io
+import sys
 import gzip
 import pytest
 import pathlib
@@ -30,7 +30,7 @@ def test_hash():
     assert TEST == "md5:9c66edc2d0fbf627e7ae1cb923a9f0e5"
     # get hash of uncompressed file
     with gzip.open(ocean_pole_tide_file) as fid:
-        TEST = pyTMD.utilities.get_hash(io.BytesIO(fid.read()))
+        TEST = pyTMD.utilities.get_hash(fid)
         assert TEST == "cea08f83d613ed8e1a81f3b3a9453721"
 
 
@@ -53,3 +53,31 @@ def test_valid_url():
     for PATH in PATHS:
         path = pyTMD.utilities.Path(PATH).resolve()
         assert not pyTMD.utilities.is_valid_url(path)
+
+
+def test_detect_engine(tmp_path):
+    """Tests detecting backend engines for netCDF4 and text files"""
+    h5 = pytest.importorskip("h5py")
+    netcdf_file = tmp_path.joinpath("model.nc")
+    with h5.File(netcdf_file, "w") as fid:
+        fid.create_dataset("amplitude", data=[1.0, 2.0])
+    text_file = tmp_path.joinpath("model.txt")
+    text_file.write_text("amplitude phase\n")
+    # verify backend engine for each file
+    assert pyTMD.utilities.detect_engine(netcdf_file) == "h5netcdf"
+    assert pyTMD.utilities.detect_engine(text_file) is None
+    assert pyTMD.utilities.detect_engine(tmp_path.joinpath("none.nc")) is None
+
+
+def test_lazy_import(monkeypatch):
+    """Tests deferring module imports until first attribute access"""
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    colorsys = pyTMD.utilities.import_dependency("colorsys", lazy=True)
+    # module is executed on first attribute access
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    # missing modules are not raised unless requested
+    pyTMD.utilities.import_dependency("pyTMD_missing", lazy=True)
+    with pytest.raises(ImportError):
+        pyTMD.utilities.import_dependency(
+            "pyTMD_missing", lazy=True, raise_exception=True
+        )